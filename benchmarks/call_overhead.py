@@ -0,0 +1,71 @@
+"""
+Measure the per-call overhead the SDK adds on top of its transport.
+
+    python benchmarks/call_overhead.py [--calls 20000]
+
+Calls are answered at once by a transport returning a prebuilt response,
+so the figures are the SDK's own cost per call: the dispatcher alone, the
+dispatcher with call logging, and, for comparison, the per-method ava_log
+wrapper that decorate_all_methods used to put around every method. The
+wrapper is timed around a bare transport call: client methods log through
+the dispatcher now, so wrapping one would log every call twice.
+"""
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from avalara import AvataxClient  # noqa: E402
+from avalara.ava_logger import ava_log  # noqa: E402
+from avalara.transport import Transport, build_response  # noqa: E402
+
+
+class InstantTransport(Transport):
+    """Answer every call with the same response, without encoding or sending anything."""
+
+    def __init__(self):
+        request = self.prepare('GET', 'https://sandbox-rest.avatax.com/api/v2/utilities/ping')
+        self.response = build_response(request, 200, b'{}', {'x-correlation-id': 'benchmark'})
+
+    def send(self, method, url, params=None, json=None, headers=None, auth=None, timeout=None):
+        return self.response
+
+
+def scenarios(client):
+    """Return the callables to time, by name."""
+    @ava_log
+    def ping_wrapped(client):
+        return client.transport.send('GET', client.base_url)
+
+    def dispatch_only():
+        call = client._new_call('GET', '/api/v2/utilities/ping', None, None, '', None, 'ping')
+        return client._dispatch(call)
+
+    return {
+        'transport.send': lambda: client.transport.send('GET', client.base_url),
+        'dispatcher, no logging': dispatch_only,
+        'client.ping()': client.ping,
+        'ava_log wrapper + send': lambda: ping_wrapped(client),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--calls', type=int, default=20000)
+    options = parser.parse_args()
+    client = AvataxClient('benchmark', '1.0', 'localhost', 'sandbox', transport=InstantTransport())
+    baseline = None
+    for name, function in scenarios(client).items():
+        function()
+        seconds = min(timeit.repeat(function, number=options.calls, repeat=5)) / options.calls
+        if baseline is None:
+            baseline = seconds
+        print('{:<26} {:8.2f} us/call   +{:8.2f} us over the transport'.format(
+            name, seconds * 1e6, (seconds - baseline) * 1e6
+        ))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""
+Measure the cold-start cost of the SDK: importing avalara, building a client
+and making the first call, each in a fresh interpreter.
+
+    python benchmarks/import_time.py [--runs 20] [--max-import-ms 60]
+
+With --max-import-ms the script exits with status 1 when the median time
+spent importing avalara's own modules (requests and the standard library
+excluded) is over the budget, so it can guard the cold start in CI.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+
+SCENARIOS = {
+    'import': 'import avalara',
+    'first call': (
+        'import avalara\n'
+        'from avalara.transport import MockTransport\n'
+        'avalara.AvataxClient("app", transport=MockTransport()).create_transaction({})\n'
+    ),
+    'all modules': (
+        'import avalara\n'
+        'from avalara import client_methods\n'
+        'client_methods.load_modules()\n'
+    ),
+}
+
+
+def import_times(code):
+    """Run `code` in a fresh interpreter and return (avalara modules ms, total ms) spent importing."""
+    stderr = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=SRC, capture_output=True, text=True, check=True
+    ).stderr
+    own = total = 0
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, _, name = line[len('import time:'):].split('|')
+        total += int(self_us)
+        if name.strip().startswith('avalara'):
+            own += int(self_us)
+    return own / 1000.0, total / 1000.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--runs', type=int, default=20)
+    parser.add_argument('--max-import-ms', type=float, default=None)
+    options = parser.parse_args()
+    results = {}
+    for name, code in SCENARIOS.items():
+        runs = [import_times(code) for _ in range(options.runs)]
+        own = statistics.median(r[0] for r in runs)
+        total = statistics.median(r[1] for r in runs)
+        results[name] = own
+        print('{:<12} avalara modules {:7.2f} ms   all imports {:7.2f} ms'.format(name, own, total))
+    if options.max_import_ms is not None and results['import'] > options.max_import_ms:
+        print('import avalara takes {:.2f} ms, over the {:.2f} ms budget'.format(
+            results['import'], options.max_import_ms
+        ))
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
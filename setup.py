@@ -12,7 +12,8 @@ setup(
     version='26.7.3',
     url='https://github.com/avadev/AvaTax-REST-V2-Python-SDK',
     package_dir={'': 'src'},
-    packages=['avalara'],
+    packages=['avalara', 'avalara.endpoints'],
+    package_data={'avalara': ['*.pyi']},
     author='Han Bao, Adrienne Karnoski, Robert Bronson, Philip Werner, Genevieve Conty',
     author_email='han.bao@avalara.com',
     description='Avalara Tax Python SDK.',
@@ -21,10 +22,19 @@ setup(
     classifiers=[
         'Development Status :: 5 - Production/Stable',
         'Intended Audience :: Developers',
-        'Programming Language :: Python :: 2.7',
-        'Programming Language :: Python :: 3.6'
+        'Programming Language :: Python :: 3',
+        'Programming Language :: Python :: 3 :: Only',
+        'Programming Language :: Python :: 3.7',
+        'Programming Language :: Python :: 3.8',
+        'Programming Language :: Python :: 3.9',
+        'Programming Language :: Python :: 3.10',
+        'Programming Language :: Python :: 3.11',
+        'Programming Language :: Python :: 3.12'
     ],
+    python_requires='>=3.7',
     install_requires=['requests'],
     extras_require={
-        "test": ['pytest', 'pytest-cov', 'tox']
+        "test": ['pytest', 'pytest-cov', 'tox'],
+        "httpx": ['httpx'],
+        "opentelemetry": ['opentelemetry-api']
     })
@@ -1 +1,11 @@
-from .client import AvataxClient
\ No newline at end of file
+from .client import AvataxClient
+
+__all__ = ['AvataxClient', 'AsyncAvataxClient']
+
+
+def __getattr__(name):
+    # the asyncio client, and asyncio itself, are only imported when first used
+    if name == 'AsyncAvataxClient':
+        from .async_client import AsyncAvataxClient
+        return AsyncAvataxClient
+    raise AttributeError("module '{}' has no attribute '{}'".format(__name__, name))
@@ -0,0 +1,162 @@
+"""
+AvaTax Software Development Kit for Python.
+
+   Copyright 2019 Avalara, Inc.
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+
+Address resolution cache: resolve_address and resolve_address_post
+answered from a ResponseCache keyed by the canonical form of the address.
+"""
+import json
+import re
+
+from .cache import ResponseCache
+
+
+# client methods resolving an address, their responses are stored under the first one
+ADDRESS_OPERATIONS = ('resolve_address', 'resolve_address_post')
+
+# USPS street suffix, unit and direction abbreviations applied to the address lines
+ABBREVIATIONS = {
+    'ALLEY': 'ALY', 'APARTMENT': 'APT', 'AVENUE': 'AVE', 'BOULEVARD': 'BLVD', 'BUILDING': 'BLDG',
+    'CIRCLE': 'CIR', 'COURT': 'CT', 'DEPARTMENT': 'DEPT', 'DRIVE': 'DR', 'EXPRESSWAY': 'EXPY',
+    'FLOOR': 'FL', 'FREEWAY': 'FWY', 'HIGHWAY': 'HWY', 'LANE': 'LN', 'PARKWAY': 'PKWY', 'PLACE': 'PL',
+    'ROAD': 'RD', 'ROOM': 'RM', 'SQUARE': 'SQ', 'STREET': 'ST', 'SUITE': 'STE', 'TERRACE': 'TER',
+    'TRAIL': 'TRL', 'NORTH': 'N', 'SOUTH': 'S', 'EAST': 'E', 'WEST': 'W', 'NORTHEAST': 'NE',
+    'NORTHWEST': 'NW', 'SOUTHEAST': 'SE', 'SOUTHWEST': 'SW',
+}
+
+# country names and ISO alpha-3 codes turned into the ISO alpha-2 code AvaTax answers with
+COUNTRY_ALIASES = {
+    'USA': 'US', 'U S': 'US', 'U S A': 'US', 'UNITED STATES': 'US', 'UNITED STATES OF AMERICA': 'US',
+    'CAN': 'CA', 'CANADA': 'CA', 'MEX': 'MX', 'MEXICO': 'MX', 'GBR': 'GB', 'UK': 'GB',
+    'UNITED KINGDOM': 'GB', 'GREAT BRITAIN': 'GB',
+}
+
+# names of US states, districts and territories and of Canadian provinces and territories,
+# turned into their postal codes; the names of the two countries do not collide
+REGION_ALIASES = {
+    'ALABAMA': 'AL', 'ALASKA': 'AK', 'ARIZONA': 'AZ', 'ARKANSAS': 'AR', 'CALIFORNIA': 'CA', 'COLORADO': 'CO',
+    'CONNECTICUT': 'CT', 'DELAWARE': 'DE', 'DISTRICT OF COLUMBIA': 'DC', 'FLORIDA': 'FL', 'GEORGIA': 'GA',
+    'HAWAII': 'HI', 'IDAHO': 'ID', 'ILLINOIS': 'IL', 'INDIANA': 'IN', 'IOWA': 'IA', 'KANSAS': 'KS',
+    'KENTUCKY': 'KY', 'LOUISIANA': 'LA', 'MAINE': 'ME', 'MARYLAND': 'MD', 'MASSACHUSETTS': 'MA',
+    'MICHIGAN': 'MI', 'MINNESOTA': 'MN', 'MISSISSIPPI': 'MS', 'MISSOURI': 'MO', 'MONTANA': 'MT',
+    'NEBRASKA': 'NE', 'NEVADA': 'NV', 'NEW HAMPSHIRE': 'NH', 'NEW JERSEY': 'NJ', 'NEW MEXICO': 'NM',
+    'NEW YORK': 'NY', 'NORTH CAROLINA': 'NC', 'NORTH DAKOTA': 'ND', 'OHIO': 'OH', 'OKLAHOMA': 'OK',
+    'OREGON': 'OR', 'PENNSYLVANIA': 'PA', 'RHODE ISLAND': 'RI', 'SOUTH CAROLINA': 'SC', 'SOUTH DAKOTA': 'SD',
+    'TENNESSEE': 'TN', 'TEXAS': 'TX', 'UTAH': 'UT', 'VERMONT': 'VT', 'VIRGINIA': 'VA', 'WASHINGTON': 'WA',
+    'WEST VIRGINIA': 'WV', 'WISCONSIN': 'WI', 'WYOMING': 'WY', 'AMERICAN SAMOA': 'AS', 'GUAM': 'GU',
+    'NORTHERN MARIANA ISLANDS': 'MP', 'PUERTO RICO': 'PR', 'VIRGIN ISLANDS': 'VI', 'US VIRGIN ISLANDS': 'VI',
+    'ALBERTA': 'AB', 'BRITISH COLUMBIA': 'BC', 'MANITOBA': 'MB', 'NEW BRUNSWICK': 'NB',
+    'NEWFOUNDLAND AND LABRADOR': 'NL', 'NEWFOUNDLAND': 'NL', 'NOVA SCOTIA': 'NS', 'NORTHWEST TERRITORIES': 'NT',
+    'NUNAVUT': 'NU', 'ONTARIO': 'ON', 'PRINCE EDWARD ISLAND': 'PE', 'QUEBEC': 'QC', 'QUÉBEC': 'QC',
+    'SASKATCHEWAN': 'SK', 'YUKON': 'YT',
+}
+
+# countries whose region names are in REGION_ALIASES, '' when the address has no country
+_REGION_ALIAS_COUNTRIES = ('', 'US', 'CA')
+
+_PUNCTUATION = re.compile(r'[.,]')
+_SPACES = re.compile(r'\s+')
+
+
+def _text(value):
+    """Uppercase a value, drop periods and commas and collapse whitespace."""
+    if value is None:
+        return ''
+    return _SPACES.sub(' ', _PUNCTUATION.sub(' ', str(value).upper())).strip()
+
+
+def _line(value):
+    return ' '.join(ABBREVIATIONS.get(word, word) for word in _text(value).split(' '))
+
+
+def canonical_address(fields):
+    """
+    Return the canonical form of an address, equal for the spellings of the same address.
+
+    Case, whitespace, periods and commas are ignored, street suffixes, units
+    and directions are abbreviated in the lines, spaces are dropped from the
+    postal code and common country names are turned into their ISO code.
+    US and Canadian region names are turned into their postal codes
+    ("Washington" and "WA" match); the regions of other countries are only
+    uppercased. Field names are matched case insensitively, like AvaTax
+    does, and textCase, which changes the response, is kept.
+
+    :param  dict  fields:  Query parameters of resolve_address or model of resolve_address_post
+    :return: string
+    """
+    values = dict((str(name).lower(), value) for name, value in (fields or {}).items())
+    country = _text(values.get('country'))
+    country = COUNTRY_ALIASES.get(country, country)
+    region = _text(values.get('region'))
+    if country in _REGION_ALIAS_COUNTRIES:
+        region = REGION_ALIASES.get(region, region)
+    return json.dumps([
+        _line(values.get('line1')),
+        _line(values.get('line2')),
+        _line(values.get('line3')),
+        _text(values.get('city')),
+        region,
+        _text(values.get('postalcode')).replace(' ', ''),
+        country,
+        _text(values.get('textcase')),
+        _text(values.get('latitude')),
+        _text(values.get('longitude')),
+    ])
+
+
+class AddressCache(ResponseCache):
+    """
+    Cache the successful address resolutions of resolve_address and resolve_address_post.
+
+    Both methods share the responses of an address, keyed by its canonical
+    form (see canonical_address): a repeat customer's address is resolved
+    from the cache whatever its spelling. The response is the one fetched
+    for the first spelling seen. Pass a SqliteStore as `store` to keep the
+    resolutions across restarts and share them between processes.
+
+        AddressCache(ttl=30 * 86400, max_entries=50000).install(client)
+    """
+
+    def __init__(self, ttl=7 * 86400, store=None, max_entries=10000, max_bytes=32 * 1024 * 1024, **kwargs):
+        """
+        Initialize the cache, see ResponseCache for the other parameters.
+
+        :param  float  ttl:  Seconds a resolution is served from the cache
+        :param  store:  Where resolutions are kept, a MemoryStore of max_entries and max_bytes by default
+        :param  int  max_entries:  Maximum number of resolutions held by the default store
+        :param  int  max_bytes:  Maximum total size of the resolutions held by the default store
+        """
+        super(AddressCache, self).__init__(
+            ttl=ttl, operations=ADDRESS_OPERATIONS, store=store, max_entries=max_entries, max_bytes=max_bytes,
+            **kwargs
+        )
+
+    def is_cacheable(self, call):
+        return call.operation in self.operations and isinstance(self._fields(call), dict)
+
+    def key(self, call):
+        fields = self._fields(call)
+        # the environment is kept in the key, for stores shared by sandbox and production clients
+        base_url = call.url[:len(call.url) - len(call.path)]
+        return '{} {} {}'.format(ADDRESS_OPERATIONS[0], base_url, canonical_address(fields))
+
+    def invalidate(self, operation=None):
+        """Forget every cached resolution, whichever operation is given; other responses of the store are kept."""
+        super(AddressCache, self).invalidate(ADDRESS_OPERATIONS[0])
+
+    @staticmethod
+    def _fields(call):
+        return call.json if call.operation == 'resolve_address_post' else (call.params or {})
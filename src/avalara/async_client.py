@@ -0,0 +1,168 @@
+"""
+AvaTax Software Development Kit for Python.
+
+   Copyright 2019 Avalara, Inc.
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+
+@copyright  2019 Avalara, Inc.
+@license    https://www.apache.org/licenses/LICENSE-2.0
+@link       https://github.com/avadev/AvaTax-REST-V2-Python-SDK
+
+AsyncAvataxClient exposes every AvataxClient method as a coroutine, for use
+inside asyncio applications.
+"""
+import asyncio
+import time
+
+from . import client_methods
+from .batch import async_map_calls
+from .client import AvataxClient
+from .transport import HttpxAsyncTransport
+
+
+class AsyncAvataxClient(AvataxClient):
+    """
+    Asyncio flavour of AvataxClient.
+
+    Every generated method returns an awaitable resolving to a `requests.Response`:
+
+        response = await client.create_transaction(tax_document)
+
+    Calls share one non-blocking connection pool, by default an `httpx.AsyncClient`
+    (requires `pip install Avalara[httpx]`). Any `avalara.transport.AsyncTransport`
+    can be passed as `transport` instead.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """
+        Initialize the async client, the parameters are the same as AvataxClient.
+
+        pool_maxsize bounds the number of concurrent connections of the default
+        transport, pool_connections and pool_block do not apply to it.
+        """
+        if kwargs.get('transport') is None:
+            pool_maxsize = kwargs.get('pool_maxsize', 10)
+            kwargs['transport'] = HttpxAsyncTransport(
+                max_connections=pool_maxsize,
+                max_keepalive_connections=pool_maxsize
+            )
+        super(AsyncAvataxClient, self).__init__(*args, **kwargs)
+
+    async def _request(self, method, path, params=None, json=None, api_version=client_methods.API_VERSION,
+                       headers=None, operation=None, route=None, group=None):
+        """Send a call to the AvaTax API without blocking the event loop, see AvataxClient._request."""
+        call, start = self._start_call(method, path, params, json, api_version, headers, operation, route, group)
+        try:
+            response = self._before_send(call)
+            if response is None:
+                response = await self._dispatch(call)
+            response = self._after_receive(call, response)
+        except Exception as error:
+            self._observe(call, start, error=error)
+            raise
+        self._observe(call, start, response=response)
+        return response
+
+    async def _dispatch(self, call):
+        """Send a call, hedged and retried as the client's policies allow, see AvataxClient._dispatch."""
+        send = self._sender(call)
+        policy = self._retry_policy_for(call)
+        if policy is None:
+            return await send(call)
+        attempt = 0
+        while True:
+            try:
+                response = await send(call)
+            except Exception as error:
+                delay = self._retry_delay(policy, call, attempt, error=error)
+                if delay is None:
+                    raise
+            else:
+                delay = self._retry_delay(policy, call, attempt, response=response)
+                if delay is None:
+                    return response
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def _send_hedged(self, call):
+        """Send a call that is safe to duplicate without blocking the event loop, see AvataxClient._send_hedged."""
+        policy = self.hedge_policy
+        start = time.perf_counter()
+        attempts = [asyncio.ensure_future(self._send(call))]
+        done, _ = await asyncio.wait(attempts, timeout=policy.hedge_delay())
+        if not done:
+            attempts.append(asyncio.ensure_future(self._send(call)))
+        pending = set(attempts)
+        error = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for attempt in done:
+                    if attempt.exception() is None:
+                        policy.record(time.perf_counter() - start)
+                        return attempt.result()
+                    error = error or attempt.exception()
+            raise error
+        finally:
+            for attempt in attempts:
+                attempt.cancel()
+
+    async def _send(self, call):
+        """Send one attempt of a call without blocking the event loop, see AvataxClient._send."""
+        options = call.attempt_options()
+        if self.circuit_breaker is None and self.rate_limiter is None:
+            return await self._transmit(call, options)
+        circuit, probe, delay = self._acquire(call)
+        sent = False
+        try:
+            if delay:
+                await asyncio.sleep(delay)
+                options = call.attempt_options()
+            start = time.perf_counter()
+            sent = True
+            try:
+                response = await self._transmit(call, options)
+            except Exception:
+                probe = False
+                self._record(call, circuit, start)
+                raise
+            probe = False
+            self._record(call, circuit, start, response)
+            return response
+        finally:
+            if not sent:
+                self._release(call, circuit, probe)
+            elif probe:
+                circuit.release()
+
+    def map(self, method_name, iterable_of_args, max_workers=8, ordered=True):
+        """
+        Await one client method for many arguments with bounded concurrency, see AvataxClient.map.
+
+            async for result in client.map('get_transaction_by_code', [('DEFAULT', code) for code in codes]):
+                ...
+
+        :return: async generator of avalara.batch.MapResult
+        """
+        return async_map_calls(getattr(self, method_name), iterable_of_args, max_workers, ordered)
+
+    async def close(self):
+        """Close the pooled connections held by this client."""
+        await self.transport.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
@@ -1,4 +1,5 @@
 import functools
+import inspect
 import logging
 import json
 import time
@@ -20,8 +21,8 @@ def ava_log(func):
     def wrapper(*args, **kwargs):
         logger = logging.getLogger()
         is_log_req_resp_allowed = False
-        ava_log_entry = {}
-        is_error_log = False
+        is_deferred = False
+        result = error = None
 
         # Logic :
         # 1) Check if decorator is called for function in AvaTaxClient class
@@ -29,6 +30,7 @@ def ava_log(func):
         #    wants to use specific configuration)
         # 3) Execute actual method and create log entry in case of http response only
         # 4) In case of exception though log error
+        # 5) If the method returned an awaitable (AsyncAvataxClient), log once it has been awaited
         execution_start_time = time.perf_counter()
         try:
             if isinstance(args[0], client.AvataxClient):
@@ -37,40 +39,128 @@ def ava_log(func):
                 if hasattr(args[0], "is_log_req_resp_allowed"):
                     is_log_req_resp_allowed = args[0].__getattribute__("is_log_req_resp_allowed")
             result = func(*args, **kwargs)
-            if result is not None and isinstance(result, requests.models.Response):
-                ava_log_entry = get_ava_log_entry(result, is_log_req_resp_allowed)
+            if inspect.isawaitable(result):
+                is_deferred = True
+                return _log_awaitable(result, logger, is_log_req_resp_allowed, execution_start_time)
             return result
         except Exception as e:
-            is_error_log = True
-            ava_log_entry["error"] = str(e)
+            error = e
             raise e
         finally:
-            total_execution_time = time.perf_counter() - execution_start_time
-            if "execution_time" not in ava_log_entry:
-                ava_log_entry["execution_time"] = total_execution_time * 1000
-            json_data = json.dumps(ava_log_entry, indent=4)
-            if is_error_log:
-                logger.error(json_data)
-            else:
-                logger.info(json_data)
+            if not is_deferred:
+                _log_result(logger, is_log_req_resp_allowed, execution_start_time, result, error)
 
     return wrapper
 
 
+async def _log_awaitable(awaitable, logger, is_log_req_resp_allowed, execution_start_time):
+    """Await the result of an async client method, then log it like `ava_log` does."""
+    result = error = None
+    try:
+        result = await awaitable
+        return result
+    except Exception as e:
+        error = e
+        raise e
+    finally:
+        _log_result(logger, is_log_req_resp_allowed, execution_start_time, result, error)
+
+
+def log_call(client, call, execution_start_time, response=None, error=None):
+    """
+    Log one call of an AvataxClient method, called by the client dispatcher once the call is done
+    @param client: AvataxClient whose logger, is_log_req_resp_allowed and body_log_policy settings are used
+    @param call: the avalara.call.Call that was sent
+    @param execution_start_time: time.perf_counter() value when the call started
+    @param response: response of the call, if it returned one
+    @param error: exception raised by the call, if any
+    """
+    logger = client.logger if client.logger is not None else logging.getLogger()
+    _log_result(logger, client.is_log_req_resp_allowed, execution_start_time, response, error, call,
+                client.body_log_policy)
+
+
+# attributes set on the LogRecord of each call, see `get_ava_log_entry`; route and response_headers
+# are only set on the records of avalara.slow_calls captures
+LOG_FIELDS = (
+    'operation', 'method', 'request_url', 'status_code', 'correlation_id', 'execution_time', 'error',
+    'request_body', 'response_body', 'phase_timings', 'route', 'response_headers'
+)
+
+
+def _log_result(logger, is_log_req_resp_allowed, execution_start_time, result, error, call=None,
+                body_log_policy=None):
+    # nothing is collected, copied or formatted when the record would be discarded anyway
+    level = logging.INFO if error is None else logging.ERROR
+    if not logger.isEnabledFor(level):
+        return
+    ava_log_entry = {}
+    if call is not None:
+        ava_log_entry["operation"] = call.operation
+        ava_log_entry["method"] = call.method
+        ava_log_entry["request_url"] = call.url
+    if error is not None:
+        ava_log_entry["error"] = str(error)
+    elif result is not None and isinstance(result, requests.models.Response):
+        if body_log_policy is None:
+            ava_log_entry.update(get_ava_log_entry(result, is_log_req_resp_allowed))
+        else:
+            ava_log_entry.update(get_ava_log_entry(result, False))
+            if is_log_req_resp_allowed and body_log_policy.should_log(
+                    result.status_code, ava_log_entry["execution_time"]):
+                ava_log_entry["request_body"] = body_log_policy.render(result.request.body)
+                ava_log_entry["response_body"] = body_log_policy.render(result.content)
+    if "execution_time" not in ava_log_entry:
+        ava_log_entry["execution_time"] = (time.perf_counter() - execution_start_time) * 1000
+    if body_log_policy is not None and "request_url" in ava_log_entry:
+        ava_log_entry["request_url"] = body_log_policy.redact_url(ava_log_entry["request_url"])
+    # the fields travel as LogRecord attributes, the message is only rendered if a handler formats it
+    if error is not None:
+        logger.log(level, 'AvaTax call %s failed: %s', ava_log_entry.get("operation"), ava_log_entry["error"],
+                   extra=ava_log_entry)
+    else:
+        logger.log(level, 'AvaTax call %s %s %s', ava_log_entry.get("method"), ava_log_entry.get("request_url"),
+                   ava_log_entry.get("status_code"), extra=ava_log_entry)
+
+
 def get_ava_log_entry(result: requests.Response, is_log_req_resp_allowed: bool) -> dict:
     log_entry = {}
     log_entry["execution_time"] = result.elapsed.total_seconds() * 1000
-    log_entry["x-correlation-id"] = result.headers["x-correlation-id"]
+    log_entry["correlation_id"] = result.headers.get("x-correlation-id")
     log_entry["status_code"] = result.status_code
     log_entry["request_url"] = result.url
     log_entry["method"] = result.request.method
+    # set by transports created with phase_timings=True
+    phase_timings = getattr(result, "phase_timings", None)
+    if phase_timings is not None:
+        log_entry["phase_timings"] = phase_timings
     if is_log_req_resp_allowed:
-        log_entry["request"] = str(result.request.body)
-        log_entry["response"] = result.text
+        log_entry["request_body"] = str(result.request.body)
+        log_entry["response_body"] = result.text
 
     return log_entry
 
 
+class AvaLogJsonFormatter(logging.Formatter):
+    """
+    Formatter writing the call records of the SDK as JSON objects of their LOG_FIELDS.
+    Records of other loggers are formatted as {"message": ...}.
+    """
+
+    def __init__(self, indent=None, **kwargs):
+        """
+        @param indent: indentation of the JSON output, None for one line per record
+        """
+        super(AvaLogJsonFormatter, self).__init__(**kwargs)
+        self.indent = indent
+
+    def format(self, record):
+        entry = dict((field, getattr(record, field)) for field in LOG_FIELDS if hasattr(record, field))
+        if not entry:
+            entry["message"] = record.getMessage()
+        return json.dumps(entry, indent=self.indent, default=str)
+
+
 def decorate_all_methods(decorator, exclude=["__init__", "add_credentials"]):
     """
     Decorator to be applied at class level. This decorator decorates all methods in class with
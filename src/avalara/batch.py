@@ -0,0 +1,151 @@
+"""
+AvaTax Software Development Kit for Python.
+
+   Copyright 2019 Avalara, Inc.
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+
+Bounded concurrent fan-out of one client method over many arguments,
+behind AvataxClient.map and AsyncAvataxClient.map.
+"""
+import collections
+import contextvars
+from concurrent import futures
+
+
+class MapResult(object):
+    """Outcome of one item of a map: the response, or the exception raised for it."""
+
+    __slots__ = ('index', 'args', 'response', 'error')
+
+    def __init__(self, index, args, response=None, error=None):
+        """
+        Initialize the result.
+
+        :param  int  index:  Position of the item in the input
+        :param  args:  The item the method was called with
+        :param  Response  response:  Response of the call, if it did not raise
+        :param  Exception  error:  Exception raised by the call, if any
+        """
+        self.index = index
+        self.args = args
+        self.response = response
+        self.error = error
+
+    @property
+    def ok(self):
+        """True if the call returned a response with a 2xx status code."""
+        return self.error is None and self.response is not None and self.response.ok
+
+    def __repr__(self):
+        return 'MapResult(index={!r}, response={!r}, error={!r})'.format(self.index, self.response, self.error)
+
+
+def call_with(method, item):
+    """Call `method` with an item: a tuple is positional arguments, a dict keyword arguments."""
+    if isinstance(item, tuple):
+        return method(*item)
+    if isinstance(item, dict):
+        return method(**item)
+    return method(item)
+
+
+def _result(index, item, future):
+    error = future.exception()
+    if error is not None:
+        return MapResult(index, item, error=error)
+    return MapResult(index, item, response=future.result())
+
+
+def map_calls(method, items, max_workers=8, ordered=True):
+    """
+    Call `method` once per item on a bounded thread pool, yielding a MapResult per item.
+
+    At most 2 * max_workers items are taken from `items` ahead of the results
+    being consumed, so any iterable, however long, can be mapped. Each call
+    runs in a copy of the context the results are consumed in, so it keeps
+    the deadline of an enclosing `client.deadline` block.
+
+    :param  callable  method:  Bound client method
+    :param  iterable  items:  Arguments of each call, see `call_with`
+    :param  int  max_workers:  Maximum number of concurrent calls
+    :param  bool  ordered:  Yield results in input order instead of as they complete
+    :return: generator of MapResult
+    """
+    items = enumerate(items)
+    window = max(1, max_workers) * 2
+    with futures.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='avalara-map') as executor:
+        pending = collections.OrderedDict()
+
+        def fill():
+            while len(pending) < window:
+                entry = next(items, None)
+                if entry is None:
+                    return
+                index, item = entry
+                context = contextvars.copy_context()
+                pending[executor.submit(context.run, call_with, method, item)] = (index, item)
+
+        fill()
+        while pending:
+            if ordered:
+                future = next(iter(pending))
+                futures.wait([future])
+                done = [future]
+            else:
+                done = futures.wait(pending, return_when=futures.FIRST_COMPLETED).done
+            for future in done:
+                index, item = pending.pop(future)
+                yield _result(index, item, future)
+            fill()
+
+
+async def async_map_calls(method, items, max_workers=8, ordered=True):
+    """
+    Await `method` once per item with at most `max_workers` calls in flight, yielding a MapResult per item.
+
+    Asyncio counterpart of `map_calls`, for AsyncAvataxClient methods.
+    """
+    import asyncio  # only imported by async callers, keeps it off the import path of synchronous ones
+    items = enumerate(items)
+    window = max(1, max_workers)
+    pending = collections.OrderedDict()
+
+    async def run(item):
+        # called inside the task, so arguments the method rejects fail this item only
+        return await call_with(method, item)
+
+    def fill():
+        while len(pending) < window:
+            entry = next(items, None)
+            if entry is None:
+                return
+            index, item = entry
+            pending[asyncio.ensure_future(run(item))] = (index, item)
+
+    try:
+        fill()
+        while pending:
+            if ordered:
+                task = next(iter(pending))
+                await asyncio.wait([task])
+                done = [task]
+            else:
+                done, _ = await asyncio.wait(list(pending), return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                index, item = pending.pop(task)
+                yield _result(index, item, task)
+            fill()
+    finally:
+        for task in pending:
+            task.cancel()
@@ -0,0 +1,124 @@
+"""
+AvaTax Software Development Kit for Python.
+
+   Copyright 2019 Avalara, Inc.
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+
+Which request and response bodies are logged, and how much of them, when
+is_log_req_resp_allowed is on.
+"""
+import itertools
+import json
+from urllib.parse import unquote_plus
+
+
+# fields of AvaTax address models that locate a customer
+ADDRESS_FIELDS = ('line1', 'line2', 'line3', 'city', 'postalCode', 'latitude', 'longitude')
+
+REDACTED = '[redacted]'
+
+
+class BodyLogPolicy(object):
+    """
+    Decide which calls have their bodies logged, and cap and redact those bodies.
+
+    A call has its bodies logged if it failed with a 4xx/5xx status and
+    `errors` is set, if it took `slow_call_threshold` seconds or more, or if
+    it is 1 of every `sample_every` calls. With sample_every=0, only
+    errors and slow calls are logged. The query parameters named in
+    `redact_fields` are redacted in the logged request url of every call,
+    e.g. the address of a resolve_address call.
+    """
+
+    def __init__(self, sample_every=1, errors=True, slow_call_threshold=None, max_bytes=65536,
+                 redact_fields=()):
+        """
+        Initialize the policy.
+
+        :param  int  sample_every:  Log the bodies of 1 in this many calls, 0 for none but errors and slow calls
+        :param  bool  errors:  Always log the bodies of calls answered with a 4xx or 5xx status
+        :param  float  slow_call_threshold:  Always log the bodies of calls taking at least this many seconds
+        :param  int  max_bytes:  Bytes kept of each body, the rest is cut off; None to keep it all
+        :param  tuple  redact_fields:  JSON fields and query parameters whose values are replaced,
+            e.g. ADDRESS_FIELDS; query parameters are matched case insensitively
+        """
+        self.sample_every = sample_every
+        self.errors = errors
+        self.slow_call_threshold = slow_call_threshold
+        self.max_bytes = max_bytes
+        self.redact_fields = frozenset(redact_fields)
+        self._redacted_params = frozenset(field.lower() for field in redact_fields)
+        self._calls = itertools.count()
+
+    def should_log(self, status_code, execution_time):
+        """
+        Return True if the bodies of a call are logged.
+
+        :param  int  status_code:  HTTP status of the response
+        :param  float  execution_time:  Duration of the call in milliseconds
+        """
+        if self.errors and status_code >= 400:
+            return True
+        if self.slow_call_threshold is not None and execution_time >= self.slow_call_threshold * 1000:
+            return True
+        return self.sample_every > 0 and next(self._calls) % self.sample_every == 0
+
+    def render(self, body):
+        """Return the logged text of a body: bytes or str, redacted and capped to max_bytes."""
+        if body is None:
+            return None
+        if self.redact_fields:
+            body = self._redact(body)
+        if not isinstance(body, bytes):
+            body = body.encode('utf-8')
+        size = len(body)
+        truncated = self.max_bytes is not None and size > self.max_bytes
+        if truncated:
+            body = body[:self.max_bytes]
+        # a multi-byte character cut in half by the cap is dropped
+        body = body.decode('utf-8', 'ignore')
+        if truncated:
+            body += '... [truncated, {} bytes]'.format(size)
+        return body
+
+    def redact_url(self, url):
+        """Return a url with the values of its query parameters named in redact_fields replaced."""
+        if not self._redacted_params or url is None or '?' not in url:
+            return url
+        base, _, query = url.partition('?')
+        query, hash_, fragment = query.partition('#')
+        parameters = []
+        for parameter in query.split('&'):
+            name = parameter.split('=', 1)[0]
+            if unquote_plus(name).lower() in self._redacted_params:
+                parameter = name + '=' + REDACTED
+            parameters.append(parameter)
+        return base + '?' + '&'.join(parameters) + hash_ + fragment
+
+    def _redact(self, body):
+        try:
+            document = json.loads(body)
+        except ValueError:
+            return body
+        return json.dumps(self._redact_value(document))
+
+    def _redact_value(self, value):
+        if isinstance(value, dict):
+            return dict(
+                (key, REDACTED if key in self.redact_fields and item is not None else self._redact_value(item))
+                for key, item in value.items()
+            )
+        if isinstance(value, list):
+            return [self._redact_value(item) for item in value]
+        return value
@@ -0,0 +1,456 @@
+"""
+AvaTax Software Development Kit for Python.
+
+   Copyright 2019 Avalara, Inc.
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+
+Opt-in response cache for reference data, such as the Definitions
+endpoints, plugged into a client as a pre-send and a post-receive hook
+(see avalara.middleware). Responses are kept in memory, or in a sqlite
+file shared by the worker processes of a host.
+"""
+import collections
+import contextlib
+import copy
+import inspect
+import json
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from urllib.parse import urlencode
+except ImportError:  # pragma no cover
+    from urllib import urlencode
+
+from .middleware import respond
+
+
+class CachedResponse(object):
+    """A response kept by a cache store, with the wall clock times it was stored and expires at."""
+
+    __slots__ = ('status_code', 'content', 'headers', 'stored_at', 'expires_at')
+
+    def __init__(self, status_code, content, headers, stored_at, expires_at):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers
+        self.stored_at = stored_at
+        self.expires_at = expires_at
+
+    @property
+    def size(self):
+        """Bytes of the response body."""
+        return len(self.content)
+
+    def is_fresh(self, now=None):
+        """Return True until the response expires."""
+        return (time.time() if now is None else now) < self.expires_at
+
+
+class MemoryStore(object):
+    """
+    In-memory cache store, evicting the least recently used responses.
+
+    Holds at most `max_entries` responses and `max_bytes` bytes of response
+    bodies; a response bigger than max_bytes is not stored.
+    """
+
+    def __init__(self, max_entries=1024, max_bytes=16 * 1024 * 1024):
+        """
+        Initialize the store.
+
+        :param  int  max_entries:  Maximum number of responses held
+        :param  int  max_bytes:  Maximum total size of the response bodies held
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.evictions = 0
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """Return the CachedResponse stored under key, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key, entry):
+        """Store a CachedResponse under key, evicting the least recently used ones to make room."""
+        if entry.size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.bytes -= previous.size
+            self._entries[key] = entry
+            self.bytes += entry.size
+            while len(self._entries) > self.max_entries or self.bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.bytes -= evicted.size
+                self.evictions += 1
+
+    def delete_prefix(self, prefix):
+        """Forget the responses stored under keys starting with prefix."""
+        with self._lock:
+            for key in [key for key in self._entries if key.startswith(prefix)]:
+                self.bytes -= self._entries.pop(key).size
+
+    def clear(self):
+        """Forget every response."""
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+
+class SqliteStore(object):
+    """
+    Cache store kept in a sqlite file, shared by the processes using the same path.
+
+    A new process starts with the responses stored by the previous ones, so
+    its first reference data calls are answered by a local file read. The
+    least recently used responses are evicted beyond `max_entries` responses
+    or `max_bytes` bytes of bodies. Expired responses stay until evicted or
+    replaced, so a ResponseCache with stale_while_revalidate can still serve
+    them. Reads record their use at most every `touch_interval` seconds per
+    response, and skip it at once while another process holds the file
+    lock; writes, made by the post-receive hook of a finished call, give up
+    after `write_timeout` seconds.
+    """
+
+    def __init__(self, path, max_entries=10000, max_bytes=64 * 1024 * 1024, timeout=5.0, touch_interval=60.0,
+                 write_timeout=0.1):
+        """
+        Initialize the store, creating the file and its table if needed.
+
+        :param  string  path:  Path of the sqlite file
+        :param  int  max_entries:  Maximum number of responses held
+        :param  int  max_bytes:  Maximum total size of the response bodies held
+        :param  float  timeout:  Seconds to wait for another process holding the file lock
+        :param  float  touch_interval:  Seconds between two updates of the last use of a response
+        :param  float  write_timeout:  Seconds a response being stored waits for another process holding the lock
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.touch_interval = touch_interval
+        self.write_timeout = write_timeout
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, timeout=timeout, check_same_thread=False, isolation_level=None)
+        with self._lock:
+            # WAL lets readers in other processes go on while one process writes
+            self._db.execute('PRAGMA journal_mode=WAL')
+            self._db.execute(
+                'CREATE TABLE IF NOT EXISTS responses ('
+                'key TEXT PRIMARY KEY, status_code INTEGER, content BLOB, headers TEXT, '
+                'stored_at REAL, expires_at REAL, used_at REAL)'
+            )
+            self._db.execute('CREATE INDEX IF NOT EXISTS responses_used_at ON responses (used_at)')
+
+    def __len__(self):
+        with self._lock:
+            return self._db.execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+
+    @property
+    def bytes(self):
+        """Total size of the response bodies held."""
+        with self._lock:
+            return self._db.execute('SELECT COALESCE(SUM(LENGTH(content)), 0) FROM responses').fetchone()[0]
+
+    def get(self, key):
+        """Return the CachedResponse stored under key, or None."""
+        with self._lock:
+            row = self._db.execute(
+                'SELECT status_code, content, headers, stored_at, expires_at, used_at FROM responses WHERE key = ?',
+                (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            now = time.time()
+            if now - row[5] >= self.touch_interval:
+                try:
+                    with self._busy_timeout(0):
+                        self._db.execute('UPDATE responses SET used_at = ? WHERE key = ?', (now, key))
+                except sqlite3.OperationalError:
+                    # the eviction order is a hint, a locked file must neither fail nor slow down the read
+                    pass
+        status_code, content, headers, stored_at, expires_at, _ = row
+        return CachedResponse(status_code, bytes(content), json.loads(headers), stored_at, expires_at)
+
+    def set(self, key, entry):
+        """Store a CachedResponse under key, evicting the least recently used ones to make room."""
+        if entry.size > self.max_bytes:
+            return
+        with self._lock:
+            with self._busy_timeout(self.write_timeout):
+                self._db.execute('BEGIN IMMEDIATE')
+            try:
+                self._db.execute(
+                    'INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)',
+                    (key, entry.status_code, sqlite3.Binary(entry.content), json.dumps(entry.headers),
+                     entry.stored_at, entry.expires_at, time.time())
+                )
+                self._evict()
+                self._db.execute('COMMIT')
+            except Exception:
+                self._db.execute('ROLLBACK')
+                raise
+
+    @contextlib.contextmanager
+    def _busy_timeout(self, seconds):
+        """Wait at most `seconds` for the file lock inside the block, instead of the connection's timeout."""
+        self._db.execute('PRAGMA busy_timeout = {:d}'.format(int(seconds * 1000)))
+        try:
+            yield
+        finally:
+            self._db.execute('PRAGMA busy_timeout = {:d}'.format(int(self.timeout * 1000)))
+
+    def _evict(self):
+        count, size = self._db.execute('SELECT COUNT(*), COALESCE(SUM(LENGTH(content)), 0) FROM responses').fetchone()
+        if count <= self.max_entries and size <= self.max_bytes:
+            return
+        rows = self._db.execute('SELECT key, LENGTH(content) FROM responses ORDER BY used_at').fetchall()
+        evicted = []
+        for key, length in rows:
+            if count <= self.max_entries and size <= self.max_bytes:
+                break
+            evicted.append((key,))
+            count -= 1
+            size -= length
+        self._db.executemany('DELETE FROM responses WHERE key = ?', evicted)
+
+    def delete_prefix(self, prefix):
+        """Forget the responses stored under keys starting with prefix."""
+        with self._lock:
+            self._db.execute('DELETE FROM responses WHERE substr(key, 1, ?) = ?', (len(prefix), prefix))
+
+    def clear(self):
+        """Forget every response."""
+        with self._lock:
+            self._db.execute('DELETE FROM responses')
+
+    def close(self):
+        """Close the sqlite connection."""
+        with self._lock:
+            self._db.close()
+
+
+def cache_key(call):
+    """
+    Return the cache key of a call: its method name, URL and normalized query parameters.
+
+    Parameters are sorted, their names lowercased (AvaTax reads them case
+    insensitively) and empty ones dropped, so {'$top': 10, '$filter': None}
+    and {'$TOP': '10'} share a key.
+    """
+    params = ''
+    if call.params:
+        params = urlencode(sorted(
+            (str(name).lower(), str(value).strip())
+            for name, value in call.params.items() if value is not None and str(value).strip() != ''
+        ))
+    return '{} {}?{}'.format(call.operation, call.url, params)
+
+
+class ResponseCache(object):
+    """
+    Cache the successful responses of reference data calls.
+
+    By default the GET calls of the Definitions endpoints (list_tax_codes,
+    list_countries, list_regions_by_country...) are cached; pass
+    `operations` to choose the client methods instead. A cached response
+    is served for `ttl` seconds, or the TTL of its method in `ttls`. Only
+    200 responses are cached.
+
+    With `stale_while_revalidate`, an expired response is still served for
+    that many seconds past its expiry while a background refresh fetches a
+    new one, so callers never wait on the API for cached data. Served
+    responses have `from_cache` set, `stale` when expired, and `cache_age`,
+    the seconds since they were fetched.
+
+    A store error, e.g. a SqliteStore file locked by another process, never
+    fails a call: the read counts as a miss, the response is not stored, and
+    `store_errors` is incremented.
+
+        cache = ResponseCache(ttl=3600, ttls={'list_tax_codes': 86400})
+        cache.install(client)
+    """
+
+    def __init__(self, ttl=3600, ttls=None, operations=None, store=None, max_entries=1024,
+                 max_bytes=16 * 1024 * 1024, stale_while_revalidate=None, max_workers=2):
+        """
+        Initialize the cache.
+
+        :param  float  ttl:  Seconds a response is served from the cache
+        :param  dict  ttls:  TTL per client method name, overriding ttl
+        :param  iterable  operations:  Client method names to cache, default every GET of the
+            definitions endpoint group (see avalara.endpoint_groups)
+        :param  store:  Where responses are kept, a MemoryStore of max_entries and max_bytes by default,
+            or a SqliteStore to share them between processes
+        :param  int  max_entries:  Maximum number of responses held by the default store
+        :param  int  max_bytes:  Maximum total size of the response bodies held by the default store
+        :param  float  stale_while_revalidate:  Seconds an expired response is still served while it is
+            refreshed in the background (default: None, expired responses are fetched again)
+        :param  int  max_workers:  Threads refreshing responses in the background for synchronous clients
+        """
+        self.ttl = ttl
+        self.ttls = dict(ttls or {})
+        self.operations = frozenset(operations) if operations is not None else None
+        self.store = store if store is not None else MemoryStore(max_entries, max_bytes)
+        self.stale_while_revalidate = stale_while_revalidate
+        self.max_workers = max_workers
+        self.hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.store_errors = 0
+        self._refreshing = set()
+        self._tasks = set()
+        self._lock = threading.Lock()
+        self._executor = None
+
+    def install(self, client):
+        """Serve and fill this cache from the calls of a client, return the client."""
+        client.pre_send_hooks.append(lambda call: self.before_send(call, client))
+        client.post_receive_hooks.append(self.after_receive)
+        return client
+
+    def key(self, call):
+        """Return the key a call's response is stored under, see cache_key."""
+        return cache_key(call)
+
+    def is_cacheable(self, call):
+        """Return True if the responses of a call are cached."""
+        if call.method != 'GET':
+            return False
+        if self.operations is not None:
+            return call.operation in self.operations
+        return call.group == 'definitions'
+
+    def before_send(self, call, client=None):
+        """
+        Pre-send hook answering a call from the cache, see avalara.middleware.
+
+        :param  Call  call:  The call about to be sent
+        :param  AvataxClient  client:  Client refreshing stale responses, install passes it
+        """
+        if not self.is_cacheable(call):
+            return None
+        key = self.key(call)
+        try:
+            entry = self.store.get(key)
+        except Exception:
+            self.store_errors += 1
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+        now = time.time()
+        stale = not entry.is_fresh(now)
+        if stale:
+            if (client is None or self.stale_while_revalidate is None
+                    or now >= entry.expires_at + self.stale_while_revalidate):
+                self.misses += 1
+                return None
+            self._refresh(client, call, key)
+        self.hits += 1
+        response = respond(call, entry.status_code, entry.content, entry.headers)
+        response.from_cache = True
+        response.stale = stale
+        response.cache_age = now - entry.stored_at
+        return response
+
+    def after_receive(self, call, response):
+        """Post-receive hook storing successful responses, see avalara.middleware."""
+        if response.status_code != 200 or getattr(response, 'from_cache', False) or not self.is_cacheable(call):
+            return None
+        now = time.time()
+        ttl = self.ttls.get(call.operation, self.ttl)
+        try:
+            self.store.set(self.key(call), CachedResponse(
+                response.status_code, response.content, dict(response.headers), now, now + ttl
+            ))
+        except Exception:
+            self.store_errors += 1
+        return None
+
+    def invalidate(self, operation=None):
+        """Forget the cached responses of one client method, or every cached response."""
+        if operation is None:
+            self.store.clear()
+        else:
+            self.store.delete_prefix(operation + ' ')
+
+    def _refresh(self, client, call, key):
+        """Fetch a new response for a stale call in the background, once at a time per key."""
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+        call = copy.copy(call)
+        # the refresh outlives the call that found the response stale
+        call.deadline_at = None
+        call.span = None
+        if inspect.iscoroutinefunction(client._dispatch):
+            import asyncio  # only imported by async callers, keeps it off the import path of synchronous ones
+            task = asyncio.get_running_loop().create_task(self._refresh_async(client, call, key))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        else:
+            self.executor.submit(self._refresh_sync, client, call, key)
+
+    def _refresh_sync(self, client, call, key):
+        try:
+            self.after_receive(call, client._dispatch(call))
+            self.refreshes += 1
+        except Exception:
+            # the stale response keeps being served until a refresh succeeds or it is too old
+            pass
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    async def _refresh_async(self, client, call, key):
+        try:
+            self.after_receive(call, await client._dispatch(call))
+            self.refreshes += 1
+        except Exception:
+            pass
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    @property
+    def executor(self):
+        """Thread pool refreshing stale responses for synchronous clients."""
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers, thread_name_prefix='avalara-cache'
+                    )
+        return self._executor
+
+    def shutdown(self):
+        """Stop the thread pool, waiting for outstanding refreshes."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
@@ -0,0 +1,89 @@
+"""
+AvaTax Software Development Kit for Python.
+
+   Copyright 2019 Avalara, Inc.
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+
+A Call carries one client method invocation through the dispatcher.
+"""
+import time
+
+from .timeouts import DeadlineExceeded, cap_timeout
+
+
+class Call(object):
+    """A single AvaTax API call, as built by the client dispatcher."""
+
+    __slots__ = (
+        'operation', 'method', 'path', 'url', 'group', 'params', 'json', 'options', 'deadline_at', 'route', 'span'
+    )
+
+    def __init__(self, operation, method, path, url, group, params, json, options, deadline_at=None, route=None):
+        """
+        Initialize the call.
+
+        :param  string  operation:  Name of the client method, e.g. create_transaction
+        :param  string  method:  HTTP verb
+        :param  string  path:  Path of the endpoint, relative to the base url
+        :param  string  url:  Absolute URL of the endpoint
+        :param  string  group:  Endpoint group, see avalara.endpoint_groups
+        :param  dict  params:  Query string parameters
+        :param  dict  json:  Request body
+        :param  dict  options:  headers, auth and timeout passed to the transport
+        :param  float  deadline_at:  time.monotonic() value the call must finish by, if any
+        :param  string  route:  Route template of the endpoint, e.g. /api/v2/companies/{id_}
+        """
+        self.operation = operation
+        self.method = method
+        self.path = path
+        self.url = url
+        self.group = group
+        self.params = params
+        self.json = json
+        self.options = options
+        self.deadline_at = deadline_at
+        self.route = route
+        # set by the client's tracer, see avalara.tracing
+        self.span = None
+
+    def add_headers(self, headers):
+        """Add headers to this call only, the header dict it shares with other calls is left untouched."""
+        merged = dict(self.options['headers'])
+        merged.update(headers)
+        self.options = dict(self.options, headers=merged)
+
+    def remaining(self):
+        """Return the seconds left before the deadline, or None without a deadline."""
+        if self.deadline_at is None:
+            return None
+        return self.deadline_at - time.monotonic()
+
+    def can_wait(self, delay):
+        """Return True if waiting `delay` seconds still leaves time before the deadline."""
+        return self.deadline_at is None or time.monotonic() + delay < self.deadline_at
+
+    def attempt_options(self):
+        """
+        Return the transport options of the next attempt, its timeout capped by the deadline.
+
+        Raises DeadlineExceeded if the deadline has already passed.
+        """
+        if self.deadline_at is None:
+            return self.options
+        remaining = self.deadline_at - time.monotonic()
+        if remaining <= 0:
+            raise DeadlineExceeded('Deadline exceeded before {} could be sent'.format(self.operation or self.path))
+        options = dict(self.options)
+        options['timeout'] = cap_timeout(options.get('timeout'), remaining)
+        return options
@@ -0,0 +1,164 @@
+"""
+AvaTax Software Development Kit for Python.
+
+   Copyright 2019 Avalara, Inc.
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+
+Circuit breakers fail calls fast while an endpoint group is unhealthy.
+"""
+import threading
+import time
+
+import requests
+
+from .endpoint_groups import DEFAULT_GROUP, check_groups
+
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitOpenError(requests.RequestException):
+    """Raised instead of sending a call while the circuit of its endpoint group is open."""
+
+    def __init__(self, group, retry_in):
+        super(CircuitOpenError, self).__init__(
+            'Circuit for {} endpoints is open, retry in {:.1f}s'.format(group, retry_in)
+        )
+        self.group = group
+        self.retry_in = retry_in
+
+
+class Circuit(object):
+    """
+    Thread-safe circuit of a single endpoint group.
+
+    The circuit opens after `failure_threshold` consecutive failures, where a
+    failure is a network error, a 5xx response or, when `slow_call_threshold`
+    is set, a call slower than that many seconds. While open, calls raise
+    CircuitOpenError. After `recovery_timeout` seconds the circuit half-opens
+    and lets `half_open_max_calls` probes through: a successful probe closes
+    it, a failed one opens it again. A probe that is never sent, or whose
+    outcome is never known, must be given back with `release`.
+    """
+
+    def __init__(self, group=DEFAULT_GROUP, failure_threshold=5, recovery_timeout=30.0,
+                 slow_call_threshold=None, half_open_max_calls=1):
+        """
+        Initialize the circuit.
+
+        :param  string  group:  Name of the endpoint group, reported in CircuitOpenError
+        :param  int  failure_threshold:  Consecutive failures that open the circuit
+        :param  float  recovery_timeout:  Seconds the circuit stays open before probing
+        :param  float  slow_call_threshold:  Seconds above which a call counts as a failure
+        :param  int  half_open_max_calls:  Concurrent probes allowed while half-open
+        """
+        self.group = group
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.slow_call_threshold = slow_call_threshold
+        self.half_open_max_calls = half_open_max_calls
+        self.state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+        self._lock = threading.Lock()
+
+    def before_call(self):
+        """
+        Raise CircuitOpenError if the call must not be sent.
+
+        :return: True if the call took one of the half-open probe slots
+        """
+        if self.state == CLOSED:
+            return False
+        with self._lock:
+            if self.state == OPEN:
+                retry_in = self._opened_at + self.recovery_timeout - time.monotonic()
+                if retry_in > 0:
+                    raise CircuitOpenError(self.group, retry_in)
+                self.state = HALF_OPEN
+                self._probes = 0
+            if self.state == HALF_OPEN:
+                if self._probes >= self.half_open_max_calls:
+                    raise CircuitOpenError(self.group, 0.0)
+                self._probes += 1
+                return True
+            return False
+
+    def release(self):
+        """Give back the probe slot of a call that was cancelled or failed before its outcome was recorded."""
+        with self._lock:
+            if self.state == HALF_OPEN and self._probes > 0:
+                self._probes -= 1
+
+    def record(self, status_code, elapsed):
+        """Record the outcome of a call that returned a response."""
+        if status_code >= 500 or (
+                self.slow_call_threshold is not None and elapsed > self.slow_call_threshold
+        ):
+            self.record_failure()
+        else:
+            self.record_success()
+
+    def record_success(self):
+        """Record a healthy call."""
+        if self.state == CLOSED and not self._failures:
+            return
+        with self._lock:
+            self._failures = 0
+            self.state = CLOSED
+
+    def record_failure(self):
+        """Record a failed call, opening the circuit if needed."""
+        with self._lock:
+            self._failures += 1
+            if self.state == HALF_OPEN or self._failures >= self.failure_threshold:
+                self.state = OPEN
+                self._opened_at = time.monotonic()
+
+
+class CircuitBreaker(object):
+    """
+    Circuit breaker keeping one Circuit per endpoint group (see avalara.endpoint_groups).
+
+    A degraded group, e.g. reports, fails fast without affecting the others.
+    """
+
+    def __init__(self, groups=None, **circuit_options):
+        """
+        Initialize the breaker.
+
+        :param  dict  groups:  Group name to a dict of Circuit arguments overriding the defaults,
+            e.g. {'transactions': {'slow_call_threshold': 2.0}}
+        :param  circuit_options:  Default Circuit arguments for every group
+        :raises ValueError: `groups` names an unknown endpoint group
+        """
+        self.groups = check_groups(groups or {})
+        self.circuit_options = circuit_options
+        self._circuits = {}
+        self._lock = threading.Lock()
+
+    def circuit(self, group=DEFAULT_GROUP):
+        """Return the circuit of an endpoint group, creating it on first use."""
+        circuit = self._circuits.get(group)
+        if circuit is None:
+            with self._lock:
+                circuit = self._circuits.get(group)
+                if circuit is None:
+                    options = dict(self.circuit_options, group=group)
+                    options.update(self.groups.get(group, {}))
+                    circuit = self._circuits[group] = Circuit(**options)
+        return circuit
@@ -25,10 +25,24 @@ AvaTax Software Development Kit for Python.
 @link       https://github.com/avadev/AvaTax-REST-V2-Python-SDK
 """
 import  logging
+import time
+from concurrent import futures
 from requests.auth import HTTPBasicAuth
 
 from . import client_methods
+from .ava_logger import log_call
+from .batch import map_calls
 from ._str_version import str_type
+from .call import Call
+from .endpoint_groups import endpoint_group
+from .timeouts import DeadlineExceeded, current_deadline, deadline
+from .transport import RequestsTransport
+
+
+def _close_response(attempt):
+    """Release the connection of a hedged attempt whose response was not used."""
+    if attempt.exception() is None:
+        attempt.result().close()
 
 
 class AvataxClient(client_methods.Mixin):
@@ -42,7 +56,22 @@ class AvataxClient(client_methods.Mixin):
             environment=None,
             timeout_limit=None,
             is_log_req_resp_allowed=False,
-            logger=None
+            logger=None,
+            pool_connections=10,
+            pool_maxsize=10,
+            pool_block=False,
+            transport=None,
+            retry_policy=None,
+            rate_limiter=None,
+            circuit_breaker=None,
+            timeout_profiles=None,
+            hedge_policy=None,
+            body_log_policy=None,
+            metrics=None,
+            tracer=None,
+            slow_call_recorder=None,
+            pre_send_hooks=None,
+            post_receive_hooks=None
     ):
         """
         Initialize the sandbox client.
@@ -55,8 +84,37 @@ class AvataxClient(client_methods.Mixin):
             :param  string  machine_name: Name of machine you are working on
             :param  string  environment: Default environment is production,
                 input sandbox, for the sandbox API
-            :param  int/float The timeout limit for every call made by this client instance. (default: 10 sec)
+            :param  int/float/tuple timeout_limit: The timeout limit, or (connect, read) timeouts, for every
+                call made by this client instance without a timeout profile (default: 1200 sec)
             :param  bool is_log_req_resp_allowed: is logging request and response is allowed (default: False)
+            :param  int pool_connections: Number of host connection pools to cache (default: 10)
+            :param  int pool_maxsize: Maximum number of keep-alive connections kept per host (default: 10)
+            :param  bool pool_block: Block when every pooled connection is in use instead of
+                opening an extra, non-pooled connection (default: False)
+            :param  Transport transport: Object used to send every call, see avalara.transport
+                (default: a pooled RequestsTransport built from the pool_* arguments)
+            :param  RetryPolicy retry_policy: Retry transient failures of idempotent calls,
+                see avalara.retry (default: None, no retries)
+            :param  RateLimiter rate_limiter: Adaptive per endpoint group rate limit shared by
+                every thread using this client, see avalara.rate_limit (default: None)
+            :param  CircuitBreaker circuit_breaker: Fail fast with CircuitOpenError while an endpoint
+                group is unhealthy, see avalara.circuit_breaker (default: None)
+            :param  TimeoutProfiles timeout_profiles: Connect/read timeouts and deadlines per endpoint
+                group or method, see avalara.timeouts (default: None, timeout_limit for every call)
+            :param  HedgePolicy hedge_policy: Duplicate slow calls that are safe to send twice, such as
+                uncommitted SalesOrder quotes, see avalara.hedging (default: None)
+            :param  BodyLogPolicy body_log_policy: Sample, cap and redact the bodies logged when
+                is_log_req_resp_allowed is on, see avalara.body_logging (default: None, every body in full)
+            :param  MetricsRegistry metrics: Count, time and size every call per client method,
+                see avalara.metrics (default: None, no metrics)
+            :param  Tracer tracer: Trace every call as a span and propagate its trace context in the
+                request headers, see avalara.tracing (default: None, no tracing)
+            :param  SlowCallRecorder slow_call_recorder: Keep the full detail of slow and failed calls
+                until flushed, see avalara.slow_calls (default: None)
+            :param  list pre_send_hooks: Callables run in order before each call is sent, any of them
+                can answer the call instead, see avalara.middleware (default: None)
+            :param  list post_receive_hooks: Callables run in order on each response, any of them can
+                replace it, see avalara.middleware (default: None)
         :return: object
         """
         if not all(
@@ -78,10 +136,356 @@ class AvataxClient(client_methods.Mixin):
             app_name, app_version, machine_name
         )
         self.client_header = {'X-Avalara-Client': self.client_id}
+        self._build_headers()
         self.timeout_limit = timeout_limit
         self.is_log_req_resp_allowed = is_log_req_resp_allowed
         self.logger = logger
         # if self.logger is set, logging is done using supplied logger configuration
+        # every call made by this client goes through one transport, so TCP/TLS connections are kept alive and reused
+        if transport is None:
+            transport = RequestsTransport(
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                pool_block=pool_block
+            )
+        self.transport = transport
+        self.retry_policy = retry_policy
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self.timeout_profiles = timeout_profiles
+        self.hedge_policy = hedge_policy
+        self.body_log_policy = body_log_policy
+        self.metrics = metrics
+        self.tracer = tracer
+        self.slow_call_recorder = slow_call_recorder
+        self.pre_send_hooks = list(pre_send_hooks or ())
+        self.post_receive_hooks = list(post_receive_hooks or ())
+
+    @property
+    def session(self):
+        """The requests.Session used by the transport, if it is session based."""
+        return getattr(self.transport, 'session', None)
+
+    def _request(self, method, path, params=None, json=None, api_version=client_methods.API_VERSION,
+                 headers=None, operation=None, route=None, group=None):
+        """
+        Send a call to the AvaTax API, every generated method goes through here.
+
+        Each call is traced, logged and measured once, here, see _trace and _observe,
+        and goes through the pre-send and post-receive hooks once, whatever its retries.
+
+        :param  string  method:  HTTP verb
+        :param  string  path:  Path of the endpoint, relative to the base url
+        :param  dict  params:  Query string parameters
+        :param  dict  json:  Request body
+        :param  string  api_version:  Version reported in the X-Avalara-Client header
+        :param  dict  headers:  Extra headers for this call, empty values are skipped
+        :param  string  operation:  Name of the client method making the call
+        :param  string  route:  Route template of the endpoint
+        :param  string  group:  Endpoint group of the route, found from `path` when not given
+        :return: requests.Response
+        """
+        call, start = self._start_call(method, path, params, json, api_version, headers, operation, route, group)
+        try:
+            response = self._before_send(call)
+            if response is None:
+                response = self._dispatch(call)
+            response = self._after_receive(call, response)
+        except Exception as error:
+            self._observe(call, start, error=error)
+            raise
+        self._observe(call, start, response=response)
+        return response
+
+    def _start_call(self, method, path, params, json, api_version, headers, operation, route, group=None):
+        """Build the Call of a generated method and start its span, return it with its start time."""
+        start = time.perf_counter()
+        call = self._new_call(method, path, params, json, api_version, headers, operation, route, group)
+        if self.tracer is not None:
+            self._trace(call)
+        return call, start
+
+    def _trace(self, call):
+        """Start the span of a call and add its trace context to the call's headers."""
+        call.span = self.tracer.start_span(call)
+        headers = {}
+        self.tracer.inject(call.span, headers)
+        if headers:
+            call.add_headers(headers)
+
+    def _before_send(self, call):
+        """Run the pre-send hooks in order, return the response of the first one answering the call."""
+        if not self.pre_send_hooks:
+            return None
+        for hook in self.pre_send_hooks:
+            response = hook(call)
+            if response is not None:
+                return response
+        return None
+
+    def _after_receive(self, call, response):
+        """Run the post-receive hooks in order, each one can replace the response."""
+        if not self.post_receive_hooks:
+            return response
+        for hook in self.post_receive_hooks:
+            replacement = hook(call, response)
+            if replacement is not None:
+                response = replacement
+        return response
+
+    def _observe(self, call, start, response=None, error=None):
+        """Log a finished call, record its metrics, end its span and capture it if slow or failed."""
+        duration = time.perf_counter() - start
+        if self.metrics is not None:
+            self.metrics.record(call.operation, duration, response, error)
+        if call.span is not None:
+            self.tracer.end_span(call.span, response, error)
+        if self.slow_call_recorder is not None:
+            self.slow_call_recorder.record(call, duration, response, error)
+        log_call(self, call, start, response=response, error=error)
+
+    def _dispatch(self, call):
+        """Send a call, hedged and retried as the client's policies allow."""
+        send = self._sender(call)
+        policy = self._retry_policy_for(call)
+        if policy is None:
+            return send(call)
+        attempt = 0
+        while True:
+            try:
+                response = send(call)
+            except Exception as error:
+                delay = self._retry_delay(policy, call, attempt, error=error)
+                if delay is None:
+                    raise
+            else:
+                delay = self._retry_delay(policy, call, attempt, response=response)
+                if delay is None:
+                    return response
+            attempt += 1
+            time.sleep(delay)
+
+    def _sender(self, call):
+        """Return the method sending the attempts of a call, _send_hedged for calls safe to duplicate."""
+        if self.hedge_policy is not None and self.hedge_policy.should_hedge(call):
+            return self._send_hedged
+        return self._send
+
+    def _retry_policy_for(self, call):
+        """Return the retry policy of the client if the call may be retried, None otherwise."""
+        policy = self.retry_policy
+        if policy is None or not policy.is_retryable(call.method, call.operation, call.json):
+            return None
+        return policy
+
+    @staticmethod
+    def _retry_delay(policy, call, attempt, response=None, error=None):
+        """
+        Return the seconds to wait before retrying a failed attempt, None to stop retrying.
+
+        The response of an attempt about to be retried is closed, freeing its connection.
+        """
+        delay = policy.next_delay(attempt, response=response, error=error)
+        if delay is None or not call.can_wait(delay):
+            return None
+        if response is not None:
+            response.close()
+        return delay
+
+    def _send_hedged(self, call):
+        """
+        Send a call that is safe to duplicate, hedging it when the first attempt is slow to answer.
+
+        The attempts run on idle threads of the policy, see HedgePolicy.submit; the call
+        is sent unhedged on the calling thread when none is idle.
+        """
+        policy = self.hedge_policy
+        start = time.perf_counter()
+        first = policy.submit(self._send, call)
+        if first is None:
+            response = self._send(call)
+            policy.record(time.perf_counter() - start)
+            return response
+        attempts = [first]
+        if not futures.wait(attempts, timeout=policy.hedge_delay()).done:
+            hedge = policy.submit(self._send, call)
+            if hedge is not None:
+                attempts.append(hedge)
+        pending = set(attempts)
+        error = None
+        while pending:
+            done, pending = futures.wait(pending, return_when=futures.FIRST_COMPLETED)
+            for attempt in done:
+                if attempt.exception() is None:
+                    policy.record(time.perf_counter() - start)
+                    for other in attempts:
+                        if other is not attempt:
+                            other.add_done_callback(_close_response)
+                    return attempt.result()
+                error = error or attempt.exception()
+        raise error
+
+    def _send(self, call):
+        """Send one attempt of a call through the transport, guarded by the breaker and limiter of its group."""
+        options = call.attempt_options()
+        if self.circuit_breaker is None and self.rate_limiter is None:
+            return self._transmit(call, options)
+        circuit, probe, delay = self._acquire(call)
+        sent = False
+        try:
+            if delay:
+                time.sleep(delay)
+                options = call.attempt_options()
+            start = time.perf_counter()
+            sent = True
+            try:
+                response = self._transmit(call, options)
+            except Exception:
+                probe = False
+                self._record(call, circuit, start)
+                raise
+            probe = False
+            self._record(call, circuit, start, response)
+            return response
+        finally:
+            if not sent:
+                self._release(call, circuit, probe)
+            elif probe:
+                circuit.release()
+
+    def _transmit(self, call, options):
+        """Hand one attempt to the transport, return its response, or its awaitable for async transports."""
+        return self.transport.send(call.method, call.url, params=call.params, json=call.json, **options)
+
+    def _acquire(self, call):
+        """
+        Let an attempt through the circuit breaker and the rate limiter of its group.
+
+        The caller must give back what was taken with _release if the attempt is not
+        sent, e.g. when it is cancelled while waiting for the rate limit, and release
+        the circuit if it took a probe slot and the attempt's outcome is not recorded.
+
+        :return: the Circuit of the group or None, whether a half-open probe slot
+            was taken, and the seconds to wait for the rate limit
+        :raises CircuitOpenError: the circuit is open
+        :raises DeadlineExceeded: the rate limit wait would outlast the call's deadline
+        """
+        circuit = None
+        probe = False
+        if self.circuit_breaker is not None:
+            circuit = self.circuit_breaker.circuit(call.group)
+            probe = circuit.before_call()
+        delay = 0
+        if self.rate_limiter is not None:
+            try:
+                delay = self.rate_limiter.reserve(call.group)
+            except BaseException:
+                if probe:
+                    circuit.release()
+                raise
+            if delay and not call.can_wait(delay):
+                self._release(call, circuit, probe)
+                raise DeadlineExceeded('Deadline exceeded waiting for the {} rate limit'.format(call.group))
+        return circuit, probe, delay
+
+    def _release(self, call, circuit, probe):
+        """Give back the probe slot and the rate limit token _acquire took for an attempt that is not sent."""
+        if probe:
+            circuit.release()
+        if self.rate_limiter is not None:
+            self.rate_limiter.release(call.group)
+
+    def _record(self, call, circuit, start, response=None):
+        """Feed the outcome of an attempt to the rate limiter and circuit, a missing response being a failure."""
+        if response is None:
+            if circuit is not None:
+                circuit.record_failure()
+            return
+        if self.rate_limiter is not None:
+            self.rate_limiter.record(call.group, response.status_code)
+        if circuit is not None:
+            circuit.record(response.status_code, time.perf_counter() - start)
+
+    def _build_headers(self):
+        """
+        Snapshot client_header into the header set sent with each API version.
+
+        Called on construction and whenever credentials change. Calls never write
+        to these dicts, so one client can be shared across threads; per-call extra
+        headers are merged into a copy.
+        """
+        headers_by_version = {}
+        for api_version in (client_methods.API_VERSION, ''):
+            headers = dict(self.client_header)
+            if 'X-Avalara-Client' in headers:
+                headers['X-Avalara-Client'] = self.client_id.replace('API_VERSION', api_version)
+            headers_by_version[api_version] = headers
+        self._headers = headers_by_version
+
+    def _new_call(self, method, path, params, json, api_version, headers, operation, route=None, group=None):
+        """Build the Call of a generated method: url, endpoint group, headers, timeout and deadline."""
+        if group is None:
+            group = endpoint_group(path)
+        call_headers = self._headers[api_version]
+        if headers:
+            extra = dict((k, v) for k, v in headers.items() if v)
+            if extra:
+                call_headers = dict(call_headers)
+                call_headers.update(extra)
+        timeout = self.timeout_limit if self.timeout_limit else 1200
+        deadline_at = current_deadline()
+        if self.timeout_profiles is not None:
+            profile = self.timeout_profiles.profile(group, operation)
+            if profile is not None:
+                timeout = profile.timeout(timeout)
+                if profile.deadline is not None:
+                    profile_deadline_at = time.monotonic() + profile.deadline
+                    if deadline_at is None or profile_deadline_at < deadline_at:
+                        deadline_at = profile_deadline_at
+        options = {'headers': call_headers, 'auth': self.auth, 'timeout': timeout}
+        return Call(
+            operation, method, path, self.base_url + path, group, params, json, options, deadline_at, route
+        )
+
+    def deadline(self, seconds):
+        """
+        Bound the calls made inside a `with` block, retries included, to `seconds` from now.
+
+            with client.deadline(2.0):
+                client.create_transaction(model)
+        """
+        return deadline(seconds)
+
+    def map(self, method_name, iterable_of_args, max_workers=8, ordered=True):
+        """
+        Call one client method for many arguments concurrently, sharing this client's connection pool.
+
+        Each item is the arguments of one call: a tuple is passed positionally,
+        a dict as keyword arguments, anything else as the single argument.
+        A failing item does not stop the others, its exception is reported on
+        its result instead.
+
+            for result in client.map('void_transaction', [('DEFAULT', code, model) for code in codes]):
+                if not result.ok:
+                    print(result.args, result.error or result.response.text)
+
+        :param  string  method_name:  Name of the client method, e.g. 'get_transaction_by_code'
+        :param  iterable  iterable_of_args:  Arguments of each call
+        :param  int  max_workers:  Maximum number of concurrent calls, keep it at or under pool_maxsize
+        :param  bool  ordered:  Yield results in input order instead of as they complete
+        :return: generator of avalara.batch.MapResult
+        """
+        return map_calls(getattr(self, method_name), iterable_of_args, max_workers, ordered)
+
+    def close(self):
+        """Close the pooled connections held by this client."""
+        self.transport.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
 
 
     def add_credentials(self, username=None, password=None):
@@ -103,6 +507,7 @@ class AvataxClient(client_methods.Mixin):
             self.client_header['Authorization'] = 'Bearer ' + username
         else:
             self.auth = HTTPBasicAuth(username, password)
+        self._build_headers()
         return self
 
 # to generate a client object on initialization of this file, uncomment the script below
@@ -0,0 +1,73 @@
+"""
+AvaTax Software Development Kit for Python.
+
+   Copyright 2019 Avalara, Inc.
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+
+Endpoint groups let rate limits, circuit breakers and timeouts be configured
+for a family of endpoints at once. A call belongs to the first group whose
+pattern matches its path, or to the `default` group. The generated client
+methods match their route once, when their endpoint table is loaded.
+"""
+import re
+
+
+DEFAULT_GROUP = 'default'
+
+ENDPOINT_GROUPS = (
+    # companies/transactions/lines holds add_lines and delete_lines
+    ('transactions', re.compile(r'^/api/v2/(companies/([^/]+/)?)?transactions(/|$)')),
+    ('addresses', re.compile(r'^/api/v2/addresses/')),
+    ('definitions', re.compile(r'^/api/v2/definitions/')),
+    ('reports', re.compile(r'^/api/v2/(companies/[^/]+/)?(reports|AllVariance|variance)(/|$)')),
+    ('taxcontent', re.compile(
+        r'^/api/v2/(pointofsaledata|taxratesbyzipcode|taxrates|taxcontent'
+        r'|companies/[^/]+/locations/[^/]+/pointofsaledata)(/|$)'
+    )),
+)
+
+
+def endpoint_group(path, groups=ENDPOINT_GROUPS):
+    """
+    Return the name of the group a call belongs to.
+
+    :param  string  path:  Path of the endpoint, relative to the base url
+    :param  tuple  groups:  (name, compiled pattern) pairs, checked in order
+    :return: string
+    """
+    for name, pattern in groups:
+        if pattern.match(path):
+            return name
+    return DEFAULT_GROUP
+
+# names accepted in the `groups` setting of RateLimiter, CircuitBreaker and TimeoutProfiles
+GROUP_NAMES = (DEFAULT_GROUP,) + tuple(name for name, _ in ENDPOINT_GROUPS)
+
+
+def check_groups(groups):
+    """
+    Return the per group settings `groups`, raise ValueError if it names an unknown group.
+
+    A typo, or the name of an avalara.endpoints module such as 'items',
+    would otherwise leave the setting silently unused.
+
+    :param  dict  groups:  Group name to setting
+    :return: dict
+    """
+    unknown = sorted(set(groups) - set(GROUP_NAMES))
+    if unknown:
+        raise ValueError('Unknown endpoint group(s) {}, expected one of: {}'.format(
+            ', '.join(map(repr, unknown)), ', '.join(GROUP_NAMES)
+        ))
+    return groups
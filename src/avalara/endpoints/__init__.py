@@ -0,0 +1,194 @@
+"""
+AvaTax Software Development Kit for Python.
+
+   Copyright 2019 Avalara, Inc.
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+
+Endpoint tables of the client methods, one module per API area. Each
+module holds an ENDPOINTS table of (name, HTTP verb, route template,
+arguments[, api_version]) rows and is only imported once one of its
+methods is first used.
+
+Of the arguments, `model` is sent as the JSON body, `include` as the query
+string and `x_avalara_version` as the x-avalara-version header; every other
+argument fills the route placeholder of the same name.
+"""
+
+# client method names of each module
+MODULES = {
+    'accounts': (
+        'account_reset_license_key activate_account audit_account create_license_key delete_license_key '
+        'get_account get_account_configuration get_license_key get_license_keys list_mrs_accounts '
+        'query_accounts set_account_configuration approve_firm_client_linkage '
+        'create_and_link_new_firm_client_account create_firm_client_linkage delete_firm_client_linkage '
+        'get_firm_client_linkage insert_firm_client_linkage list_firm_client_linkage '
+        'reject_firm_client_linkage reset_firm_client_linkage revoke_firm_client_linkage '
+        'update_firm_client_linkage create_jurisdiction_overrides delete_jurisdiction_override '
+        'get_jurisdiction_override list_jurisdiction_overrides_by_account query_jurisdiction_overrides '
+        'update_jurisdiction_override create_notice_responsibility_type create_notice_root_cause_type '
+        'delete_notice_responsibility_type delete_notice_root_cause_type dismiss_notification '
+        'get_notification list_notifications request_new_account request_new_entitlement create_account '
+        'create_notifications create_subscriptions delete_account delete_notification delete_subscription '
+        'list_service_types reset_password update_account update_notification update_subscription '
+        'get_subscription list_subscriptions_by_account query_subscriptions change_password create_users '
+        'delete_user get_user get_user_entitlements list_users_by_account query_users update_user'
+    ),
+    'addresses': (
+        'resolve_address resolve_address_post'
+    ),
+    'asv': (
+        'find_age_verification store_age_verification store_if_verified verify_age deregister_shipment '
+        'register_shipment register_shipment_if_compliant verify_shipment enqueue_batch_deregistration '
+        'enqueue_batch_registration get_batch_registration_data'
+    ),
+    'batches': (
+        'cancel_batch create_advanced_rules_batch create_batches create_item_import_batch '
+        'create_transaction_batch delete_batch download_batch get_batch list_batches_by_company query_batches '
+        'create_job create_job_phase create_job_task delete_job delete_job_phase delete_job_task get_job '
+        'list_jobs update_job update_job_phase update_job_task'
+    ),
+    'certificates': (
+        'create_cert_express_invitation get_cert_express_invitation list_cert_express_invitations '
+        'create_certificates delete_certificate delete_certificate_custom_fields download_certificate_image '
+        'get_certificate get_certificate_setup link_attributes_to_certificate link_customers_to_certificate '
+        'list_attributes_for_certificate list_certificate_tax_types list_customers_for_certificate '
+        'list_custom_fields_for_certificate list_local_exempt_jurisdictions query_certificates '
+        'request_certificate_setup unlink_attributes_from_certificate unlink_customers_from_certificate '
+        'update_certificate update_certificate_custom_fields upload_certificate_image '
+        'get_communication_certificate list_communication_certificates add_ship_to_states_for_customer '
+        'create_customers delete_customer delete_custom_fields get_customer link_attributes_to_customer '
+        'link_certificates_to_customer link_ship_to_customers_to_bill_customer '
+        'list_active_certificates_for_customer list_attributes_for_customer list_certificates_for_customer '
+        'list_custom_fields_for_customer list_in_active_certificates_for_customer '
+        'list_ship_to_states_for_customer list_valid_certificates_for_customer query_customers '
+        'remove_ship_to_states_for_customer unlink_attributes_from_customer unlink_certificates_from_customer '
+        'update_customer update_custom_fields create_e_commerce_token refresh_e_commerce_token'
+    ),
+    'companies': (
+        'create_a_p_config_setting get_a_p_config_setting_by_company query_a_p_config_setting '
+        'update_a_p_config_setting create_ava_file_forms delete_ava_file_form get_ava_file_form '
+        'query_ava_file_forms update_ava_file_form list_location_by_account certify_integration '
+        'change_filing_status company_initialize create_companies create_company_parameters '
+        'create_funding_request create_vat_numbers delete_company delete_company_parameter delete_vat_number '
+        'funding_configuration_by_company funding_configurations_by_company_and_currency '
+        'get_all_customers_and_suppliers_with_country_params get_company get_company_configuration '
+        'get_company_parameter_detail get_filing_status get_vat_number list_a_c_h_entry_details_for_company '
+        'list_company_parameter_details list_funding_requests_by_company list_mrs_companies list_vat_numbers '
+        'query_companies set_company_configuration update_company update_company_parameter_detail '
+        'update_vat_number validate_vat_number query_juris_names query_rate_options query_state_config '
+        'query_state_reporting_codes query_tax_type_mappings create_contacts delete_contact get_contact '
+        'list_contacts_by_company query_contacts update_contact bulk_upload_cost_centers create_cost_center '
+        'delete_cost_center get_cost_center_by_id list_cost_centers_by_company query_cost_centers '
+        'update_cost_center create_data_sources delete_data_source get_data_source_by_id list_data_sources '
+        'query_data_sources update_data_source create_distance_threshold delete_distance_threshold '
+        'get_distance_threshold list_distance_thresholds query_distance_thresholds update_distance_threshold '
+        'create_dcv filter_dcv get_dcv_by_id delete_afc_event_notifications delete_event_notifications '
+        'get_event_notifications list_afc_event_notifications get_eco_nexus_thresholds resolve_form_type_task '
+        'activate_funding_request funding_request_status bulk_upload_g_l_accounts create_g_l_account '
+        'delete_g_l_account get_g_l_account_by_id list_g_l_accounts_by_company update_g_l_account '
+        'create_reverse_sync_registration delete_reverse_sync_registration get_reverse_sync_registration '
+        'list_reverse_sync_registrations update_reverse_sync_registration create_settings delete_setting '
+        'get_setting list_settings_by_company query_settings update_setting delete_user_defined_field '
+        'list_user_defined_fields_by_company_id update_user_defined_field create_vendors delete_vendor '
+        'get_vendor list_certificates_for_vendor query_vendors update_vendor'
+    ),
+    'definitions': (
+        'get_cross_border_code list_all_marketplace_locations list_all_unit_of_basis list_ava_file_forms '
+        'list_certificate_attributes list_certificate_exempt_reasons list_certificate_exposure_zones '
+        'list_classification_parameters_usage list_communications_service_types '
+        'list_communications_transaction_types list_communications_t_s_pairs list_countries '
+        'list_cover_letters list_cross_border_codes list_cross_border_sections list_currencies '
+        'list_entity_use_codes list_filing_frequencies list_item_h_s_code_classification_status '
+        'list_item_reverse_sync_events list_items_recommendations_status list_items_status list_jurisdictions '
+        'list_jurisdictions_by_address list_jurisdictions_by_rate_type_tax_type_mapping '
+        'list_jurisdictions_hierarchy list_jurisdiction_tax_types_and_sub_types '
+        'list_jurisdiction_types_by_rate_type_tax_type_mapping list_location_questions_by_address '
+        'list_marketplace_locations list_nexus list_nexus_by_address list_nexus_by_country '
+        'list_nexus_by_country_and_region list_nexus_by_form_code list_nexus_by_tax_type_group '
+        'list_nexus_tax_type_groups list_notice_customer_funding_options list_notice_customer_types '
+        'list_notice_filingtypes list_notice_priorities list_notice_reasons list_notice_responsibilities '
+        'list_notice_root_causes list_notice_statuses list_notice_types list_parameters '
+        'list_parameters_by_account list_parameters_by_item list_parameters_usage list_permissions '
+        'list_postal_codes list_preferred_programs list_product_classification_systems '
+        'list_product_classification_systems_by_company list_rate_types_by_country '
+        'list_rate_types_by_country_tax_type_tax_sub_type list_regions list_regions_by_country '
+        'list_regions_by_country_and_tax_type_and_tax_sub_type_and_rate_type list_returns_parameters_usage '
+        'list_security_roles list_subscription_types list_tags list_tax_authorities list_tax_authority_forms '
+        'list_tax_authority_types list_tax_codes list_tax_code_types list_tax_forms list_tax_sub_types '
+        'list_tax_sub_types_by_country_and_tax_type list_tax_sub_types_by_jurisdiction_and_region '
+        'list_tax_type_groups list_tax_types_by_nexus_and_country '
+        'list_unit_of_basis_by_country_and_tax_type_and_tax_sub_type_and_rate_type list_unit_of_measurement'
+    ),
+    'items': (
+        'a_isearch batch_delete_item_classifications batch_delete_item_custom_parameters '
+        'batch_delete_item_parameters bulk_upload_items create_item_classifications '
+        'create_item_custom_parameters create_item_parameters create_items create_item_tags '
+        'create_taxcode_batch create_tax_code_classification_request delete_batch_tax_code_recommendations '
+        'delete_catalogue_item delete_h_s_code_classification_status delete_item delete_item_classification '
+        'delete_item_custom_parameter delete_item_image delete_item_parameter delete_item_tag '
+        'delete_item_tags dismiss_h_s_code_classification_status fetch_additional_h_s_code_duty_details '
+        'get_batch_tax_code_recommendations get_h_s_code_classification_s_l_a get_item '
+        'get_item_classification get_item_custom_parameter get_item_parameter get_item_tags '
+        'get_item_tax_code_recommendations get_premium_classification get_product_image '
+        'get_sync_tax_code_recommendations initiate_h_s_code_classification list_import_restrictions '
+        'list_item_classifications list_item_custom_parameters list_item_parameters '
+        'list_item_premium_classifications list_items_by_company '
+        'list_recommended_parameter_by_company_id_and_item_id patch_item query_items '
+        'query_items_by_system_code query_items_by_tag sync_item_catalogue sync_items update_image '
+        'update_item update_item_classification update_item_custom_parameter update_item_parameter '
+        'upload_image upsert_item_classifications upsert_item_custom_parameter upsert_item_parameter '
+        'verify_h_s_code create_u_p_cs delete_u_p_c get_u_p_c list_u_p_cs_by_company query_u_p_cs '
+        'update_u_p_c'
+    ),
+    'locations': (
+        'create_location_parameters create_locations delete_location delete_location_parameter get_location '
+        'get_location_parameter list_location_parameters list_locations_by_company query_locations '
+        'update_location update_location_parameter validate_location'
+    ),
+    'nexus': (
+        'create_nexus create_nexus_parameters declare_nexus_by_address delete_nexus delete_nexus_parameter '
+        'delete_nexus_parameters get_nexus get_nexus_by_form_code get_nexus_parameter list_nexus_by_company '
+        'list_nexus_by_company_and_tax_type_group list_nexus_parameters query_nexus update_nexus '
+        'update_nexus_parameter'
+    ),
+    'reports': (
+        'download_audit_log_report download_report export_audit_logs get_audit_log_report get_report '
+        'initiate_export_document_line_report list_reports'
+    ),
+    'tax_content': (
+        'build_tax_content_file build_tax_content_file_for_location download_tax_rates_by_zip_code '
+        'get_v_a_t_rates_by_country tax_rates_by_address tax_rates_by_postal_code'
+    ),
+    'tax_rules': (
+        'create_tax_codes delete_tax_code get_tax_code list_tax_codes_by_company query_tax_codes '
+        'update_tax_code create_country_coefficients create_tax_rules delete_tax_rule get_tax_rule '
+        'list_country_coefficients list_tax_rules query_tax_rules update_tax_rule'
+    ),
+    'transactions': (
+        'adjust_multi_document_transaction audit_multi_document_transaction commit_multi_document_transaction '
+        'create_multi_document_transaction get_multi_document_transaction_by_code_and_type '
+        'get_multi_document_transaction_by_id list_multi_document_transactions '
+        'refund_multi_document_transaction verify_multi_document_transaction void_multi_document_transaction '
+        'add_lines adjust_transaction audit_transaction audit_transaction_with_type bulk_lock_transaction '
+        'change_transaction_code commit_transaction create_or_adjust_transaction create_transaction '
+        'delete_lines get_all_variance_report_by_company_code get_transaction_by_code '
+        'get_transaction_by_code_and_type get_transaction_by_id '
+        'get_variance_report_by_company_code_by_transaction_id list_transactions_by_company lock_transaction '
+        'refund_transaction settle_transaction uncommit_transaction unvoid_transaction variance_report '
+        'verify_transaction void_transaction'
+    ),
+    'utilities': (
+        'get_my_subscription list_my_subscriptions ping query_vendor_certificates'
+    ),
+}
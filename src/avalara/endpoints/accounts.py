@@ -0,0 +1,84 @@
+"""
+AvaTax Software Development Kit for Python.
+
+   Copyright 2019 Avalara, Inc.
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+
+Client methods of the accounts group: accounts, users, subscriptions, firm client linkages, jurisdiction overrides,
+notices and provisioning.
+See avalara.client_methods.
+"""
+
+ENDPOINTS = (
+    ('account_reset_license_key', 'POST', '/api/v2/accounts/{id_}/resetlicensekey', 'id_ model'),
+    ('activate_account', 'POST', '/api/v2/accounts/{id_}/activate', 'id_ model'),
+    ('audit_account', 'GET', '/api/v2/accounts/{id_}/audit', 'id_ include'),
+    ('create_license_key', 'POST', '/api/v2/accounts/{id_}/licensekey', 'id_ model'),
+    ('delete_license_key', 'DELETE', '/api/v2/accounts/{id_}/licensekey/{licensekeyname}', 'id_ licensekeyname'),
+    ('get_account', 'GET', '/api/v2/accounts/{id_}', 'id_ include'),
+    ('get_account_configuration', 'GET', '/api/v2/accounts/{id_}/configuration', 'id_'),
+    ('get_license_key', 'GET', '/api/v2/accounts/{id_}/licensekey/{licensekeyname}', 'id_ licensekeyname'),
+    ('get_license_keys', 'GET', '/api/v2/accounts/{id_}/licensekeys', 'id_'),
+    ('list_mrs_accounts', 'GET', '/api/v2/accounts/mrs', ''),
+    ('query_accounts', 'GET', '/api/v2/accounts', 'include'),
+    ('set_account_configuration', 'POST', '/api/v2/accounts/{id_}/configuration', 'id_ model'),
+    ('approve_firm_client_linkage', 'POST', '/api/v2/firmclientlinkages/{id_}/approve', 'id_'),
+    ('create_and_link_new_firm_client_account', 'POST', '/api/v2/firmclientlinkages/createandlinkclient', 'model'),
+    ('create_firm_client_linkage', 'POST', '/api/v2/firmclientlinkages', 'model'),
+    ('delete_firm_client_linkage', 'DELETE', '/api/v2/firmclientlinkages/{id_}', 'id_'),
+    ('get_firm_client_linkage', 'GET', '/api/v2/firmclientlinkages/{id_}', 'id_'),
+    ('insert_firm_client_linkage', 'POST', '/api/v2/firmclientlinkages/insert', 'model'),
+    ('list_firm_client_linkage', 'GET', '/api/v2/firmclientlinkages', 'include'),
+    ('reject_firm_client_linkage', 'POST', '/api/v2/firmclientlinkages/{id_}/reject', 'id_'),
+    ('reset_firm_client_linkage', 'POST', '/api/v2/firmclientlinkages/{id_}/reset', 'id_'),
+    ('revoke_firm_client_linkage', 'POST', '/api/v2/firmclientlinkages/{id_}/revoke', 'id_'),
+    ('update_firm_client_linkage', 'PUT', '/api/v2/firmclientlinkages', 'model'),
+    ('create_jurisdiction_overrides', 'POST', '/api/v2/accounts/{accountId}/jurisdictionoverrides', 'accountId model'),
+    ('delete_jurisdiction_override', 'DELETE', '/api/v2/accounts/{accountId}/jurisdictionoverrides/{id_}', 'accountId id_'),
+    ('get_jurisdiction_override', 'GET', '/api/v2/accounts/{accountId}/jurisdictionoverrides/{id_}', 'accountId id_'),
+    ('list_jurisdiction_overrides_by_account', 'GET', '/api/v2/accounts/{accountId}/jurisdictionoverrides', 'accountId include'),
+    ('query_jurisdiction_overrides', 'GET', '/api/v2/jurisdictionoverrides', 'include'),
+    ('update_jurisdiction_override', 'PUT', '/api/v2/accounts/{accountId}/jurisdictionoverrides/{id_}', 'accountId id_ model'),
+    ('create_notice_responsibility_type', 'POST', '/api/v2/notices/responsibilities', 'model'),
+    ('create_notice_root_cause_type', 'POST', '/api/v2/notices/rootcauses', 'model'),
+    ('delete_notice_responsibility_type', 'DELETE', '/api/v2/notices/responsibilities/{responsibilityId}', 'responsibilityId'),
+    ('delete_notice_root_cause_type', 'DELETE', '/api/v2/notices/rootcauses/{rootCauseId}', 'rootCauseId'),
+    ('dismiss_notification', 'PUT', '/api/v2/notifications/{id_}/dismiss', 'id_'),
+    ('get_notification', 'GET', '/api/v2/notifications/{id_}', 'id_'),
+    ('list_notifications', 'GET', '/api/v2/notifications', 'include'),
+    ('request_new_account', 'POST', '/api/v2/accounts/request', 'model'),
+    ('request_new_entitlement', 'POST', '/api/v2/accounts/{id_}/entitlements/{offer}', 'id_ offer'),
+    ('create_account', 'POST', '/api/v2/accounts', 'model'),
+    ('create_notifications', 'POST', '/api/v2/notifications', 'model'),
+    ('create_subscriptions', 'POST', '/api/v2/accounts/{accountId}/subscriptions', 'accountId model'),
+    ('delete_account', 'DELETE', '/api/v2/accounts/{id_}', 'id_'),
+    ('delete_notification', 'DELETE', '/api/v2/notifications/{id_}', 'id_'),
+    ('delete_subscription', 'DELETE', '/api/v2/accounts/{accountId}/subscriptions/{id_}', 'accountId id_'),
+    ('list_service_types', 'GET', '/api/v2/servicetypes/servicetypes', 'include'),
+    ('reset_password', 'POST', '/api/v2/passwords/{userId}/reset', 'userId model include'),
+    ('update_account', 'PUT', '/api/v2/accounts/{id_}', 'id_ model'),
+    ('update_notification', 'PUT', '/api/v2/notifications/{id_}', 'id_ model'),
+    ('update_subscription', 'PUT', '/api/v2/accounts/{accountId}/subscriptions/{id_}', 'accountId id_ model'),
+    ('get_subscription', 'GET', '/api/v2/accounts/{accountId}/subscriptions/{id_}', 'accountId id_'),
+    ('list_subscriptions_by_account', 'GET', '/api/v2/accounts/{accountId}/subscriptions', 'accountId include'),
+    ('query_subscriptions', 'GET', '/api/v2/subscriptions', 'include'),
+    ('change_password', 'PUT', '/api/v2/passwords', 'model'),
+    ('create_users', 'POST', '/api/v2/accounts/{accountId}/users', 'accountId model'),
+    ('delete_user', 'DELETE', '/api/v2/accounts/{accountId}/users/{id_}', 'id_ accountId'),
+    ('get_user', 'GET', '/api/v2/accounts/{accountId}/users/{id_}', 'id_ accountId include'),
+    ('get_user_entitlements', 'GET', '/api/v2/accounts/{accountId}/users/{id_}/entitlements', 'id_ accountId'),
+    ('list_users_by_account', 'GET', '/api/v2/accounts/{accountId}/users', 'accountId include'),
+    ('query_users', 'GET', '/api/v2/users', 'include'),
+    ('update_user', 'PUT', '/api/v2/accounts/{accountId}/users/{id_}', 'id_ accountId model'),
+)
@@ -0,0 +1,25 @@
+"""
+AvaTax Software Development Kit for Python.
+
+   Copyright 2019 Avalara, Inc.
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+
+Client methods of the addresses group: address resolution.
+See avalara.client_methods.
+"""
+
+ENDPOINTS = (
+    ('resolve_address', 'GET', '/api/v2/addresses/resolve', 'include'),
+    ('resolve_address_post', 'POST', '/api/v2/addresses/resolve', 'model'),
+)
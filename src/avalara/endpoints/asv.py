@@ -0,0 +1,35 @@
+"""
+AvaTax Software Development Kit for Python.
+
+   Copyright 2019 Avalara, Inc.
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+
+Client methods of the asv group: age verification and shipment registration for
+beverage alcohol (ASV).
+See avalara.client_methods.
+"""
+
+ENDPOINTS = (
+    ('find_age_verification', 'PUT', '/api/v2/ageverification/store/identity/find', 'model', ''),
+    ('store_age_verification', 'PUT', '/api/v2/ageverification/store/identity', 'model', ''),
+    ('store_if_verified', 'PUT', '/api/v2/ageverification/store/identity/storeIfVerified', 'model include', ''),
+    ('verify_age', 'POST', '/api/v2/ageverification/verify', 'model include', ''),
+    ('deregister_shipment', 'DELETE', '/api/v2/companies/{companyCode}/transactions/{transactionCode}/shipment/registration', 'companyCode transactionCode include x_avalara_version', ''),
+    ('register_shipment', 'PUT', '/api/v2/companies/{companyCode}/transactions/{transactionCode}/shipment/registration', 'companyCode transactionCode include x_avalara_version', ''),
+    ('register_shipment_if_compliant', 'PUT', '/api/v2/companies/{companyCode}/transactions/{transactionCode}/shipment/registerIfCompliant', 'companyCode transactionCode include x_avalara_version', ''),
+    ('verify_shipment', 'GET', '/api/v2/companies/{companyCode}/transactions/{transactionCode}/shipment/verify', 'companyCode transactionCode include x_avalara_version', ''),
+    ('enqueue_batch_deregistration', 'PUT', '/api/v2/asv/companies/{companyCode}/batches/{batchCode}/deregister', 'companyCode batchCode include x_avalara_version', ''),
+    ('enqueue_batch_registration', 'PUT', '/api/v2/asv/companies/{companyCode}/batches/{batchCode}/register', 'companyCode batchCode include x_avalara_version', ''),
+    ('get_batch_registration_data', 'GET', '/api/v2/asv/batches', 'include', ''),
+)
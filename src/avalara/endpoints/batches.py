@@ -0,0 +1,44 @@
+"""
+AvaTax Software Development Kit for Python.
+
+   Copyright 2019 Avalara, Inc.
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+
+Client methods of the batches group: batches and jobs.
+See avalara.client_methods.
+"""
+
+ENDPOINTS = (
+    ('cancel_batch', 'POST', '/api/v2/companies/{companyId}/batches/{id_}/cancel', 'companyId id_'),
+    ('create_advanced_rules_batch', 'POST', '/api/v2/companies/{companyId}/batches/advancedrules', 'companyId model'),
+    ('create_batches', 'POST', '/api/v2/companies/{companyId}/batches', 'companyId model'),
+    ('create_item_import_batch', 'POST', '/api/v2/companies/{companyId}/batches/items', 'companyId model'),
+    ('create_transaction_batch', 'POST', '/api/v2/companies/{companyId}/batches/transactions', 'companyId model'),
+    ('delete_batch', 'DELETE', '/api/v2/companies/{companyId}/batches/{id_}', 'companyId id_'),
+    ('download_batch', 'GET', '/api/v2/companies/{companyId}/batches/{batchId}/files/{id_}/attachment', 'companyId batchId id_'),
+    ('get_batch', 'GET', '/api/v2/companies/{companyId}/batches/{id_}', 'companyId id_'),
+    ('list_batches_by_company', 'GET', '/api/v2/companies/{companyId}/batches', 'companyId include'),
+    ('query_batches', 'GET', '/api/v2/batches', 'include'),
+    ('create_job', 'POST', '/api/v2/companies/{companyId}/jobs', 'companyId model'),
+    ('create_job_phase', 'POST', '/api/v2/companies/{companyId}/jobs/{jobId}/phases', 'companyId jobId model'),
+    ('create_job_task', 'POST', '/api/v2/companies/{companyId}/jobs/{jobId}/phases/{phaseId}/tasks', 'companyId jobId phaseId model'),
+    ('delete_job', 'DELETE', '/api/v2/companies/{companyId}/jobs/{id_}', 'companyId id_'),
+    ('delete_job_phase', 'DELETE', '/api/v2/companies/{companyId}/jobs/{jobId}/phases/{phaseId}', 'companyId jobId phaseId'),
+    ('delete_job_task', 'DELETE', '/api/v2/companies/{companyId}/jobs/{jobId}/phases/{phaseId}/tasks/{taskId}', 'companyId jobId phaseId taskId'),
+    ('get_job', 'GET', '/api/v2/companies/{companyId}/jobs/{id_}', 'companyId id_ include'),
+    ('list_jobs', 'GET', '/api/v2/companies/{companyId}/jobs', 'companyId include'),
+    ('update_job', 'PUT', '/api/v2/companies/{companyId}/jobs/{id_}', 'companyId id_ model'),
+    ('update_job_phase', 'PUT', '/api/v2/companies/{companyId}/jobs/{jobId}/phases/{phaseId}', 'companyId jobId phaseId model'),
+    ('update_job_task', 'PUT', '/api/v2/companies/{companyId}/jobs/{jobId}/phases/{phaseId}/tasks/{taskId}', 'companyId jobId phaseId taskId model'),
+)
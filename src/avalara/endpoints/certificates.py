@@ -0,0 +1,72 @@
+"""
+AvaTax Software Development Kit for Python.
+
+   Copyright 2019 Avalara, Inc.
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+
+Client methods of the certificates group: exemption certificates, customers, CertExpress invitations and
+eCommerce tokens.
+See avalara.client_methods.
+"""
+
+ENDPOINTS = (
+    ('create_cert_express_invitation', 'POST', '/api/v2/companies/{companyId}/customers/{customerCode}/certexpressinvites', 'companyId customerCode model'),
+    ('get_cert_express_invitation', 'GET', '/api/v2/companies/{companyId}/customers/{customerCode}/certexpressinvites/{id_}', 'companyId customerCode id_ include'),
+    ('list_cert_express_invitations', 'GET', '/api/v2/companies/{companyId}/certexpressinvites', 'companyId include'),
+    ('create_certificates', 'POST', '/api/v2/companies/{companyId}/certificates', 'companyId model include'),
+    ('delete_certificate', 'DELETE', '/api/v2/companies/{companyId}/certificates/{id_}', 'companyId id_'),
+    ('delete_certificate_custom_fields', 'DELETE', '/api/v2/companies/{companyId}/certificates/{id_}/custom-fields', 'companyId id_ model'),
+    ('download_certificate_image', 'GET', '/api/v2/companies/{companyId}/certificates/{id_}/attachment', 'companyId id_ include'),
+    ('get_certificate', 'GET', '/api/v2/companies/{companyId}/certificates/{id_}', 'companyId id_ include'),
+    ('get_certificate_setup', 'GET', '/api/v2/companies/{companyId}/certificates/setup', 'companyId'),
+    ('link_attributes_to_certificate', 'POST', '/api/v2/companies/{companyId}/certificates/{id_}/attributes/link', 'companyId id_ model'),
+    ('link_customers_to_certificate', 'POST', '/api/v2/companies/{companyId}/certificates/{id_}/customers/link', 'companyId id_ model'),
+    ('list_attributes_for_certificate', 'GET', '/api/v2/companies/{companyId}/certificates/{id_}/attributes', 'companyId id_'),
+    ('list_certificate_tax_types', 'GET', '/api/v2/companies/{companyId}/certificates/taxtypes', 'companyId include'),
+    ('list_customers_for_certificate', 'GET', '/api/v2/companies/{companyId}/certificates/{id_}/customers', 'companyId id_ include'),
+    ('list_custom_fields_for_certificate', 'GET', '/api/v2/companies/{companyId}/certificates/{id_}/custom-fields', 'companyId id_'),
+    ('list_local_exempt_jurisdictions', 'GET', '/api/v2/companies/{companyId}/jurisdictions', 'companyId include'),
+    ('query_certificates', 'GET', '/api/v2/companies/{companyId}/certificates', 'companyId include'),
+    ('request_certificate_setup', 'POST', '/api/v2/companies/{companyId}/certificates/setup', 'companyId'),
+    ('unlink_attributes_from_certificate', 'POST', '/api/v2/companies/{companyId}/certificates/{id_}/attributes/unlink', 'companyId id_ model'),
+    ('unlink_customers_from_certificate', 'POST', '/api/v2/companies/{companyId}/certificates/{id_}/customers/unlink', 'companyId id_ model'),
+    ('update_certificate', 'PUT', '/api/v2/companies/{companyId}/certificates/{id_}', 'companyId id_ model'),
+    ('update_certificate_custom_fields', 'PUT', '/api/v2/companies/{companyId}/certificates/{id_}/custom-fields', 'companyId id_ model'),
+    ('upload_certificate_image', 'POST', '/api/v2/companies/{companyId}/certificates/{id_}/attachment', 'companyId id_'),
+    ('get_communication_certificate', 'GET', '/companies/{companyId}/communication-certificates/{certificateId}', 'companyId certificateId'),
+    ('list_communication_certificates', 'GET', '/companies/{companyId}/communication-certificates', 'companyId include'),
+    ('add_ship_to_states_for_customer', 'POST', '/api/v2/companies/{companyId}/customers/{customerCode}/shiptostate', 'companyId customerCode model'),
+    ('create_customers', 'POST', '/api/v2/companies/{companyId}/customers', 'companyId model'),
+    ('delete_customer', 'DELETE', '/api/v2/companies/{companyId}/customers/{customerCode}', 'companyId customerCode'),
+    ('delete_custom_fields', 'DELETE', '/api/v2/companies/{companyId}/customers/{customerCode}/custom-fields', 'companyId customerCode model'),
+    ('get_customer', 'GET', '/api/v2/companies/{companyId}/customers/{customerCode}', 'companyId customerCode include'),
+    ('link_attributes_to_customer', 'PUT', '/api/v2/companies/{companyId}/customers/{customerCode}/attributes/link', 'companyId customerCode model'),
+    ('link_certificates_to_customer', 'POST', '/api/v2/companies/{companyId}/customers/{customerCode}/certificates/link', 'companyId customerCode model'),
+    ('link_ship_to_customers_to_bill_customer', 'POST', '/api/v2/companies/{companyId}/customers/billto/{code}/shipto/link', 'companyId code model'),
+    ('list_active_certificates_for_customer', 'GET', '/api/v2/companies/{companyId}/customers/{customerCode}/certificates/active', 'companyId customerCode'),
+    ('list_attributes_for_customer', 'GET', '/api/v2/companies/{companyId}/customers/{customerCode}/attributes', 'companyId customerCode'),
+    ('list_certificates_for_customer', 'GET', '/api/v2/companies/{companyId}/customers/{customerCode}/certificates', 'companyId customerCode include'),
+    ('list_custom_fields_for_customer', 'GET', '/api/v2/companies/{companyId}/customers/{customerCode}/custom-fields', 'companyId customerCode'),
+    ('list_in_active_certificates_for_customer', 'GET', '/api/v2/companies/{companyId}/customers/{customerCode}/certificates/inactive', 'companyId customerCode'),
+    ('list_ship_to_states_for_customer', 'GET', '/api/v2/companies/{companyId}/customers/{customerCode}/shiptostate', 'companyId customerCode'),
+    ('list_valid_certificates_for_customer', 'GET', '/api/v2/companies/{companyId}/customers/{customerCode}/certificates/{country}/{region}', 'companyId customerCode country region'),
+    ('query_customers', 'GET', '/api/v2/companies/{companyId}/customers', 'companyId include'),
+    ('remove_ship_to_states_for_customer', 'DELETE', '/api/v2/companies/{companyId}/customers/{customerCode}/shiptostate', 'companyId customerCode model'),
+    ('unlink_attributes_from_customer', 'PUT', '/api/v2/companies/{companyId}/customers/{customerCode}/attributes/unlink', 'companyId customerCode model'),
+    ('unlink_certificates_from_customer', 'POST', '/api/v2/companies/{companyId}/customers/{customerCode}/certificates/unlink', 'companyId customerCode model'),
+    ('update_customer', 'PUT', '/api/v2/companies/{companyId}/customers/{customerCode}', 'companyId customerCode model'),
+    ('update_custom_fields', 'PUT', '/api/v2/companies/{companyId}/customers/{customerCode}/custom-fields', 'companyId customerCode model'),
+    ('create_e_commerce_token', 'POST', '/api/v2/companies/{companyId}/ecommercetokens', 'companyId model'),
+    ('refresh_e_commerce_token', 'PUT', '/api/v2/companies/{companyId}/ecommercetokens', 'companyId model'),
+)
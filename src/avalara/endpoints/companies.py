@@ -0,0 +1,130 @@
+"""
+AvaTax Software Development Kit for Python.
+
+   Copyright 2019 Avalara, Inc.
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+
+Client methods of the companies group: companies and their settings, contacts, cost centers,
+data sources, GL accounts, vendors and other company resources.
+See avalara.client_methods.
+"""
+
+ENDPOINTS = (
+    ('create_a_p_config_setting', 'POST', '/api/v2/companies/{companyid}/apconfigsetting', 'companyid model'),
+    ('get_a_p_config_setting_by_company', 'GET', '/api/v2/companies/{companyid}/apconfigsetting', 'companyid include'),
+    ('query_a_p_config_setting', 'GET', '/api/v2/apconfigsetting', 'include'),
+    ('update_a_p_config_setting', 'PUT', '/api/v2/companies/{companyid}/apconfigsetting', 'companyid model'),
+    ('create_ava_file_forms', 'POST', '/api/v2/avafileforms', 'model'),
+    ('delete_ava_file_form', 'DELETE', '/api/v2/avafileforms/{id_}', 'id_'),
+    ('get_ava_file_form', 'GET', '/api/v2/avafileforms/{id_}', 'id_'),
+    ('query_ava_file_forms', 'GET', '/api/v2/avafileforms', 'include'),
+    ('update_ava_file_form', 'PUT', '/api/v2/avafileforms/{id_}', 'id_ model'),
+    ('list_location_by_account', 'GET', '/api/v2/companies/{accountId}/clerk/locations', 'accountId include'),
+    ('certify_integration', 'GET', '/api/v2/companies/{id_}/certify', 'id_'),
+    ('change_filing_status', 'POST', '/api/v2/companies/{id_}/filingstatus', 'id_ model'),
+    ('company_initialize', 'POST', '/api/v2/companies/initialize', 'model'),
+    ('create_companies', 'POST', '/api/v2/companies', 'model'),
+    ('create_company_parameters', 'POST', '/api/v2/companies/{companyId}/parameters', 'companyId model'),
+    ('create_funding_request', 'POST', '/api/v2/companies/{id_}/funding/setup', 'id_ model include'),
+    ('create_vat_numbers', 'POST', '/api/v2/companies/{companyId}/vatnumbers', 'companyId model'),
+    ('delete_company', 'DELETE', '/api/v2/companies/{id_}', 'id_'),
+    ('delete_company_parameter', 'DELETE', '/api/v2/companies/{companyId}/parameters/{id_}', 'companyId id_'),
+    ('delete_vat_number', 'DELETE', '/api/v2/companies/{companyId}/vatnumbers/{id_}', 'companyId id_'),
+    ('funding_configuration_by_company', 'GET', '/api/v2/companies/{companyId}/funding/configuration', 'companyId'),
+    ('funding_configurations_by_company_and_currency', 'GET', '/api/v2/companies/{companyId}/funding/configurations', 'companyId include'),
+    ('get_all_customers_and_suppliers_with_country_params', 'GET', '/api/v2/companies/{companyId}/supplierandcustomers/withcountryparams', 'companyId include'),
+    ('get_company', 'GET', '/api/v2/companies/{id_}', 'id_ include'),
+    ('get_company_configuration', 'GET', '/api/v2/companies/{id_}/configuration', 'id_'),
+    ('get_company_parameter_detail', 'GET', '/api/v2/companies/{companyId}/parameters/{id_}', 'companyId id_'),
+    ('get_filing_status', 'GET', '/api/v2/companies/{id_}/filingstatus', 'id_'),
+    ('get_vat_number', 'GET', '/api/v2/companies/{companyId}/vatnumbers/{id_}', 'companyId id_'),
+    ('list_a_c_h_entry_details_for_company', 'GET', '/api/v2/companies/{id_}/paymentdetails/{periodyear}/{periodmonth}', 'id_ periodyear periodmonth'),
+    ('list_company_parameter_details', 'GET', '/api/v2/companies/{companyId}/parameters', 'companyId include'),
+    ('list_funding_requests_by_company', 'GET', '/api/v2/companies/{id_}/funding', 'id_'),
+    ('list_mrs_companies', 'GET', '/api/v2/companies/mrs', ''),
+    ('list_vat_numbers', 'GET', '/api/v2/companies/{companyId}/vatnumbers', 'companyId include'),
+    ('query_companies', 'GET', '/api/v2/companies', 'include'),
+    ('set_company_configuration', 'POST', '/api/v2/companies/{id_}/configuration', 'id_ model'),
+    ('update_company', 'PUT', '/api/v2/companies/{id_}', 'id_ model'),
+    ('update_company_parameter_detail', 'PUT', '/api/v2/companies/{companyId}/parameters/{id_}', 'companyId id_ model'),
+    ('update_vat_number', 'PUT', '/api/v2/companies/{companyId}/vatnumbers/{id_}', 'companyId id_ model'),
+    ('validate_vat_number', 'POST', '/api/v2/companies/{companyId}/vatnumbers/validate', 'companyId model'),
+    ('query_juris_names', 'GET', '/api/v2/compliance/jurisnames/{country}/{region}', 'country region include'),
+    ('query_rate_options', 'GET', '/api/v2/compliance/rateOptions/{country}/{region}', 'country region include'),
+    ('query_state_config', 'GET', '/api/v2/compliance/stateconfig', 'include'),
+    ('query_state_reporting_codes', 'GET', '/api/v2/compliance/stateReportingCodes/{country}/{region}', 'country region include'),
+    ('query_tax_type_mappings', 'GET', '/api/v2/compliance/taxtypemappings', 'include'),
+    ('create_contacts', 'POST', '/api/v2/companies/{companyId}/contacts', 'companyId model'),
+    ('delete_contact', 'DELETE', '/api/v2/companies/{companyId}/contacts/{id_}', 'companyId id_'),
+    ('get_contact', 'GET', '/api/v2/companies/{companyId}/contacts/{id_}', 'companyId id_'),
+    ('list_contacts_by_company', 'GET', '/api/v2/companies/{companyId}/contacts', 'companyId include'),
+    ('query_contacts', 'GET', '/api/v2/contacts', 'include'),
+    ('update_contact', 'PUT', '/api/v2/companies/{companyId}/contacts/{id_}', 'companyId id_ model'),
+    ('bulk_upload_cost_centers', 'POST', '/api/v2/companies/{companyid}/costcenters/$upload', 'companyid model'),
+    ('create_cost_center', 'POST', '/api/v2/companies/{companyid}/costcenters', 'companyid model'),
+    ('delete_cost_center', 'DELETE', '/api/v2/companies/{companyid}/costcenters/{costcenterid}', 'companyid costcenterid'),
+    ('get_cost_center_by_id', 'GET', '/api/v2/companies/{companyid}/costcenters/{costcenterid}', 'companyid costcenterid'),
+    ('list_cost_centers_by_company', 'GET', '/api/v2/companies/{companyid}/costcenters', 'companyid include'),
+    ('query_cost_centers', 'GET', '/api/v2/costcenters', 'include'),
+    ('update_cost_center', 'PUT', '/api/v2/companies/{companyid}/costcenters/{costcenterid}', 'companyid costcenterid model'),
+    ('create_data_sources', 'POST', '/api/v2/companies/{companyId}/datasources', 'companyId model'),
+    ('delete_data_source', 'DELETE', '/api/v2/companies/{companyId}/datasources/{id_}', 'companyId id_'),
+    ('get_data_source_by_id', 'GET', '/api/v2/companies/{companyId}/datasources/{id_}', 'companyId id_'),
+    ('list_data_sources', 'GET', '/api/v2/companies/{companyId}/datasources', 'companyId include'),
+    ('query_data_sources', 'GET', '/api/v2/datasources', 'include'),
+    ('update_data_source', 'PUT', '/api/v2/companies/{companyId}/datasources/{id_}', 'companyId id_ model'),
+    ('create_distance_threshold', 'POST', '/api/v2/companies/{companyId}/distancethresholds', 'companyId model'),
+    ('delete_distance_threshold', 'DELETE', '/api/v2/companies/{companyId}/distancethresholds/{id_}', 'companyId id_'),
+    ('get_distance_threshold', 'GET', '/api/v2/companies/{companyId}/distancethresholds/{id_}', 'companyId id_'),
+    ('list_distance_thresholds', 'GET', '/api/v2/companies/{companyId}/distancethresholds', 'companyId include'),
+    ('query_distance_thresholds', 'GET', '/api/v2/distancethresholds', 'include'),
+    ('update_distance_threshold', 'PUT', '/api/v2/companies/{companyId}/distancethresholds/{id_}', 'companyId id_ model'),
+    ('create_dcv', 'POST', '/api/v2/domain-control-verifications', 'model'),
+    ('filter_dcv', 'GET', '/api/v2/domain-control-verifications', 'include'),
+    ('get_dcv_by_id', 'GET', '/api/v2/domain-control-verifications/{domainControlVerificationId}', 'domainControlVerificationId'),
+    ('delete_afc_event_notifications', 'DELETE', '/api/v2/event-notifications/afc', 'model include'),
+    ('delete_event_notifications', 'DELETE', '/api/v2/event-notifications/companies/{companyId}', 'companyId model'),
+    ('get_event_notifications', 'GET', '/api/v2/event-notifications/companies/{companyId}', 'companyId'),
+    ('list_afc_event_notifications', 'GET', '/api/v2/event-notifications/afc', 'include'),
+    ('get_eco_nexus_thresholds', 'GET', '/api/v2/companies/{companyId}/econexusthresholds', 'companyId include'),
+    ('resolve_form_type_task', 'GET', '/api/v2/form-type-mappings/resolve-task', 'include'),
+    ('activate_funding_request', 'GET', '/api/v2/fundingrequests/{id_}/widget', 'id_ include'),
+    ('funding_request_status', 'GET', '/api/v2/fundingrequests/{id_}', 'id_ include'),
+    ('bulk_upload_g_l_accounts', 'POST', '/api/v2/companies/{companyid}/glaccounts/$upload', 'companyid model'),
+    ('create_g_l_account', 'POST', '/api/v2/companies/{companyid}/glaccounts', 'companyid model'),
+    ('delete_g_l_account', 'DELETE', '/api/v2/companies/{companyid}/glaccounts/{glaccountid}', 'companyid glaccountid'),
+    ('get_g_l_account_by_id', 'GET', '/api/v2/companies/{companyid}/glaccounts/{glaccountid}', 'companyid glaccountid'),
+    ('list_g_l_accounts_by_company', 'GET', '/api/v2/companies/{companyid}/glaccounts', 'companyid include'),
+    ('update_g_l_account', 'PUT', '/api/v2/companies/{companyid}/glaccounts/{glaccountid}', 'companyid glaccountid model'),
+    ('create_reverse_sync_registration', 'POST', '/api/v2/connector-sync/companies/{companyId}/registrations', 'companyId model'),
+    ('delete_reverse_sync_registration', 'DELETE', '/api/v2/connector-sync/companies/{companyId}/registrations/{registrationId}', 'companyId registrationId'),
+    ('get_reverse_sync_registration', 'GET', '/api/v2/connector-sync/companies/{companyId}/registrations/{registrationId}', 'companyId registrationId'),
+    ('list_reverse_sync_registrations', 'GET', '/api/v2/connector-sync/companies/{companyId}/registrations', 'companyId'),
+    ('update_reverse_sync_registration', 'PATCH', '/api/v2/connector-sync/companies/{companyId}/registrations/{registrationId}', 'companyId registrationId model'),
+    ('create_settings', 'POST', '/api/v2/companies/{companyId}/settings', 'companyId model'),
+    ('delete_setting', 'DELETE', '/api/v2/companies/{companyId}/settings/{id_}', 'companyId id_'),
+    ('get_setting', 'GET', '/api/v2/companies/{companyId}/settings/{id_}', 'companyId id_'),
+    ('list_settings_by_company', 'GET', '/api/v2/companies/{companyId}/settings', 'companyId include'),
+    ('query_settings', 'GET', '/api/v2/settings', 'include'),
+    ('update_setting', 'PUT', '/api/v2/companies/{companyId}/settings/{id_}', 'companyId id_ model'),
+    ('delete_user_defined_field', 'DELETE', '/api/v2/companies/{companyId}/userdefinedfields/{id_}', 'companyId id_'),
+    ('list_user_defined_fields_by_company_id', 'GET', '/api/v2/companies/{companyId}/userdefinedfields', 'companyId include'),
+    ('update_user_defined_field', 'POST', '/api/v2/companies/{companyId}/userdefinedfields', 'companyId model include'),
+    ('create_vendors', 'POST', '/api/v2/companies/{companyId}/vendors', 'companyId model'),
+    ('delete_vendor', 'DELETE', '/api/v2/companies/{companyId}/vendors/{vendorCode}', 'companyId vendorCode'),
+    ('get_vendor', 'GET', '/api/v2/companies/{companyId}/vendors/{vendorCode}', 'companyId vendorCode include'),
+    ('list_certificates_for_vendor', 'GET', '/api/v2/companies/{companyId}/vendors/{vendorCode}/certificates', 'companyId vendorCode include'),
+    ('query_vendors', 'GET', '/api/v2/companies/{companyId}/vendors', 'companyId include'),
+    ('update_vendor', 'PUT', '/api/v2/companies/{companyId}/vendors/{vendorCode}', 'companyId vendorCode model'),
+)
@@ -0,0 +1,100 @@
+"""
+AvaTax Software Development Kit for Python.
+
+   Copyright 2019 Avalara, Inc.
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+
+Client methods of the definitions group: lists of AvaTax codes, jurisdictions and other reference data.
+See avalara.client_methods.
+"""
+
+ENDPOINTS = (
+    ('get_cross_border_code', 'GET', '/api/v2/definitions/crossborder/{country}/{hsCode}/hierarchy', 'country hsCode'),
+    ('list_all_marketplace_locations', 'GET', '/api/v2/definitions/listallmarketplacelocations', 'include'),
+    ('list_all_unit_of_basis', 'GET', '/api/v2/definitions/unitofbasis', 'include'),
+    ('list_ava_file_forms', 'GET', '/api/v2/definitions/avafileforms', 'include'),
+    ('list_certificate_attributes', 'GET', '/api/v2/definitions/certificateattributes', 'include'),
+    ('list_certificate_exempt_reasons', 'GET', '/api/v2/definitions/certificateexemptreasons', 'include'),
+    ('list_certificate_exposure_zones', 'GET', '/api/v2/definitions/certificateexposurezones', 'include'),
+    ('list_classification_parameters_usage', 'GET', '/api/v2/definitions/classification/parametersusage', 'include'),
+    ('list_communications_service_types', 'GET', '/api/v2/definitions/communications/transactiontypes/{id_}/servicetypes', 'id_ include'),
+    ('list_communications_transaction_types', 'GET', '/api/v2/definitions/communications/transactiontypes', 'include'),
+    ('list_communications_t_s_pairs', 'GET', '/api/v2/definitions/communications/tspairs', 'include'),
+    ('list_countries', 'GET', '/api/v2/definitions/countries', 'include'),
+    ('list_cover_letters', 'GET', '/api/v2/definitions/coverletters', 'include'),
+    ('list_cross_border_codes', 'GET', '/api/v2/definitions/crossborder/{country}/{hsCode}', 'country hsCode include'),
+    ('list_cross_border_sections', 'GET', '/api/v2/definitions/crossborder/sections', ''),
+    ('list_currencies', 'GET', '/api/v2/definitions/currencies', 'include'),
+    ('list_entity_use_codes', 'GET', '/api/v2/definitions/entityusecodes', 'include'),
+    ('list_filing_frequencies', 'GET', '/api/v2/definitions/filingfrequencies', 'include'),
+    ('list_item_h_s_code_classification_status', 'GET', '/api/v2/definitions/items/hscode-classification-status', ''),
+    ('list_item_reverse_sync_events', 'GET', '/api/v2/definitions/items/events', ''),
+    ('list_items_recommendations_status', 'GET', '/api/v2/definitions/items/recommendationstatus', ''),
+    ('list_items_status', 'GET', '/api/v2/definitions/items/status', ''),
+    ('list_jurisdictions', 'GET', '/api/v2/definitions/jurisdictions', 'include'),
+    ('list_jurisdictions_by_address', 'GET', '/api/v2/definitions/jurisdictionsnearaddress', 'include'),
+    ('list_jurisdictions_by_rate_type_tax_type_mapping', 'GET', '/api/v2/definitions/jurisdictions/countries/{country}/taxtypes/{taxTypeId}/taxsubtypes/{taxSubTypeId}', 'country taxTypeId taxSubTypeId include'),
+    ('list_jurisdictions_hierarchy', 'GET', '/api/v2/definitions/jurisdictions/hierarchy', 'include'),
+    ('list_jurisdiction_tax_types_and_sub_types', 'GET', '/api/v2/definitions/jurisdictions/{country}/{region}/{jurisdictionTypeId}/{jurisdictionCode}/taxTypesAndSubTypes', 'country region jurisdictionTypeId jurisdictionCode include'),
+    ('list_jurisdiction_types_by_rate_type_tax_type_mapping', 'GET', '/api/v2/definitions/jurisdictionTypes/countries/{country}/taxtypes/{taxTypeId}/taxsubtypes/{taxSubTypeId}', 'country taxTypeId taxSubTypeId include'),
+    ('list_location_questions_by_address', 'GET', '/api/v2/definitions/locationquestions', 'include'),
+    ('list_marketplace_locations', 'GET', '/api/v2/definitions/marketplacelocations', 'include'),
+    ('list_nexus', 'GET', '/api/v2/definitions/nexus', 'include'),
+    ('list_nexus_by_address', 'GET', '/api/v2/definitions/nexus/byaddress', 'include'),
+    ('list_nexus_by_country', 'GET', '/api/v2/definitions/nexus/{country}', 'country include'),
+    ('list_nexus_by_country_and_region', 'GET', '/api/v2/definitions/nexus/{country}/{region}', 'country region include'),
+    ('list_nexus_by_form_code', 'GET', '/api/v2/definitions/nexus/byform/{formCode}', 'formCode'),
+    ('list_nexus_by_tax_type_group', 'GET', '/api/v2/definitions/nexus/bytaxtypegroup/{taxTypeGroup}', 'taxTypeGroup include'),
+    ('list_nexus_tax_type_groups', 'GET', '/api/v2/definitions/nexustaxtypegroups', 'include'),
+    ('list_notice_customer_funding_options', 'GET', '/api/v2/definitions/noticecustomerfundingoptions', 'include'),
+    ('list_notice_customer_types', 'GET', '/api/v2/definitions/noticecustomertypes', 'include'),
+    ('list_notice_filingtypes', 'GET', '/api/v2/definitions/noticefilingtypes', 'include'),
+    ('list_notice_priorities', 'GET', '/api/v2/definitions/noticepriorities', 'include'),
+    ('list_notice_reasons', 'GET', '/api/v2/definitions/noticereasons', 'include'),
+    ('list_notice_responsibilities', 'GET', '/api/v2/definitions/noticeresponsibilities', 'include'),
+    ('list_notice_root_causes', 'GET', '/api/v2/definitions/noticerootcauses', 'include'),
+    ('list_notice_statuses', 'GET', '/api/v2/definitions/noticestatuses', 'include'),
+    ('list_notice_types', 'GET', '/api/v2/definitions/noticetypes', 'include'),
+    ('list_parameters', 'GET', '/api/v2/definitions/parameters', 'include'),
+    ('list_parameters_by_account', 'GET', '/api/v2/definitions/accounts/{accountId}/parameters', 'accountId include'),
+    ('list_parameters_by_item', 'GET', '/api/v2/definitions/parameters/byitem/{companyCode}/{itemCode}', 'companyCode itemCode include'),
+    ('list_parameters_usage', 'GET', '/api/v2/definitions/parametersusage', 'include'),
+    ('list_permissions', 'GET', '/api/v2/definitions/permissions', 'include'),
+    ('list_postal_codes', 'GET', '/api/v2/definitions/postalcodes', 'include'),
+    ('list_preferred_programs', 'GET', '/api/v2/definitions/preferredprograms', 'include'),
+    ('list_product_classification_systems', 'GET', '/api/v2/definitions/productclassificationsystems', 'include'),
+    ('list_product_classification_systems_by_company', 'GET', '/api/v2/definitions/productclassificationsystems/bycompany/{companyCode}', 'companyCode include'),
+    ('list_rate_types_by_country', 'GET', '/api/v2/definitions/countries/{country}/ratetypes', 'country include'),
+    ('list_rate_types_by_country_tax_type_tax_sub_type', 'GET', '/api/v2/definitions/countries/{country}/taxtypes/{taxTypeId}/taxsubtypes/{taxSubTypeId}/ratetypes', 'country taxTypeId taxSubTypeId include'),
+    ('list_regions', 'GET', '/api/v2/definitions/regions', 'include'),
+    ('list_regions_by_country', 'GET', '/api/v2/definitions/countries/{country}/regions', 'country include'),
+    ('list_regions_by_country_and_tax_type_and_tax_sub_type_and_rate_type', 'GET', '/api/v2/definitions/companies/{companyId}/countries/{country}/regions/taxtypes/{taxTypeId}/taxsubtypes/{taxSubTypeId}/rateTypeId/{rateTypeId}/jurisdictionTypeId/{jurisdictionTypeId}', 'companyId country taxTypeId taxSubTypeId rateTypeId jurisdictionTypeId include'),
+    ('list_returns_parameters_usage', 'GET', '/api/v2/definitions/returns/parametersusage', 'include'),
+    ('list_security_roles', 'GET', '/api/v2/definitions/securityroles', 'include'),
+    ('list_subscription_types', 'GET', '/api/v2/definitions/subscriptiontypes', 'include'),
+    ('list_tags', 'GET', '/api/v2/definitions/tags', 'include'),
+    ('list_tax_authorities', 'GET', '/api/v2/definitions/taxauthorities', 'include'),
+    ('list_tax_authority_forms', 'GET', '/api/v2/definitions/taxauthorityforms', 'include'),
+    ('list_tax_authority_types', 'GET', '/api/v2/definitions/taxauthoritytypes', 'include'),
+    ('list_tax_codes', 'GET', '/api/v2/definitions/taxcodes', 'include'),
+    ('list_tax_code_types', 'GET', '/api/v2/definitions/taxcodetypes', 'include'),
+    ('list_tax_forms', 'GET', '/api/v2/definitions/taxforms', 'include'),
+    ('list_tax_sub_types', 'GET', '/api/v2/definitions/taxsubtypes', 'include'),
+    ('list_tax_sub_types_by_country_and_tax_type', 'GET', '/api/v2/definitions/taxsubtypes/countries/{country}/taxtypes/{taxTypeId}', 'country taxTypeId include'),
+    ('list_tax_sub_types_by_jurisdiction_and_region', 'GET', '/api/v2/definitions/taxsubtypes/{jurisdictionCode}/{region}', 'jurisdictionCode region include'),
+    ('list_tax_type_groups', 'GET', '/api/v2/definitions/taxtypegroups', 'include'),
+    ('list_tax_types_by_nexus_and_country', 'GET', '/api/v2/definitions/taxtypes/countries/{country}', 'country include'),
+    ('list_unit_of_basis_by_country_and_tax_type_and_tax_sub_type_and_rate_type', 'GET', '/api/v2/definitions/unitofbasis/countries/{country}/taxtypes/{taxTypeId}/taxsubtypes/{taxSubTypeId}', 'country taxTypeId taxSubTypeId include'),
+    ('list_unit_of_measurement', 'GET', '/api/v2/definitions/unitofmeasurements', 'include'),
+)
@@ -0,0 +1,88 @@
+"""
+AvaTax Software Development Kit for Python.
+
+   Copyright 2019 Avalara, Inc.
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+
+Client methods of the items group: items, item classifications and UPCs.
+See avalara.client_methods.
+"""
+
+ENDPOINTS = (
+    ('a_isearch', 'POST', '/api/v2/companies/{companyId}/items/nlq/$parse', 'companyId model'),
+    ('batch_delete_item_classifications', 'DELETE', '/api/v2/companies/{companyId}/items/{itemId}/classifications', 'companyId itemId'),
+    ('batch_delete_item_custom_parameters', 'DELETE', '/api/v2/companies/{companyId}/items/{itemId}/custom-parameters', 'companyId itemId'),
+    ('batch_delete_item_parameters', 'DELETE', '/api/v2/companies/{companyId}/items/{itemId}/parameters', 'companyId itemId'),
+    ('bulk_upload_items', 'POST', '/api/v2/companies/{companyId}/items/upload', 'companyId model'),
+    ('create_item_classifications', 'POST', '/api/v2/companies/{companyId}/items/{itemId}/classifications', 'companyId itemId model'),
+    ('create_item_custom_parameters', 'POST', '/api/v2/companies/{companyId}/items/{itemId}/custom-parameters', 'companyId itemId model'),
+    ('create_item_parameters', 'POST', '/api/v2/companies/{companyId}/items/{itemId}/parameters', 'companyId itemId model'),
+    ('create_items', 'POST', '/api/v2/companies/{companyId}/items', 'companyId model include'),
+    ('create_item_tags', 'POST', '/api/v2/companies/{companyId}/items/{itemId}/tags', 'companyId itemId model'),
+    ('create_taxcode_batch', 'POST', '/api/v2/companies/{companyId}/taxcode-recommendations/batches', 'companyId model'),
+    ('create_tax_code_classification_request', 'POST', '/api/v2/companies/{companyId}/classificationrequests/taxcode', 'companyId model'),
+    ('delete_batch_tax_code_recommendations', 'DELETE', '/api/v2/companies/{companyId}/taxcode-recommendations/batches/{batchId}', 'companyId batchId'),
+    ('delete_catalogue_item', 'DELETE', '/api/v2/companies/{companyId}/itemcatalogue/{itemCode}', 'companyId itemCode'),
+    ('delete_h_s_code_classification_status', 'DELETE', '/api/v2/companies/{companyId}/items/{itemId}/hscode-classifications-status/{id_}', 'companyId itemId id_'),
+    ('delete_item', 'DELETE', '/api/v2/companies/{companyId}/items/{id_}', 'companyId id_'),
+    ('delete_item_classification', 'DELETE', '/api/v2/companies/{companyId}/items/{itemId}/classifications/{id_}', 'companyId itemId id_'),
+    ('delete_item_custom_parameter', 'DELETE', '/api/v2/companies/{companyId}/items/{itemId}/custom-parameters/{id_}', 'companyId itemId id_'),
+    ('delete_item_image', 'DELETE', '/api/v2/companies/{companyId}/items/{itemId}/images/{imageId}', 'companyId itemId imageId'),
+    ('delete_item_parameter', 'DELETE', '/api/v2/companies/{companyId}/items/{itemId}/parameters/{id_}', 'companyId itemId id_'),
+    ('delete_item_tag', 'DELETE', '/api/v2/companies/{companyId}/items/{itemId}/tags/{itemTagDetailId}', 'companyId itemId itemTagDetailId'),
+    ('delete_item_tags', 'DELETE', '/api/v2/companies/{companyId}/items/{itemId}/tags', 'companyId itemId'),
+    ('dismiss_h_s_code_classification_status', 'PUT', '/api/v2/companies/{companyId}/items/{itemId}/hscode-classifications-status/$dismiss', 'companyId itemId include'),
+    ('fetch_additional_h_s_code_duty_details', 'POST', '/api/v2/companies/{companyId}/items/{itemId}/hsdutydetails/$fetch-additional-hsdutydetails', 'companyId itemId model'),
+    ('get_batch_tax_code_recommendations', 'GET', '/api/v2/companies/{companyId}/taxcode-recommendations/batches/{batchId}', 'companyId batchId'),
+    ('get_h_s_code_classification_s_l_a', 'GET', '/api/v2/companies/{companyId}/items/hscode-classification/$get-sla', 'companyId'),
+    ('get_item', 'GET', '/api/v2/companies/{companyId}/items/{id_}', 'companyId id_ include'),
+    ('get_item_classification', 'GET', '/api/v2/companies/{companyId}/items/{itemId}/classifications/{id_}', 'companyId itemId id_'),
+    ('get_item_custom_parameter', 'GET', '/api/v2/companies/{companyId}/items/{itemId}/custom-parameters/{id_}', 'companyId itemId id_'),
+    ('get_item_parameter', 'GET', '/api/v2/companies/{companyId}/items/{itemId}/parameters/{id_}', 'companyId itemId id_'),
+    ('get_item_tags', 'GET', '/api/v2/companies/{companyId}/items/{itemId}/tags', 'companyId itemId include'),
+    ('get_item_tax_code_recommendations', 'GET', '/api/v2/companies/{companyId}/items/{itemId}/taxcoderecommendations', 'companyId itemId'),
+    ('get_premium_classification', 'GET', '/api/v2/companies/{companyId}/items/{itemCode}/premiumClassification/{systemCode}', 'companyId itemCode systemCode include'),
+    ('get_product_image', 'GET', '/api/v2/companies/{companyId}/items/{itemId}/images/{imageId}', 'companyId itemId imageId'),
+    ('get_sync_tax_code_recommendations', 'POST', '/api/v2/companies/{companyId}/$taxcode-recommendations', 'companyId model'),
+    ('initiate_h_s_code_classification', 'POST', '/api/v2/companies/{companyId}/items/$initiate-hscode-classification', 'companyId model'),
+    ('list_import_restrictions', 'GET', '/api/v2/companies/{companyId}/items/{itemCode}/restrictions/import/{countryOfImport}', 'companyId itemCode countryOfImport include'),
+    ('list_item_classifications', 'GET', '/api/v2/companies/{companyId}/items/{itemId}/classifications', 'companyId itemId include'),
+    ('list_item_custom_parameters', 'GET', '/api/v2/companies/{companyId}/items/{itemId}/custom-parameters', 'companyId itemId include'),
+    ('list_item_parameters', 'GET', '/api/v2/companies/{companyId}/items/{itemId}/parameters', 'companyId itemId include'),
+    ('list_item_premium_classifications', 'GET', '/api/v2/companies/{companyId}/items/{itemCode}/premiumClassifications', 'companyId itemCode include'),
+    ('list_items_by_company', 'GET', '/api/v2/companies/{companyId}/items', 'companyId include'),
+    ('list_recommended_parameter_by_company_id_and_item_id', 'GET', '/api/v2/definitions/companies/{companyId}/items/{itemId}/parameters', 'companyId itemId include'),
+    ('patch_item', 'PATCH', '/api/v2/companies/{companyId}/items/{id_}', 'companyId id_ model'),
+    ('query_items', 'GET', '/api/v2/items', 'include'),
+    ('query_items_by_system_code', 'POST', '/api/v2/companies/{companyId}/items/internal/bySystemCode/{systemCode}', 'companyId systemCode model include'),
+    ('query_items_by_tag', 'GET', '/api/v2/companies/{companyId}/items/bytags/{tag}', 'companyId tag include'),
+    ('sync_item_catalogue', 'POST', '/api/v2/companies/{companyId}/itemcatalogue', 'companyId model'),
+    ('sync_items', 'POST', '/api/v2/companies/{companyId}/items/sync', 'companyId model'),
+    ('update_image', 'PUT', '/api/v2/companies/{companyId}/items/{itemId}/images/{imageId}', 'companyId itemId imageId'),
+    ('update_item', 'PUT', '/api/v2/companies/{companyId}/items/{id_}', 'companyId id_ model include'),
+    ('update_item_classification', 'PUT', '/api/v2/companies/{companyId}/items/{itemId}/classifications/{id_}', 'companyId itemId id_ model'),
+    ('update_item_custom_parameter', 'PUT', '/api/v2/companies/{companyId}/items/{itemId}/custom-parameters/{id_}', 'companyId itemId id_ model'),
+    ('update_item_parameter', 'PUT', '/api/v2/companies/{companyId}/items/{itemId}/parameters/{id_}', 'companyId itemId id_ model'),
+    ('upload_image', 'POST', '/api/v2/companies/{companyId}/items/{itemId}/images', 'companyId itemId'),
+    ('upsert_item_classifications', 'PUT', '/api/v2/companies/{companyId}/items/{itemId}/classifications', 'companyId itemId model'),
+    ('upsert_item_custom_parameter', 'PUT', '/api/v2/companies/{companyId}/items/{itemId}/custom-parameters', 'companyId itemId model'),
+    ('upsert_item_parameter', 'PUT', '/api/v2/companies/{companyId}/items/{itemId}/parameters', 'companyId itemId model'),
+    ('verify_h_s_code', 'POST', '/api/v2/companies/{companyId}/items/hscodes/$verify', 'companyId model'),
+    ('create_u_p_cs', 'POST', '/api/v2/companies/{companyId}/upcs', 'companyId model'),
+    ('delete_u_p_c', 'DELETE', '/api/v2/companies/{companyId}/upcs/{id_}', 'companyId id_'),
+    ('get_u_p_c', 'GET', '/api/v2/companies/{companyId}/upcs/{id_}', 'companyId id_'),
+    ('list_u_p_cs_by_company', 'GET', '/api/v2/companies/{companyId}/upcs', 'companyId include'),
+    ('query_u_p_cs', 'GET', '/api/v2/upcs', 'include'),
+    ('update_u_p_c', 'PUT', '/api/v2/companies/{companyId}/upcs/{id_}', 'companyId id_ model'),
+)
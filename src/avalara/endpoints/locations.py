@@ -0,0 +1,35 @@
+"""
+AvaTax Software Development Kit for Python.
+
+   Copyright 2019 Avalara, Inc.
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+
+Client methods of the locations group: company locations.
+See avalara.client_methods.
+"""
+
+ENDPOINTS = (
+    ('create_location_parameters', 'POST', '/api/v2/companies/{companyId}/locations/{locationId}/parameters', 'companyId locationId model'),
+    ('create_locations', 'POST', '/api/v2/companies/{companyId}/locations', 'companyId model'),
+    ('delete_location', 'DELETE', '/api/v2/companies/{companyId}/locations/{id_}', 'companyId id_'),
+    ('delete_location_parameter', 'DELETE', '/api/v2/companies/{companyId}/locations/{locationId}/parameters/{id_}', 'companyId locationId id_'),
+    ('get_location', 'GET', '/api/v2/companies/{companyId}/locations/{id_}', 'companyId id_ include'),
+    ('get_location_parameter', 'GET', '/api/v2/companies/{companyId}/locations/{locationId}/parameters/{id_}', 'companyId locationId id_'),
+    ('list_location_parameters', 'GET', '/api/v2/companies/{companyId}/locations/{locationId}/parameters', 'companyId locationId include'),
+    ('list_locations_by_company', 'GET', '/api/v2/companies/{companyId}/locations', 'companyId include'),
+    ('query_locations', 'GET', '/api/v2/locations', 'include'),
+    ('update_location', 'PUT', '/api/v2/companies/{companyId}/locations/{id_}', 'companyId id_ model'),
+    ('update_location_parameter', 'PUT', '/api/v2/companies/{companyId}/locations/{locationId}/parameters/{id_}', 'companyId locationId id_ model'),
+    ('validate_location', 'GET', '/api/v2/companies/{companyId}/locations/{id_}/validate', 'companyId id_'),
+)
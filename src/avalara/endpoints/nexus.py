@@ -0,0 +1,38 @@
+"""
+AvaTax Software Development Kit for Python.
+
+   Copyright 2019 Avalara, Inc.
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+
+Client methods of the nexus group: nexus declarations.
+See avalara.client_methods.
+"""
+
+ENDPOINTS = (
+    ('create_nexus', 'POST', '/api/v2/companies/{companyId}/nexus', 'companyId model'),
+    ('create_nexus_parameters', 'POST', '/api/v2/companies/{companyId}/nexus/{nexusId}/parameters', 'companyId nexusId model'),
+    ('declare_nexus_by_address', 'POST', '/api/v2/companies/{companyId}/nexus/byaddress', 'companyId model'),
+    ('delete_nexus', 'DELETE', '/api/v2/companies/{companyId}/nexus/{id_}', 'companyId id_ include'),
+    ('delete_nexus_parameter', 'DELETE', '/api/v2/companies/{companyId}/nexus/{nexusId}/parameters/{id_}', 'companyId nexusId id_'),
+    ('delete_nexus_parameters', 'DELETE', '/api/v2/companies/{companyId}/nexus/{nexusId}/parameters', 'companyId nexusId'),
+    ('get_nexus', 'GET', '/api/v2/companies/{companyId}/nexus/{id_}', 'companyId id_ include'),
+    ('get_nexus_by_form_code', 'GET', '/api/v2/companies/{companyId}/nexus/byform/{formCode}', 'companyId formCode include'),
+    ('get_nexus_parameter', 'GET', '/api/v2/companies/{companyId}/nexus/{nexusId}/parameters/{id_}', 'companyId nexusId id_'),
+    ('list_nexus_by_company', 'GET', '/api/v2/companies/{companyId}/nexus', 'companyId include'),
+    ('list_nexus_by_company_and_tax_type_group', 'GET', '/api/v2/companies/{companyId}/nexus/byTaxTypeGroup/{taxTypeGroup}', 'companyId taxTypeGroup include'),
+    ('list_nexus_parameters', 'GET', '/api/v2/companies/{companyId}/nexus/{nexusId}/parameters', 'companyId nexusId include'),
+    ('query_nexus', 'GET', '/api/v2/nexus', 'include'),
+    ('update_nexus', 'PUT', '/api/v2/companies/{companyId}/nexus/{id_}', 'companyId id_ model'),
+    ('update_nexus_parameter', 'PUT', '/api/v2/companies/{companyId}/nexus/{nexusId}/parameters/{id_}', 'companyId nexusId id_ model'),
+)
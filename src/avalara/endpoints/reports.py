@@ -0,0 +1,30 @@
+"""
+AvaTax Software Development Kit for Python.
+
+   Copyright 2019 Avalara, Inc.
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+
+Client methods of the reports group: reports.
+See avalara.client_methods.
+"""
+
+ENDPOINTS = (
+    ('download_audit_log_report', 'GET', '/api/v2/reports/exportauditlogs/{id_}/attachment', 'id_'),
+    ('download_report', 'GET', '/api/v2/reports/{id_}/attachment', 'id_'),
+    ('export_audit_logs', 'POST', '/api/v2/reports/exportauditlogs', 'model'),
+    ('get_audit_log_report', 'GET', '/api/v2/reports/exportauditlogs/{id_}', 'id_'),
+    ('get_report', 'GET', '/api/v2/reports/{id_}', 'id_'),
+    ('initiate_export_document_line_report', 'POST', '/api/v2/companies/{companyId}/reports/exportdocumentline/initiate', 'companyId model'),
+    ('list_reports', 'GET', '/api/v2/reports', 'include'),
+)
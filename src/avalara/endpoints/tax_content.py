@@ -0,0 +1,29 @@
+"""
+AvaTax Software Development Kit for Python.
+
+   Copyright 2019 Avalara, Inc.
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+
+Client methods of the tax_content group: tax content files and tax rates.
+See avalara.client_methods.
+"""
+
+ENDPOINTS = (
+    ('build_tax_content_file', 'POST', '/api/v2/pointofsaledata/build', 'model'),
+    ('build_tax_content_file_for_location', 'GET', '/api/v2/companies/{companyId}/locations/{id_}/pointofsaledata', 'companyId id_ include'),
+    ('download_tax_rates_by_zip_code', 'GET', '/api/v2/taxratesbyzipcode/download/{date}', 'date include'),
+    ('get_v_a_t_rates_by_country', 'GET', '/api/v2/taxcontent/rates/{country}', 'country include'),
+    ('tax_rates_by_address', 'GET', '/api/v2/taxrates/byaddress', 'include'),
+    ('tax_rates_by_postal_code', 'GET', '/api/v2/taxrates/bypostalcode', 'include'),
+)
@@ -0,0 +1,37 @@
+"""
+AvaTax Software Development Kit for Python.
+
+   Copyright 2019 Avalara, Inc.
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+
+Client methods of the tax_rules group: tax codes, tax rules and country coefficients.
+See avalara.client_methods.
+"""
+
+ENDPOINTS = (
+    ('create_tax_codes', 'POST', '/api/v2/companies/{companyId}/taxcodes', 'companyId model'),
+    ('delete_tax_code', 'DELETE', '/api/v2/companies/{companyId}/taxcodes/{id_}', 'companyId id_'),
+    ('get_tax_code', 'GET', '/api/v2/companies/{companyId}/taxcodes/{id_}', 'companyId id_'),
+    ('list_tax_codes_by_company', 'GET', '/api/v2/companies/{companyId}/taxcodes', 'companyId include'),
+    ('query_tax_codes', 'GET', '/api/v2/taxcodes', 'include'),
+    ('update_tax_code', 'PUT', '/api/v2/companies/{companyId}/taxcodes/{id_}', 'companyId id_ model'),
+    ('create_country_coefficients', 'PUT', '/api/v2/countryCoefficients', 'model'),
+    ('create_tax_rules', 'POST', '/api/v2/companies/{companyId}/taxrules', 'companyId model'),
+    ('delete_tax_rule', 'DELETE', '/api/v2/companies/{companyId}/taxrules/{id_}', 'companyId id_'),
+    ('get_tax_rule', 'GET', '/api/v2/companies/{companyId}/taxrules/{id_}', 'companyId id_'),
+    ('list_country_coefficients', 'GET', '/api/v2/{country}/CountryCoefficients', 'country include'),
+    ('list_tax_rules', 'GET', '/api/v2/companies/{companyId}/taxrules', 'companyId include'),
+    ('query_tax_rules', 'GET', '/api/v2/taxrules', 'include'),
+    ('update_tax_rule', 'PUT', '/api/v2/companies/{companyId}/taxrules/{id_}', 'companyId id_ model'),
+)
@@ -0,0 +1,57 @@
+"""
+AvaTax Software Development Kit for Python.
+
+   Copyright 2019 Avalara, Inc.
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+
+Client methods of the transactions group: transactions and multi-document transactions.
+See avalara.client_methods.
+"""
+
+ENDPOINTS = (
+    ('adjust_multi_document_transaction', 'POST', '/api/v2/transactions/multidocument/{code}/type/{type}/adjust', 'code type model include'),
+    ('audit_multi_document_transaction', 'GET', '/api/v2/transactions/multidocument/{code}/type/{type}/audit', 'code type'),
+    ('commit_multi_document_transaction', 'POST', '/api/v2/transactions/multidocument/commit', 'model'),
+    ('create_multi_document_transaction', 'POST', '/api/v2/transactions/multidocument', 'model include'),
+    ('get_multi_document_transaction_by_code_and_type', 'GET', '/api/v2/transactions/multidocument/{code}/type/{type}', 'code type include'),
+    ('get_multi_document_transaction_by_id', 'GET', '/api/v2/transactions/multidocument/{id_}', 'id_ include'),
+    ('list_multi_document_transactions', 'GET', '/api/v2/transactions/multidocument', 'include'),
+    ('refund_multi_document_transaction', 'POST', '/api/v2/transactions/multidocument/{code}/type/{type}/refund', 'code type model include'),
+    ('verify_multi_document_transaction', 'POST', '/api/v2/transactions/multidocument/verify', 'model'),
+    ('void_multi_document_transaction', 'POST', '/api/v2/transactions/multidocument/{code}/type/{type}/void', 'code type model'),
+    ('add_lines', 'POST', '/api/v2/companies/transactions/lines/add', 'model include'),
+    ('adjust_transaction', 'POST', '/api/v2/companies/{companyCode}/transactions/{transactionCode}/adjust', 'companyCode transactionCode model include'),
+    ('audit_transaction', 'GET', '/api/v2/companies/{companyCode}/transactions/{transactionCode}/audit', 'companyCode transactionCode'),
+    ('audit_transaction_with_type', 'GET', '/api/v2/companies/{companyCode}/transactions/{transactionCode}/types/{documentType}/audit', 'companyCode transactionCode documentType'),
+    ('bulk_lock_transaction', 'POST', '/api/v2/transactions/lock', 'model'),
+    ('change_transaction_code', 'POST', '/api/v2/companies/{companyCode}/transactions/{transactionCode}/changecode', 'companyCode transactionCode model include'),
+    ('commit_transaction', 'POST', '/api/v2/companies/{companyCode}/transactions/{transactionCode}/commit', 'companyCode transactionCode model include'),
+    ('create_or_adjust_transaction', 'POST', '/api/v2/transactions/createoradjust', 'model include'),
+    ('create_transaction', 'POST', '/api/v2/transactions/create', 'model include'),
+    ('delete_lines', 'POST', '/api/v2/companies/transactions/lines/delete', 'model include'),
+    ('get_all_variance_report_by_company_code', 'GET', '/api/v2/companies/{companyCode}/AllVariance', 'companyCode'),
+    ('get_transaction_by_code', 'GET', '/api/v2/companies/{companyCode}/transactions/{transactionCode}', 'companyCode transactionCode include'),
+    ('get_transaction_by_code_and_type', 'GET', '/api/v2/companies/{companyCode}/transactions/{transactionCode}/types/{documentType}', 'companyCode transactionCode documentType include'),
+    ('get_transaction_by_id', 'GET', '/api/v2/transactions/{id_}', 'id_ include'),
+    ('get_variance_report_by_company_code_by_transaction_id', 'GET', '/api/v2/companies/{companyCode}/transactions/{transactionId}/variance', 'companyCode transactionId'),
+    ('list_transactions_by_company', 'GET', '/api/v2/companies/{companyCode}/transactions', 'companyCode include'),
+    ('lock_transaction', 'POST', '/api/v2/companies/{companyCode}/transactions/{transactionCode}/lock', 'companyCode transactionCode model include'),
+    ('refund_transaction', 'POST', '/api/v2/companies/{companyCode}/transactions/{transactionCode}/refund', 'companyCode transactionCode model include'),
+    ('settle_transaction', 'POST', '/api/v2/companies/{companyCode}/transactions/{transactionCode}/settle', 'companyCode transactionCode model include'),
+    ('uncommit_transaction', 'POST', '/api/v2/companies/{companyCode}/transactions/{transactionCode}/uncommit', 'companyCode transactionCode include'),
+    ('unvoid_transaction', 'POST', '/api/v2/companies/{companyCode}/transactions/{transactionCode}/unvoid', 'companyCode transactionCode include'),
+    ('variance_report', 'POST', '/api/v2/companies/{companyCode}/variance', 'companyCode model'),
+    ('verify_transaction', 'POST', '/api/v2/companies/{companyCode}/transactions/{transactionCode}/verify', 'companyCode transactionCode model include'),
+    ('void_transaction', 'POST', '/api/v2/companies/{companyCode}/transactions/{transactionCode}/void', 'companyCode transactionCode model include'),
+)
@@ -0,0 +1,137 @@
+"""
+AvaTax Software Development Kit for Python.
+
+   Copyright 2019 Avalara, Inc.
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+
+Hedged requests: when a call that is safe to duplicate is slow to answer,
+send it a second time and keep whichever response arrives first.
+"""
+import collections
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+# document types AvaTax calculates without recording them, so duplicates leave no trace
+UNRECORDED_DOCUMENT_TYPES = ('SalesOrder', 'PurchaseOrder', 'ReturnOrder', 'InventoryTransferOrder')
+
+
+class HedgePolicy(object):
+    """
+    Decide which calls are hedged and how long to wait before hedging them.
+
+    Only uncommitted calls of `operations` whose document `type` is in
+    `document_types` are hedged; a missing type is treated as SalesOrder,
+    the AvaTax default. The hedge is sent once the first attempt has been
+    outstanding for the `percentile` latency of recent hedgeable calls, or
+    for `delay` seconds until `min_samples` latencies have been seen.
+
+    The synchronous client runs both attempts on `max_workers` threads, and
+    only on idle ones: attempts never queue behind other calls, as queueing
+    time would count towards the hedge delay and trigger needless hedges.
+    A call arriving while every thread is busy is sent on the calling
+    thread and not hedged, a hedge due while they are all busy is skipped.
+    """
+
+    def __init__(
+            self,
+            delay=0.5,
+            percentile=95,
+            min_samples=20,
+            window=200,
+            operations=('create_transaction',),
+            document_types=UNRECORDED_DOCUMENT_TYPES,
+            max_workers=16
+    ):
+        """
+        Initialize the hedge policy.
+
+        :param  float  delay:  Seconds to wait before hedging until enough latencies are known
+        :param  float  percentile:  Latency percentile used as the hedge delay, 0 to 100
+        :param  int  min_samples:  Latencies needed before the percentile is used
+        :param  int  window:  Number of recent latencies the percentile is computed from
+        :param  tuple  operations:  Client methods that may be hedged
+        :param  tuple  document_types:  Document types that are safe to send twice
+        :param  int  max_workers:  Threads available to the synchronous client for hedged calls
+        """
+        self.delay = delay
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.operations = frozenset(operations)
+        self.document_types = frozenset(document_types)
+        self.max_workers = max_workers
+        self._latencies = collections.deque(maxlen=window)
+        self._lock = threading.Lock()
+        self._executor = None
+        self._busy = 0
+
+    def should_hedge(self, call):
+        """Return True if the call may be duplicated."""
+        if call.operation not in self.operations:
+            return False
+        model = call.json
+        return (
+            isinstance(model, dict)
+            and not model.get('commit')
+            and model.get('type', 'SalesOrder') in self.document_types
+        )
+
+    def hedge_delay(self):
+        """Return the seconds to wait for the first attempt before sending the hedge."""
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                return self.delay
+            latencies = sorted(self._latencies)
+        index = min(len(latencies) - 1, int(len(latencies) * self.percentile / 100.0))
+        return latencies[index]
+
+    def record(self, latency):
+        """Record the latency of a hedgeable call, in seconds."""
+        with self._lock:
+            self._latencies.append(latency)
+
+    @property
+    def executor(self):
+        """Thread pool running the attempts of hedged calls for the synchronous client."""
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers, thread_name_prefix='avalara-hedge'
+                    )
+        return self._executor
+
+    def submit(self, fn, *args):
+        """Run fn(*args) on an idle thread of the executor, return its Future, or None if every thread is busy."""
+        with self._lock:
+            if self._busy >= self.max_workers:
+                return None
+            self._busy += 1
+        try:
+            future = self.executor.submit(fn, *args)
+        except BaseException:
+            self._release()
+            raise
+        future.add_done_callback(self._release)
+        return future
+
+    def _release(self, future=None):
+        with self._lock:
+            self._busy -= 1
+
+    def shutdown(self):
+        """Stop the thread pool, waiting for outstanding attempts."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
@@ -0,0 +1,182 @@
+"""
+AvaTax Software Development Kit for Python.
+
+   Copyright 2019 Avalara, Inc.
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+
+Non-blocking call logging: records are put on a bounded in-memory queue
+and handed to the real handlers by a background thread, so slow log sinks
+do not add to call latency.
+"""
+import itertools
+import logging
+import logging.handlers
+import queue
+
+
+DROP = 'drop'
+SAMPLE = 'sample'
+BLOCK = 'block'
+
+
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    """
+    Put records on a bounded queue, applying an overflow policy when it fills up.
+
+    drop:    records that do not fit are dropped.
+    sample:  once the queue is `sample_above` full, only 1 in `sample_every`
+             records below ERROR is kept; records that do not fit are dropped.
+    block:   the logging thread waits for room, up to `block_timeout` seconds
+             (forever if None), then drops the record.
+    """
+
+    def __init__(self, log_queue, overflow=DROP, sample_every=10, sample_above=0.5, block_timeout=None):
+        """
+        Initialize the handler.
+
+        :param  Queue  log_queue:  Bounded queue.Queue the records are put on
+        :param  string  overflow:  One of DROP, SAMPLE or BLOCK
+        :param  int  sample_every:  Keep 1 in this many records while sampling
+        :param  float  sample_above:  Fraction of the queue in use from which records are sampled
+        :param  float  block_timeout:  Seconds to wait for room with BLOCK, None to wait as long as needed
+        """
+        if overflow not in (DROP, SAMPLE, BLOCK):
+            raise ValueError('overflow must be one of {!r}, {!r} or {!r}'.format(DROP, SAMPLE, BLOCK))
+        super(BoundedQueueHandler, self).__init__(log_queue)
+        self.overflow = overflow
+        self.sample_every = max(1, sample_every)
+        self.sample_above = sample_above
+        self.block_timeout = block_timeout
+        self.dropped = 0
+        self._sampled = itertools.count()
+
+    def prepare(self, record):
+        # records stay in memory, so formatting is left to the handlers on the listener thread
+        return record
+
+    def enqueue(self, record):
+        if self.overflow == BLOCK:
+            try:
+                self.queue.put(record, timeout=self.block_timeout)
+            except queue.Full:
+                self._drop()
+            return
+        if self.overflow == SAMPLE and record.levelno < logging.ERROR and self._sampling():
+            if next(self._sampled) % self.sample_every:
+                self._drop()
+                return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self._drop()
+
+    def _sampling(self):
+        maxsize = self.queue.maxsize
+        return maxsize > 0 and self.queue.qsize() >= maxsize * self.sample_above
+
+    def _drop(self):
+        # emit, and so enqueue, runs under the handler lock
+        self.dropped += 1
+
+
+class _QueueListener(logging.handlers.QueueListener):
+    """QueueListener whose stop waits for room in a full queue instead of failing."""
+
+    def enqueue_sentinel(self):
+        self.queue.put(self._sentinel)
+
+
+class QueueLogPipeline(object):
+    """
+    Move the handlers that receive a logger's records behind a bounded queue.
+
+    While started, the records of `logger` are put on the queue by a
+    BoundedQueueHandler and a background thread passes them to the handlers
+    that would otherwise have been called in the calling thread: the
+    logger's own handlers and those of the ancestors it propagates to.
+
+        pipeline = QueueLogPipeline(logging.getLogger('avalara'), overflow=SAMPLE)
+        pipeline.start()
+        client = AvataxClient(..., logger=pipeline.logger)
+        ...
+        pipeline.stop()  # flushes the queue
+    """
+
+    def __init__(self, logger, maxsize=10000, overflow=DROP, handlers=None, **overflow_options):
+        """
+        Initialize the pipeline.
+
+        :param  Logger  logger:  Logger whose records go through the queue
+        :param  int  maxsize:  Maximum number of records waiting in the queue
+        :param  string  overflow:  What to do when the queue is full, DROP, SAMPLE or BLOCK
+        :param  list  handlers:  Handlers draining the queue, default the ones `logger` reaches
+        :param  overflow_options:  sample_every, sample_above or block_timeout, see BoundedQueueHandler
+        """
+        self.logger = logger
+        self.queue = queue.Queue(maxsize)
+        self.handler = BoundedQueueHandler(self.queue, overflow, **overflow_options)
+        self.handlers = handlers
+        self._listener = None
+        self._saved = None
+
+    @property
+    def dropped(self):
+        """Number of records dropped by the overflow policy."""
+        return self.handler.dropped
+
+    def start(self):
+        """Replace the handlers of the logger by the queue and start draining it."""
+        if self._listener is not None:
+            return self
+        handlers = self.handlers
+        if handlers is None:
+            handlers = _reached_handlers(self.logger)
+        self._saved = (list(self.logger.handlers), self.logger.propagate)
+        self._listener = _QueueListener(self.queue, *handlers, respect_handler_level=True)
+        self._listener.start()
+        for handler in self._saved[0]:
+            self.logger.removeHandler(handler)
+        self.logger.addHandler(self.handler)
+        self.logger.propagate = False
+        return self
+
+    def stop(self):
+        """Restore the handlers of the logger, after the records already queued have been handled."""
+        if self._listener is None:
+            return
+        self.logger.removeHandler(self.handler)
+        handlers, propagate = self._saved
+        for handler in handlers:
+            self.logger.addHandler(handler)
+        self.logger.propagate = propagate
+        self._listener.stop()
+        self._listener = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+
+def _reached_handlers(logger):
+    """Return the handlers a record of `logger` is passed to, as in Logger.callHandlers."""
+    handlers = []
+    current = logger
+    while current is not None:
+        handlers.extend(current.handlers)
+        if not current.propagate:
+            break
+        current = current.parent
+    return handlers
@@ -0,0 +1,239 @@
+"""
+AvaTax Software Development Kit for Python.
+
+   Copyright 2019 Avalara, Inc.
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+
+In-process metrics per client method: calls, errors, latency histograms
+and bytes transferred, with a snapshot API and a Prometheus text exporter.
+"""
+import threading
+
+from .phase_timings import PHASES
+
+
+# upper bounds, in seconds, of the latency histogram buckets
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, float('inf'))
+
+
+class Histogram(object):
+    """Counts of observed values per bucket, exported cumulatively like a Prometheus histogram."""
+
+    __slots__ = ('bounds', 'counts', 'count', 'sum')
+
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.counts = [0] * len(bounds)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        """Add one value to the histogram."""
+        for index, bound in enumerate(self.bounds):
+            if value <= bound:
+                self.counts[index] += 1
+                break
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q):
+        """
+        Estimate the q quantile (0 to 1) by interpolating inside its bucket, like Prometheus' histogram_quantile.
+
+        Returns None before any value is observed; values beyond the last finite
+        bound are reported as that bound.
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        lower = 0.0
+        for bound, count in zip(self.bounds, self.counts):
+            if count and seen + count >= rank:
+                if bound == float('inf'):
+                    return lower
+                return lower + (bound - lower) * (rank - seen) / count
+            seen += count
+            if bound != float('inf'):
+                lower = bound
+        return lower
+
+    def cumulative(self):
+        """Return (bound, number of values <= bound) pairs."""
+        total = 0
+        pairs = []
+        for bound, count in zip(self.bounds, self.counts):
+            total += count
+            pairs.append((bound, total))
+        return pairs
+
+
+class OperationMetrics(object):
+    """Metrics of one client method."""
+
+    __slots__ = ('calls', 'errors', 'latency', 'phases', 'bytes_sent', 'bytes_received')
+
+    def __init__(self, buckets):
+        self.calls = 0
+        self.errors = {}
+        self.latency = Histogram(buckets)
+        # one histogram per phase, for calls whose transport measured phase timings
+        self.phases = dict((phase, Histogram(buckets)) for phase in PHASES)
+        self.bytes_sent = 0
+        self.bytes_received = 0
+
+    def snapshot(self):
+        """Return the metrics as plain data."""
+        return {
+            'calls': self.calls,
+            'errors': dict(self.errors),
+            'latency': _histogram_snapshot(self.latency),
+            'phases': dict(
+                (phase, _histogram_snapshot(histogram))
+                for phase, histogram in self.phases.items() if histogram.count
+            ),
+            'bytes_sent': self.bytes_sent,
+            'bytes_received': self.bytes_received,
+        }
+
+
+def _histogram_snapshot(histogram):
+    return {
+        'count': histogram.count,
+        'sum': histogram.sum,
+        'p50': histogram.quantile(0.5),
+        'p95': histogram.quantile(0.95),
+        'p99': histogram.quantile(0.99),
+        'buckets': histogram.cumulative(),
+    }
+
+
+class MetricsRegistry(object):
+    """
+    Metrics of every call made by the clients it is given to, per client method.
+
+    A call is counted once whatever its retries. It is an error if it raised,
+    counted under the exception class name, or if it was answered with a 4xx
+    or 5xx status, counted under the status code. Responses carrying
+    `phase_timings` (see avalara.phase_timings) also feed per-phase histograms.
+    """
+
+    def __init__(self, buckets=LATENCY_BUCKETS, namespace='avatax'):
+        """
+        Initialize the registry.
+
+        :param  tuple  buckets:  Upper bounds in seconds of the latency buckets, ending with float('inf')
+        :param  string  namespace:  Prefix of the Prometheus metric names
+        """
+        self.buckets = tuple(buckets)
+        self.namespace = namespace
+        self._operations = {}
+        self._lock = threading.Lock()
+
+    def record(self, operation, duration, response=None, error=None):
+        """
+        Record one call.
+
+        :param  string  operation:  Client method name
+        :param  float  duration:  Seconds the call took, retries included
+        :param  Response  response:  Response of the call, if it returned one
+        :param  Exception  error:  Exception raised by the call, if any
+        """
+        sent = received = 0
+        error_key = None
+        phases = None
+        if error is not None:
+            error_key = type(error).__name__
+        elif response is not None:
+            if response.status_code >= 400:
+                error_key = str(response.status_code)
+            body = response.request.body if response.request is not None else None
+            sent = len(body) if body else 0
+            received = len(response.content or b'')
+            phases = getattr(response, 'phase_timings', None)
+        with self._lock:
+            metrics = self._operations.get(operation)
+            if metrics is None:
+                metrics = self._operations[operation] = OperationMetrics(self.buckets)
+            metrics.calls += 1
+            if error_key is not None:
+                metrics.errors[error_key] = metrics.errors.get(error_key, 0) + 1
+            metrics.latency.observe(duration)
+            metrics.bytes_sent += sent
+            metrics.bytes_received += received
+            if phases:
+                for phase, histogram in metrics.phases.items():
+                    if phases.get(phase) is not None:
+                        histogram.observe(phases[phase])
+
+    def snapshot(self):
+        """Return {client method: metrics} as plain data, see OperationMetrics.snapshot."""
+        with self._lock:
+            return dict((operation, metrics.snapshot()) for operation, metrics in self._operations.items())
+
+    def reset(self):
+        """Forget every recorded call."""
+        with self._lock:
+            self._operations = {}
+
+    def to_prometheus(self):
+        """Return the metrics in the Prometheus text exposition format."""
+        snapshot = self.snapshot()
+        prefix = self.namespace + '_' if self.namespace else ''
+        lines = []
+
+        def family(name, kind, help_text):
+            lines.append('# HELP {}{} {}'.format(prefix, name, help_text))
+            lines.append('# TYPE {}{} {}'.format(prefix, name, kind))
+
+        family('calls_total', 'counter', 'AvaTax API calls by client method.')
+        for operation, metrics in sorted(snapshot.items()):
+            lines.append('{}calls_total{{operation="{}"}} {}'.format(prefix, operation, metrics['calls']))
+        family('call_errors_total', 'counter', 'Failed AvaTax API calls by client method and status or exception.')
+        for operation, metrics in sorted(snapshot.items()):
+            for error, count in sorted(metrics['errors'].items()):
+                lines.append('{}call_errors_total{{operation="{}",error="{}"}} {}'.format(
+                    prefix, operation, error, count
+                ))
+        family('call_duration_seconds', 'histogram', 'Duration of AvaTax API calls, retries included.')
+        for operation, metrics in sorted(snapshot.items()):
+            latency = metrics['latency']
+            for bound, count in latency['buckets']:
+                lines.append('{}call_duration_seconds_bucket{{operation="{}",le="{}"}} {}'.format(
+                    prefix, operation, '+Inf' if bound == float('inf') else repr(bound), count
+                ))
+            lines.append('{}call_duration_seconds_sum{{operation="{}"}} {}'.format(prefix, operation, latency['sum']))
+            lines.append('{}call_duration_seconds_count{{operation="{}"}} {}'.format(
+                prefix, operation, latency['count']
+            ))
+        family('call_phase_seconds', 'histogram', 'Duration of the DNS, connect, TLS, ttfb and transfer phases.')
+        for operation, metrics in sorted(snapshot.items()):
+            for phase in PHASES:
+                histogram = metrics['phases'].get(phase)
+                if histogram is None:
+                    continue
+                labels = 'operation="{}",phase="{}"'.format(operation, phase)
+                for bound, count in histogram['buckets']:
+                    lines.append('{}call_phase_seconds_bucket{{{},le="{}"}} {}'.format(
+                        prefix, labels, '+Inf' if bound == float('inf') else repr(bound), count
+                    ))
+                lines.append('{}call_phase_seconds_sum{{{}}} {}'.format(prefix, labels, histogram['sum']))
+                lines.append('{}call_phase_seconds_count{{{}}} {}'.format(prefix, labels, histogram['count']))
+        for name, key, help_text in (
+                ('sent_bytes_total', 'bytes_sent', 'Request body bytes sent by client method.'),
+                ('received_bytes_total', 'bytes_received', 'Response body bytes received by client method.')):
+            family(name, 'counter', help_text)
+            for operation, metrics in sorted(snapshot.items()):
+                lines.append('{}{}{{operation="{}"}} {}'.format(prefix, name, operation, metrics[key]))
+        return '\n'.join(lines) + '\n'
@@ -0,0 +1,57 @@
+"""
+AvaTax Software Development Kit for Python.
+
+   Copyright 2019 Avalara, Inc.
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+
+Pre-send and post-receive hooks of the client calls.
+
+A pre-send hook is a callable taking the Call (see avalara.call) about to
+be sent: its operation (client method name), route template, params and
+json body. It can change the call, e.g. with call.add_headers, and returns
+None to let it go on, or a response to answer it without sending it; the
+later pre-send hooks and the transport are then skipped.
+
+A post-receive hook is a callable taking the Call and its response, that
+returns None to keep the response or another response to replace it. Post-
+receive hooks see every response, short-circuited ones included, but not
+calls that raised.
+
+Hooks run once per call, outside the retries, and are plain functions for
+AsyncAvataxClient too. They are listed in client.pre_send_hooks and
+client.post_receive_hooks and run in that order.
+"""
+import json as jsonlib
+
+from .transport import Transport, build_response
+
+
+def respond(call, status_code=200, body=None, headers=None):
+    """
+    Build the response of a call that is answered without being sent, e.g. by a pre-send hook.
+
+    :param  Call  call:  The call answered
+    :param  int  status_code:  HTTP status code
+    :param  body:  Response body: dict or list (sent as JSON), str or bytes
+    :param  dict  headers:  Response headers
+    :return: requests.Response
+    """
+    headers = dict(headers or {})
+    if isinstance(body, (dict, list)):
+        body = jsonlib.dumps(body)
+        headers.setdefault('Content-Type', 'application/json; charset=utf-8')
+    if isinstance(body, str):
+        body = body.encode('utf-8')
+    request = Transport.prepare(call.method, call.url, call.params, call.json, call.options.get('headers'))
+    return build_response(request, status_code, body or b'', headers)
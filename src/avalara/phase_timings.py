@@ -0,0 +1,178 @@
+"""
+AvaTax Software Development Kit for Python.
+
+   Copyright 2019 Avalara, Inc.
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+
+Where the time of a request goes: DNS resolution, TCP connect, TLS
+handshake, time to first byte and body transfer, measured inside the
+transports that are created with phase_timings=True.
+"""
+import contextlib
+import contextvars
+import socket
+import time
+
+from urllib3 import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+
+
+# phases reported for each response, in seconds
+PHASES = ('dns', 'connect', 'tls', 'ttfb', 'transfer')
+
+_current = contextvars.ContextVar('avalara_phase_timings', default=None)
+
+
+class PhaseTimings(object):
+    """
+    Durations of the phases of one request.
+
+    dns, connect and tls stay None when a pooled connection is reused, and
+    dns is None when the HTTP library resolves names inside its connect
+    (httpx), in which case connect includes the resolution.
+    """
+
+    __slots__ = PHASES + ('sent_at', 'first_byte_at', '_started_at')
+
+    def __init__(self):
+        for name in self.__slots__:
+            setattr(self, name, None)
+
+    def sent(self):
+        """Mark the request as written to the connection."""
+        self.sent_at = time.perf_counter()
+
+    def first_byte(self):
+        """Mark the response headers as received."""
+        self.first_byte_at = time.perf_counter()
+        if self.sent_at is not None:
+            self.ttfb = self.first_byte_at - self.sent_at
+
+    def finish(self):
+        """Mark the response body as read."""
+        if self.first_byte_at is not None:
+            self.transfer = time.perf_counter() - self.first_byte_at
+
+    def as_dict(self):
+        """Return the phases, plus whether the connection was reused."""
+        timings = dict((name, getattr(self, name)) for name in PHASES)
+        timings['reused'] = self.connect is None
+        return timings
+
+    def trace(self, event_name, info):
+        """httpcore trace callback, see https://www.encode.io/httpcore/extensions/#trace."""
+        if event_name in ('connection.connect_tcp.started', 'connection.start_tls.started'):
+            self._started_at = time.perf_counter()
+        elif event_name == 'connection.connect_tcp.complete':
+            self.connect = time.perf_counter() - self._started_at
+        elif event_name == 'connection.start_tls.complete':
+            self.tls = time.perf_counter() - self._started_at
+        elif event_name.endswith(('.send_request_headers.complete', '.send_request_body.complete')):
+            self.sent()
+        elif event_name.endswith('.receive_response_headers.complete'):
+            self.first_byte()
+
+    async def async_trace(self, event_name, info):
+        """httpcore trace callback of async clients."""
+        self.trace(event_name, info)
+
+
+@contextlib.contextmanager
+def measure():
+    """Collect the phases of the request sent inside the block into the yielded PhaseTimings."""
+    timings = PhaseTimings()
+    token = _current.set(timings)
+    try:
+        yield timings
+    finally:
+        _current.reset(token)
+
+
+class _TimedConnectionMixin(object):
+    """Record DNS, connect and time to first byte into the PhaseTimings being measured, if any."""
+
+    def _new_conn(self):
+        timings = _current.get()
+        if timings is None:
+            return super(_TimedConnectionMixin, self)._new_conn()
+        start = time.perf_counter()
+        try:
+            addresses = socket.getaddrinfo(self._dns_host, self.port, 0, socket.SOCK_STREAM)
+        except socket.gaierror:
+            # let urllib3 resolve again and raise its own error
+            return super(_TimedConnectionMixin, self)._new_conn()
+        resolved = time.perf_counter()
+        timings.dns = resolved - start
+        host = self._dns_host
+        try:
+            # connect to the resolved addresses in turn, as create_connection would
+            for index, address in enumerate(addresses):
+                self._dns_host = address[4][0]
+                try:
+                    sock = super(_TimedConnectionMixin, self)._new_conn()
+                    break
+                except (NewConnectionError, ConnectTimeoutError):
+                    if index == len(addresses) - 1:
+                        raise
+        finally:
+            self._dns_host = host
+        timings.connect = time.perf_counter() - resolved
+        return sock
+
+    def request(self, *args, **kwargs):
+        super(_TimedConnectionMixin, self).request(*args, **kwargs)
+        timings = _current.get()
+        if timings is not None:
+            timings.sent()
+
+    def getresponse(self, *args, **kwargs):
+        response = super(_TimedConnectionMixin, self).getresponse(*args, **kwargs)
+        timings = _current.get()
+        if timings is not None:
+            timings.first_byte()
+        return response
+
+
+class TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    """urllib3 HTTP connection recording its phases."""
+
+
+class TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    """urllib3 HTTPS connection recording its phases, TLS handshake included."""
+
+    def connect(self):
+        timings = _current.get()
+        if timings is None:
+            return super(TimedHTTPSConnection, self).connect()
+        start = time.perf_counter()
+        super(TimedHTTPSConnection, self).connect()
+        if timings.connect is not None:
+            timings.tls = time.perf_counter() - start - (timings.dns or 0) - timings.connect
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+def instrument_pool_manager(pool_manager):
+    """Make the pools a urllib3 PoolManager creates from now on record phase timings."""
+    pool_manager.pool_classes_by_scheme = {
+        'http': TimedHTTPConnectionPool,
+        'https': TimedHTTPSConnectionPool,
+    }
@@ -0,0 +1,143 @@
+"""
+AvaTax Software Development Kit for Python.
+
+   Copyright 2019 Avalara, Inc.
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+
+Client-side rate limiting that adapts to AvaTax throttling.
+"""
+import threading
+import time
+
+from .endpoint_groups import DEFAULT_GROUP, check_groups
+
+
+class AdaptiveTokenBucket(object):
+    """
+    Thread-safe token bucket whose rate follows AIMD.
+
+    Each call takes a token; when none is left the caller is told how long
+    to wait for its turn. A throttled (429) response multiplies the rate by
+    `decrease_factor`, every other response adds `increase_step` to it, up
+    to `max_rate`.
+    """
+
+    def __init__(self, rate, burst=None, min_rate=0.5, max_rate=None, decrease_factor=0.5, increase_step=0.1):
+        """
+        Initialize the bucket.
+
+        :param  float  rate:  Calls per second allowed at start
+        :param  int  burst:  Calls allowed back to back after a quiet period (default: rate)
+        :param  float  min_rate:  Lowest rate a run of 429s can bring the bucket to
+        :param  float  max_rate:  Highest rate successes can raise the bucket to (default: rate)
+        :param  float  decrease_factor:  Multiplier applied to the rate on a 429
+        :param  float  increase_step:  Calls per second added to the rate on each success
+        """
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else max(1.0, rate))
+        self.min_rate = float(min_rate)
+        self.max_rate = float(max_rate if max_rate is not None else rate)
+        self.decrease_factor = decrease_factor
+        self.increase_step = increase_step
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """
+        Take a token and return the seconds to wait before using it.
+
+        Tokens are handed out in order, so callers queue fairly behind each other.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def cancel(self):
+        """Give back the token of a reservation that was not used."""
+        with self._lock:
+            self._tokens = min(self.burst, self._tokens + 1)
+
+    def on_throttled(self):
+        """Back off after the server answered 429."""
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+
+    def on_success(self):
+        """Probe for more throughput after a call that was not throttled."""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.increase_step)
+
+
+class RateLimiter(object):
+    """
+    Adaptive rate limiter shared by every thread using a client.
+
+    Each endpoint group (see avalara.endpoint_groups) gets its own
+    AdaptiveTokenBucket, so throttling on transactions does not slow down
+    address resolution. Pass the same limiter to several clients to share
+    one budget between them.
+    """
+
+    def __init__(self, rate=10.0, groups=None, **bucket_options):
+        """
+        Initialize the limiter.
+
+        :param  float  rate:  Calls per second for groups without their own setting
+        :param  dict  groups:  Group name to either a rate or a dict of AdaptiveTokenBucket arguments,
+            e.g. {'transactions': 50, 'addresses': {'rate': 20, 'burst': 40}}
+        :param  bucket_options:  Default AdaptiveTokenBucket arguments for every group
+        :raises ValueError: `groups` names an unknown endpoint group
+        """
+        self.rate = rate
+        self.groups = check_groups(groups or {})
+        self.bucket_options = bucket_options
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, group=DEFAULT_GROUP):
+        """Return the token bucket of an endpoint group, creating it on first use."""
+        bucket = self._buckets.get(group)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.get(group)
+                if bucket is None:
+                    options = dict(self.bucket_options, rate=self.rate)
+                    setting = self.groups.get(group)
+                    if isinstance(setting, dict):
+                        options.update(setting)
+                    elif setting is not None:
+                        options['rate'] = setting
+                    bucket = self._buckets[group] = AdaptiveTokenBucket(**options)
+        return bucket
+
+    def reserve(self, group=DEFAULT_GROUP):
+        """Take a token for a call in `group` and return the seconds to wait before sending it."""
+        return self.bucket(group).reserve()
+
+    def release(self, group=DEFAULT_GROUP):
+        """Give back the token reserved for a call in `group` that was not sent."""
+        self.bucket(group).cancel()
+
+    def record(self, group, status_code):
+        """Adapt the rate of `group` to the status code of a response."""
+        if status_code == 429:
+            self.bucket(group).on_throttled()
+        else:
+            self.bucket(group).on_success()
@@ -0,0 +1,152 @@
+"""
+AvaTax Software Development Kit for Python.
+
+   Copyright 2019 Avalara, Inc.
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+
+Retry policy applied by the client dispatcher to transient failures.
+"""
+import email.utils
+import random
+import threading
+import time
+
+import requests
+
+
+class RetryPolicy(object):
+    """
+    Decide whether, and after how long, a failed call is sent again.
+
+    Only idempotent calls are retried: GET/HEAD/OPTIONS requests and the
+    operations listed in `idempotent_operations` or starting with one of
+    `idempotent_prefixes`. POSTs that carry a transaction `code` (such as
+    create_transaction) are retried only when `retry_with_code` is set.
+
+    Delays follow exponential backoff with full jitter, unless the server
+    sends a `Retry-After` header. A retry budget shared by every call made
+    with the policy caps retries to a fraction of the traffic, so an outage
+    does not turn into a retry storm.
+    """
+
+    def __init__(
+            self,
+            total=3,
+            backoff_factor=0.5,
+            max_backoff=30,
+            status_forcelist=(429, 502, 503, 504),
+            respect_retry_after=True,
+            retry_with_code=False,
+            idempotent_methods=('GET', 'HEAD', 'OPTIONS'),
+            idempotent_operations=('ping', 'resolve_address', 'resolve_address_post'),
+            idempotent_prefixes=('list_', 'query_'),
+            budget_ratio=0.2,
+            budget_reserve=10
+    ):
+        """
+        Initialize the retry policy.
+
+        :param  int  total:  Maximum number of retries for a single call
+        :param  float  backoff_factor:  Base delay in seconds, doubled on each retry
+        :param  float  max_backoff:  Longest delay in seconds, a longer Retry-After stops retrying
+        :param  tuple  status_forcelist:  Response status codes that are retried
+        :param  bool  respect_retry_after:  Wait for the server's Retry-After header when present
+        :param  bool  retry_with_code:  Also retry non-idempotent POSTs whose body has a `code`
+        :param  tuple  idempotent_methods:  HTTP verbs that are always safe to retry
+        :param  tuple  idempotent_operations:  Client methods that are safe to retry whatever their verb
+        :param  tuple  idempotent_prefixes:  Client method name prefixes that are safe to retry
+        :param  float  budget_ratio:  Retries earned by each call, e.g. 0.2 allows retries for 20% of calls
+        :param  int  budget_reserve:  Retries available before any call has been made, and the budget cap
+        """
+        self.total = total
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.status_forcelist = frozenset(status_forcelist)
+        self.respect_retry_after = respect_retry_after
+        self.retry_with_code = retry_with_code
+        self.idempotent_methods = frozenset(idempotent_methods)
+        self.idempotent_operations = frozenset(idempotent_operations)
+        self.idempotent_prefixes = tuple(idempotent_prefixes)
+        self.budget_ratio = budget_ratio
+        self.budget_reserve = budget_reserve
+        self._budget = float(budget_reserve)
+        self._lock = threading.Lock()
+
+    def is_retryable(self, method, operation=None, json=None):
+        """
+        Return True if a call may be sent more than once.
+
+        Also credits the retry budget, so call it once per client call.
+        """
+        with self._lock:
+            self._budget = min(self.budget_reserve, self._budget + self.budget_ratio)
+        if method in self.idempotent_methods:
+            return True
+        if operation and (
+                operation in self.idempotent_operations
+                or operation.startswith(self.idempotent_prefixes)
+        ):
+            return True
+        return bool(self.retry_with_code and isinstance(json, dict) and json.get('code'))
+
+    def next_delay(self, attempt, response=None, error=None):
+        """
+        Return the seconds to wait before retrying, or None to stop.
+
+        :param  int  attempt:  Number of retries already made for this call
+        :param  Response  response:  Response of the last attempt, if any
+        :param  Exception  error:  Exception raised by the last attempt, if any
+        :return: float or None
+        """
+        if attempt >= self.total:
+            return None
+        if error is not None:
+            if not isinstance(error, (requests.ConnectionError, requests.Timeout)):
+                return None
+        elif response is None or response.status_code not in self.status_forcelist:
+            return None
+        delay = None
+        if response is not None and self.respect_retry_after:
+            delay = parse_retry_after(response.headers.get('Retry-After'))
+            if delay is not None and delay > self.max_backoff:
+                return None
+        if delay is None:
+            delay = random.uniform(0, min(self.max_backoff, self.backoff_factor * (2 ** attempt)))
+        with self._lock:
+            if self._budget < 1:
+                return None
+            self._budget -= 1
+        return delay
+
+
+def parse_retry_after(value):
+    """
+    Parse a Retry-After header into seconds.
+
+    :param  string  value:  Either a number of seconds or an HTTP date
+    :return: float or None if the header is missing or malformed
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
@@ -0,0 +1,125 @@
+"""
+AvaTax Software Development Kit for Python.
+
+   Copyright 2019 Avalara, Inc.
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+
+Slow-call capture: full diagnostics of the calls that were slow or failed,
+kept in memory until they are flushed.
+"""
+import collections
+import json
+import logging
+import threading
+import time
+
+from .ava_logger import get_ava_log_entry
+
+
+class SlowCallRecorder(object):
+    """
+    Keep the full detail of slow and failed calls in a bounded ring buffer.
+
+    A call is captured if it took `threshold` seconds or more, retries
+    included, if it raised, or if it was answered with a 4xx/5xx status and
+    `errors` is set. Each capture holds the request and response bodies, the
+    response headers, the x-correlation-id and, when the transport measures
+    them, the phase timings. Other calls cost a comparison. Once `capacity`
+    captures are held, the oldest is dropped for the newest.
+    """
+
+    def __init__(self, threshold=1.0, errors=True, capacity=100, body_log_policy=None):
+        """
+        Initialize the recorder.
+
+        :param  float  threshold:  Capture calls taking at least this many seconds
+        :param  bool  errors:  Capture calls answered with a 4xx or 5xx status
+        :param  int  capacity:  Captures held before the oldest are dropped
+        :param  BodyLogPolicy  body_log_policy:  Caps and redacts the captured bodies and request url,
+            only its max_bytes and redact_fields apply (default: None, bodies in full)
+        """
+        self.threshold = threshold
+        self.errors = errors
+        self.body_log_policy = body_log_policy
+        self.dropped = 0
+        self._captures = collections.deque(maxlen=capacity)
+        self._lock = threading.Lock()
+
+    def record(self, call, duration, response=None, error=None):
+        """
+        Capture a finished call if it was slow or failed.
+
+        :param  Call  call:  The call, see avalara.call
+        :param  float  duration:  Seconds the call took, retries included
+        :param  Response  response:  Response of the call, if it returned one
+        :param  Exception  error:  Exception raised by the call, if any
+        """
+        if duration < self.threshold and error is None and not (
+                self.errors and response is not None and response.status_code >= 400):
+            return
+        capture = self._capture(call, duration, response, error)
+        with self._lock:
+            if len(self._captures) == self._captures.maxlen:
+                self.dropped += 1
+            self._captures.append(capture)
+
+    def _capture(self, call, duration, response, error):
+        capture = {'timestamp': time.time(), 'operation': call.operation, 'route': call.route}
+        if response is not None:
+            capture.update(get_ava_log_entry(response, False))
+            capture['response_headers'] = dict(response.headers)
+            capture['request_body'] = self._render(response.request.body)
+            capture['response_body'] = self._render(response.content)
+        else:
+            capture['method'] = call.method
+            capture['request_url'] = call.url
+            capture['request_body'] = self._render(json.dumps(call.json) if call.json is not None else None)
+        if error is not None:
+            capture['error'] = '{}: {}'.format(type(error).__name__, error)
+        if self.body_log_policy is not None:
+            capture['request_url'] = self.body_log_policy.redact_url(capture['request_url'])
+        capture['execution_time'] = duration * 1000
+        return capture
+
+    def _render(self, body):
+        if self.body_log_policy is not None:
+            return self.body_log_policy.render(body)
+        if isinstance(body, bytes):
+            return body.decode('utf-8', 'replace')
+        return body
+
+    def __len__(self):
+        return len(self._captures)
+
+    def captures(self):
+        """Return the held captures, oldest first, without removing them."""
+        with self._lock:
+            return list(self._captures)
+
+    def flush(self, logger=None, level=logging.WARNING):
+        """
+        Remove and return the held captures, oldest first.
+
+        :param  Logger  logger:  Also log each capture, its fields as record attributes like the
+            records of the client calls (see avalara.ava_logger.LOG_FIELDS)
+        :param  int  level:  Level of the logged captures
+        """
+        with self._lock:
+            captures = list(self._captures)
+            self._captures.clear()
+        if logger is not None:
+            for capture in captures:
+                logger.log(level, 'Slow or failed AvaTax call %s (%.0f ms)', capture['operation'],
+                           capture['execution_time'], extra=capture)
+        return captures
@@ -0,0 +1,138 @@
+"""
+AvaTax Software Development Kit for Python.
+
+   Copyright 2019 Avalara, Inc.
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+
+Connect/read timeouts per endpoint group or client method, and overall
+deadlines that hold across retries.
+"""
+import contextlib
+import contextvars
+import time
+
+import requests
+
+from .endpoint_groups import check_groups
+
+
+_deadline_at = contextvars.ContextVar('avalara_deadline_at', default=None)
+
+
+class DeadlineExceeded(requests.Timeout):
+    """Raised when a call cannot complete before its deadline."""
+
+
+class TimeoutProfile(object):
+    """Timeouts applied to a call: connect and read timeouts per attempt, and a deadline for the whole call."""
+
+    def __init__(self, connect=None, read=None, deadline=None):
+        """
+        Initialize the profile.
+
+        connect and read left to None fall back to the client's timeout_limit.
+
+        :param  float  connect:  Seconds allowed to open a connection
+        :param  float  read:  Seconds allowed between bytes received from the server
+        :param  float  deadline:  Seconds allowed for the call including retries and waits
+        """
+        self.connect = connect
+        self.read = read
+        self.deadline = deadline
+
+    def timeout(self, fallback=None):
+        """
+        Return the (connect, read) timeout tuple understood by the transports.
+
+        :param  int/float/tuple  fallback:  Timeout used for the fields left unset in this profile
+        """
+        if isinstance(fallback, tuple):
+            fallback_connect, fallback_read = fallback
+        else:
+            fallback_connect = fallback_read = fallback
+        return (
+            fallback_connect if self.connect is None else self.connect,
+            fallback_read if self.read is None else self.read
+        )
+
+    def __repr__(self):
+        return 'TimeoutProfile(connect={!r}, read={!r}, deadline={!r})'.format(
+            self.connect, self.read, self.deadline
+        )
+
+
+class TimeoutProfiles(object):
+    """
+    Choose the TimeoutProfile of each call.
+
+    A profile set for the client method (e.g. 'download_report') wins over
+    the profile of its endpoint group (e.g. 'transactions'), which wins over
+    `default`.
+    """
+
+    def __init__(self, default=None, groups=None, operations=None):
+        """
+        Initialize the profiles.
+
+        :param  TimeoutProfile  default:  Profile of calls without a more specific one
+        :param  dict  groups:  Endpoint group name to TimeoutProfile
+        :param  dict  operations:  Client method name to TimeoutProfile
+        :raises ValueError: `groups` names an unknown endpoint group
+        """
+        self.default = default
+        self.groups = check_groups(groups or {})
+        self.operations = operations or {}
+
+    def profile(self, group, operation=None):
+        """Return the profile of a call, or None when nothing is configured for it."""
+        profile = self.operations.get(operation)
+        if profile is None:
+            profile = self.groups.get(group, self.default)
+        return profile
+
+
+@contextlib.contextmanager
+def deadline(seconds):
+    """
+    Bound every call made inside the block, retries and waits included, to `seconds` from now.
+
+    Nested deadlines keep the earliest one. The deadline follows the current
+    thread or asyncio task.
+
+        with deadline(2.0):
+            client.create_transaction(model)
+    """
+    deadline_at = time.monotonic() + seconds
+    current = _deadline_at.get()
+    if current is not None:
+        deadline_at = min(deadline_at, current)
+    token = _deadline_at.set(deadline_at)
+    try:
+        yield
+    finally:
+        _deadline_at.reset(token)
+
+
+def current_deadline():
+    """Return the monotonic time set by the innermost `deadline` block, or None."""
+    return _deadline_at.get()
+
+
+def cap_timeout(timeout, remaining):
+    """Shorten a timeout, number or (connect, read) tuple, so that it does not outlast `remaining` seconds."""
+    if isinstance(timeout, tuple):
+        return tuple(remaining if t is None else min(t, remaining) for t in timeout)
+    if timeout is None:
+        return remaining
+    return min(timeout, remaining)
@@ -0,0 +1,106 @@
+"""
+AvaTax Software Development Kit for Python.
+
+   Copyright 2019 Avalara, Inc.
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+
+Tracing hooks: a span per client method call, with trace context sent in
+the request headers. Nothing is traced unless a tracer is given to the client.
+"""
+
+
+class Tracer(object):
+    """
+    Interface of the `tracer` given to a client, called once per client method call.
+
+    start_span is called before the call is sent, retries and hedged
+    attempts included, and end_span once it is done. The span object is
+    opaque to the client, it is only passed back to inject and end_span.
+    """
+
+    def start_span(self, call):
+        """
+        Start the span of a call and return it.
+
+        :param  Call  call:  The call about to be sent, see avalara.call; call.route is the
+            route template, e.g. /api/v2/companies/{companyId}/transactions/{transactionCode}
+        """
+        raise NotImplementedError
+
+    def inject(self, span, headers):
+        """Add the trace context of the span to the outgoing request headers, a dict."""
+
+    def end_span(self, span, response=None, error=None):
+        """
+        End the span of a call.
+
+        :param  Response  response:  Response of the call, if it returned one
+        :param  Exception  error:  Exception raised by the call, if any
+        """
+        raise NotImplementedError
+
+
+class OpenTelemetryTracer(Tracer):
+    """
+    Tracer reporting calls as OpenTelemetry client spans (requires `pip install Avalara[opentelemetry]`).
+
+    Spans are named after the client method and carry the HTTP method, the
+    route template rather than the URL (so company codes and document codes
+    stay out of span attributes), the response status and the
+    x-correlation-id AvaTax answered with. The trace context is injected
+    with the globally configured propagator, W3C traceparent by default.
+    """
+
+    def __init__(self, tracer=None):
+        """
+        Initialize the tracer.
+
+        :param  opentelemetry.trace.Tracer  tracer:  Tracer to start spans with, one from the
+            global tracer provider if omitted
+        """
+        try:
+            from opentelemetry import propagate, trace
+        except ImportError:
+            raise ImportError(
+                'OpenTelemetryTracer requires the opentelemetry-api package: pip install opentelemetry-api'
+            )
+        self._propagate = propagate
+        self._trace = trace
+        self.tracer = tracer if tracer is not None else trace.get_tracer('avalara')
+
+    def start_span(self, call):
+        attributes = {'http.request.method': call.method, 'avalara.endpoint_group': call.group}
+        if call.route is not None:
+            attributes['url.template'] = call.route
+        return self.tracer.start_span(
+            call.operation or call.method, kind=self._trace.SpanKind.CLIENT, attributes=attributes
+        )
+
+    def inject(self, span, headers):
+        self._propagate.inject(headers, context=self._trace.set_span_in_context(span))
+
+    def end_span(self, span, response=None, error=None):
+        if error is not None:
+            span.record_exception(error)
+            span.set_attribute('error.type', type(error).__name__)
+            span.set_status(self._trace.Status(self._trace.StatusCode.ERROR, str(error)))
+        elif response is not None:
+            span.set_attribute('http.response.status_code', response.status_code)
+            correlation_id = response.headers.get('x-correlation-id')
+            if correlation_id:
+                span.set_attribute('avalara.correlation_id', correlation_id)
+            if response.status_code >= 400:
+                span.set_attribute('error.type', str(response.status_code))
+                span.set_status(self._trace.Status(self._trace.StatusCode.ERROR))
+        span.end()
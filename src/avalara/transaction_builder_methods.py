@@ -277,6 +277,8 @@ class Mixin:
         """
         Create this transaction.
 
+        With an AsyncAvataxClient the result is awaitable: `await builder.create()`.
+
         :return: TransactionModel
         """
         return self.client.create_transaction(self.create_model, include)
@@ -0,0 +1,370 @@
+"""
+AvaTax Software Development Kit for Python.
+
+   Copyright 2019 Avalara, Inc.
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+
+Transports put a prepared AvaTax call on the wire and hand back a
+`requests.Response`, whatever HTTP library is used underneath. Network
+failures are likewise raised as `requests` exceptions. The client
+talks to exactly one transport, so it can be swapped without touching the
+generated methods.
+"""
+import datetime
+import inspect
+import json as jsonlib
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from . import phase_timings as timing
+
+try:
+    import httpx
+except ImportError:  # pragma no cover
+    httpx = None
+
+
+def build_response(request, status_code, content=b'', headers=None, elapsed=0.0, reason=None):
+    """
+    Build a `requests.Response` for transports that do not use requests to send.
+
+    :param  PreparedRequest  request:  The request the response answers
+    :param  int  status_code:  HTTP status code
+    :param  bytes  content:  Raw response body
+    :param  dict  headers:  Response headers
+    :param  float  elapsed:  Seconds between sending and receiving the response
+    :param  string  reason:  HTTP reason phrase
+    :return: requests.Response
+    """
+    response = requests.Response()
+    response.status_code = status_code
+    response.reason = reason
+    response._content = content
+    response._content_consumed = True
+    response.headers = CaseInsensitiveDict(headers or {})
+    response.url = request.url
+    response.request = request
+    response.elapsed = datetime.timedelta(seconds=elapsed)
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    return response
+
+
+def _httpx_response(request, result, timings=None):
+    """Build the `requests.Response` of an httpx response, with its phase timings if measured."""
+    response = build_response(
+        request, result.status_code, result.content, result.headers,
+        result.elapsed.total_seconds(), result.reason_phrase
+    )
+    if timings is not None:
+        timings.finish()
+        response.phase_timings = timings.as_dict()
+    return response
+
+
+def translate_httpx_error(error, request):
+    """Map an httpx transport error to the equivalent requests exception."""
+    if isinstance(error, httpx.ConnectTimeout):
+        return requests.ConnectTimeout(error, request=request)
+    if isinstance(error, httpx.TimeoutException):
+        return requests.ReadTimeout(error, request=request)
+    return requests.ConnectionError(error, request=request)
+
+
+class Transport(object):
+    """Base class for the objects that send requests on behalf of the client."""
+
+    def send(self, method, url, params=None, json=None, headers=None, auth=None, timeout=None):
+        """
+        Send a single request and return its response.
+
+        :param  string  method:  HTTP verb
+        :param  string  url:  Absolute URL of the endpoint
+        :param  dict  params:  Query string parameters
+        :param  dict  json:  Request body, serialized as JSON
+        :param  dict  headers:  Request headers
+        :param  AuthBase  auth:  requests authentication object
+        :param  int/float/tuple  timeout:  Timeout in seconds
+        :return: requests.Response
+        """
+        raise NotImplementedError
+
+    def close(self):
+        """Release any connections held by this transport."""
+
+    @staticmethod
+    def prepare(method, url, params=None, json=None, headers=None, auth=None):
+        """Encode a call into a `requests.PreparedRequest`."""
+        return requests.Request(
+            method, url, params=params, json=json, headers=headers, auth=auth
+        ).prepare()
+
+
+class RequestsTransport(Transport):
+    """Default transport, a pooled keep-alive `requests.Session`."""
+
+    def __init__(self, session=None, pool_connections=10, pool_maxsize=10, pool_block=False, phase_timings=False):
+        """
+        Initialize the transport.
+
+        :param  Session  session:  Session to send with, a new one is created if omitted
+        :param  int  pool_connections:  Number of host connection pools to cache
+        :param  int  pool_maxsize:  Maximum number of keep-alive connections kept per host
+        :param  bool  pool_block:  Block when every pooled connection is in use
+        :param  bool  phase_timings:  Set `phase_timings` on every response, see avalara.phase_timings
+        """
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                pool_block=pool_block
+            )
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+        if phase_timings:
+            for adapter in session.adapters.values():
+                if isinstance(adapter, HTTPAdapter):
+                    timing.instrument_pool_manager(adapter.poolmanager)
+        self.session = session
+        self.phase_timings = phase_timings
+
+    def send(self, method, url, params=None, json=None, headers=None, auth=None, timeout=None):
+        if not self.phase_timings:
+            return self.session.request(
+                method, url, params=params, json=json, headers=headers, auth=auth, timeout=timeout
+            )
+        with timing.measure() as timings:
+            response = self.session.request(
+                method, url, params=params, json=json, headers=headers, auth=auth, timeout=timeout
+            )
+        timings.finish()
+        response.phase_timings = timings.as_dict()
+        return response
+
+    def close(self):
+        self.session.close()
+
+
+class Urllib3Transport(Transport):
+    """Transport sending straight through a `urllib3.PoolManager`."""
+
+    def __init__(self, pool_manager=None, num_pools=10, maxsize=10, block=False, phase_timings=False):
+        """
+        Initialize the transport.
+
+        :param  PoolManager  pool_manager:  Pool manager to send with, a new one is created if omitted
+        :param  int  num_pools:  Number of host connection pools to cache
+        :param  int  maxsize:  Maximum number of keep-alive connections kept per host
+        :param  bool  block:  Block when every pooled connection is in use
+        :param  bool  phase_timings:  Set `phase_timings` on every response, see avalara.phase_timings
+        """
+        import urllib3
+        self._urllib3 = urllib3
+        if pool_manager is None:
+            pool_manager = urllib3.PoolManager(num_pools=num_pools, maxsize=maxsize, block=block)
+        if phase_timings:
+            timing.instrument_pool_manager(pool_manager)
+        self.pool_manager = pool_manager
+        self.phase_timings = phase_timings
+
+    def send(self, method, url, params=None, json=None, headers=None, auth=None, timeout=None):
+        request = self.prepare(method, url, params, json, headers, auth)
+        if isinstance(timeout, tuple):
+            timeout = self._urllib3.Timeout(connect=timeout[0], read=timeout[1])
+        start = time.perf_counter()
+        errors = self._urllib3.exceptions
+        timings = None
+        try:
+            if self.phase_timings:
+                with timing.measure() as timings:
+                    result = self._urlopen(request, timeout)
+                timings.finish()
+            else:
+                result = self._urlopen(request, timeout)
+        except errors.NewConnectionError as e:
+            raise requests.ConnectionError(e, request=request)
+        except errors.ConnectTimeoutError as e:
+            raise requests.ConnectTimeout(e, request=request)
+        except errors.ReadTimeoutError as e:
+            raise requests.ReadTimeout(e, request=request)
+        except errors.HTTPError as e:
+            raise requests.ConnectionError(e, request=request)
+        response = build_response(
+            request, result.status, result.data, result.headers,
+            time.perf_counter() - start, result.reason
+        )
+        if timings is not None:
+            response.phase_timings = timings.as_dict()
+        return response
+
+    def _urlopen(self, request, timeout):
+        # the body is read before returning, so the transfer phase ends here
+        return self.pool_manager.urlopen(
+            request.method, request.url, body=request.body, headers=request.headers,
+            timeout=timeout, redirect=False, retries=False
+        )
+
+    def close(self):
+        self.pool_manager.clear()
+
+
+class HttpxTransport(Transport):
+    """Transport sending through an `httpx.Client` (requires the httpx package)."""
+
+    def __init__(self, client=None, phase_timings=False, **client_kwargs):
+        """
+        Initialize the transport.
+
+        :param  httpx.Client  client:  Client to send with, a new one is created if omitted
+        :param  bool  phase_timings:  Set `phase_timings` on every response, see avalara.phase_timings
+        :param  client_kwargs:  Keyword arguments for the new httpx.Client, e.g. limits
+        """
+        if httpx is None:
+            raise ImportError('HttpxTransport requires the httpx package: pip install httpx')
+        self.client = client if client is not None else httpx.Client(**client_kwargs)
+        self.phase_timings = phase_timings
+
+    def send(self, method, url, params=None, json=None, headers=None, auth=None, timeout=None):
+        request = self.prepare(method, url, params, json, headers, auth)
+        if isinstance(timeout, tuple):
+            timeout = httpx.Timeout(None, connect=timeout[0], read=timeout[1])
+        timings = timing.PhaseTimings() if self.phase_timings else None
+        try:
+            result = self.client.request(
+                request.method, request.url, content=request.body,
+                headers=dict(request.headers), timeout=timeout,
+                extensions={'trace': timings.trace} if timings is not None else None
+            )
+        except httpx.TransportError as e:
+            raise translate_httpx_error(e, request)
+        return _httpx_response(request, result, timings)
+
+    def close(self):
+        self.client.close()
+
+
+class MockTransport(Transport):
+    """
+    In-memory transport that never touches the network.
+
+    `handler` is called with the `requests.PreparedRequest` of every call and
+    returns either a `requests.Response` or a `(status_code, body)` /
+    `(status_code, body, headers)` tuple, where a dict/list body is sent as JSON.
+    Every prepared request is recorded in `requests` for inspection.
+    """
+
+    def __init__(self, handler=None):
+        """
+        Initialize the transport.
+
+        :param  callable  handler:  Produces the response for a request, defaults to `200 {}`
+        """
+        self.handler = handler or (lambda request: (200, {}))
+        self.requests = []
+
+    def send(self, method, url, params=None, json=None, headers=None, auth=None, timeout=None):
+        request = self.prepare(method, url, params, json, headers, auth)
+        self.requests.append(request)
+        start = time.perf_counter()
+        return self._to_response(request, self.handler(request), start)
+
+    @staticmethod
+    def _to_response(request, result, start):
+        """Turn what the handler returned into a `requests.Response`."""
+        if isinstance(result, requests.Response):
+            return result
+        status_code, body = result[0], result[1]
+        response_headers = {'x-correlation-id': 'mock'}
+        if len(result) > 2:
+            response_headers.update(result[2])
+        if isinstance(body, (dict, list)):
+            body = jsonlib.dumps(body)
+            response_headers.setdefault('Content-Type', 'application/json; charset=utf-8')
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        return build_response(
+            request, status_code, body or b'', response_headers, time.perf_counter() - start
+        )
+
+class AsyncTransport(Transport):
+    """Base class for the transports used by `AsyncAvataxClient`, `send` is a coroutine."""
+
+    async def send(self, method, url, params=None, json=None, headers=None, auth=None, timeout=None):
+        raise NotImplementedError
+
+    async def close(self):
+        """Release any connections held by this transport."""
+
+
+class HttpxAsyncTransport(AsyncTransport):
+    """Non-blocking transport sending through a pooled `httpx.AsyncClient` (requires httpx)."""
+
+    def __init__(self, client=None, max_connections=10, max_keepalive_connections=10, phase_timings=False,
+                 **client_kwargs):
+        """
+        Initialize the transport.
+
+        :param  httpx.AsyncClient  client:  Client to send with, a new one is created if omitted
+        :param  int  max_connections:  Maximum number of concurrent connections in the pool
+        :param  int  max_keepalive_connections:  Maximum number of idle keep-alive connections
+        :param  bool  phase_timings:  Set `phase_timings` on every response, see avalara.phase_timings
+        :param  client_kwargs:  Other keyword arguments for the new httpx.AsyncClient
+        """
+        if httpx is None:
+            raise ImportError('HttpxAsyncTransport requires the httpx package: pip install httpx')
+        if client is None:
+            client_kwargs.setdefault('limits', httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections
+            ))
+            client = httpx.AsyncClient(**client_kwargs)
+        self.client = client
+        self.phase_timings = phase_timings
+
+    async def send(self, method, url, params=None, json=None, headers=None, auth=None, timeout=None):
+        request = self.prepare(method, url, params, json, headers, auth)
+        if isinstance(timeout, tuple):
+            timeout = httpx.Timeout(None, connect=timeout[0], read=timeout[1])
+        timings = timing.PhaseTimings() if self.phase_timings else None
+        try:
+            result = await self.client.request(
+                request.method, request.url, content=request.body,
+                headers=dict(request.headers), timeout=timeout,
+                extensions={'trace': timings.async_trace} if timings is not None else None
+            )
+        except httpx.TransportError as e:
+            raise translate_httpx_error(e, request)
+        return _httpx_response(request, result, timings)
+
+    async def close(self):
+        await self.client.aclose()
+
+
+class AsyncMockTransport(AsyncTransport, MockTransport):
+    """In-memory `MockTransport` for `AsyncAvataxClient`, the handler may be a coroutine function."""
+
+    async def send(self, method, url, params=None, json=None, headers=None, auth=None, timeout=None):
+        request = self.prepare(method, url, params, json, headers, auth)
+        self.requests.append(request)
+        start = time.perf_counter()
+        result = self.handler(request)
+        if inspect.isawaitable(result):
+            result = await result
+        return self._to_response(request, result, start)
+
+    async def close(self):
+        pass
@@ -1,7 +1,12 @@
 """Conftest is a file recognize by pytest module, allowing us to share fixture across multiple tests."""
-from src.avalara import AvataxClient
+from src.avalara import AsyncAvataxClient, AvataxClient
 from src.avalara.transaction_builder import TransactionBuilder
+from src.avalara.transport import AsyncMockTransport, MockTransport
+from http.server import BaseHTTPRequestHandler, HTTPServer
+import json
+import logging
 import os
+import threading
 import pytest
 
 
@@ -11,6 +16,70 @@ def unauth_client():
     return AvataxClient('test app', 'ver 0.0', 'test machine', 'sandbox')
 
 
+def _client_factory(client_class, transport_class):
+    """Return make(handler=None, environment='sandbox', **client_kwargs) building `client_class` clients."""
+    def make(handler=None, environment='sandbox', **kwargs):
+        if kwargs.get('transport') is None:
+            kwargs['transport'] = transport_class(handler)
+        return client_class('test app', 'ver 0.0', 'test machine', environment, **kwargs)
+    return make
+
+
+@pytest.fixture
+def make_client():
+    """
+    Return a factory of sandbox clients answering their calls in memory.
+
+    make_client(handler=None, environment='sandbox', **client_kwargs) sends
+    through a MockTransport calling `handler`, unless a `transport` is passed,
+    e.g. a network transport with the local_server url as `environment`.
+    """
+    return _client_factory(AvataxClient, MockTransport)
+
+
+@pytest.fixture
+def make_async_client():
+    """Return a factory of AsyncAvataxClient like make_client, answering through an AsyncMockTransport."""
+    return _client_factory(AsyncAvataxClient, AsyncMockTransport)
+
+
+@pytest.fixture
+def logger():
+    """Logger given to clients under test, its level, handlers and propagation restored afterwards."""
+    logger = logging.getLogger('avalara.test')
+    level, propagate, handlers = logger.level, logger.propagate, list(logger.handlers)
+    yield logger
+    logger.setLevel(level)
+    logger.propagate = propagate
+    logger.handlers = handlers
+
+
+@pytest.fixture(scope='session')
+def local_server():
+    """Start a local keep-alive HTTP server answering every GET with its path as JSON."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self):
+            body = json.dumps({'path': self.path}).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.send_header('x-correlation-id', 'local')
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield 'http://127.0.0.1:{}'.format(server.server_port)
+    server.shutdown()
+
+
 @pytest.fixture(scope='session')
 def auth_client():
     """Create an instance of SanboxClient with authentification using username/password pair."""
@@ -0,0 +1,82 @@
+"""Test the address resolution cache."""
+from src.avalara.address_cache import AddressCache, canonical_address
+from src.avalara.cache import SqliteStore
+
+
+ADDRESS = {
+    'line1': '100 Ravine Lane Northeast', 'line2': 'Suite 220', 'city': 'Bainbridge Island',
+    'region': 'WA', 'postalCode': '98110', 'country': 'US',
+}
+
+
+def test_spellings_of_an_address_share_a_key():
+    """Test case, whitespace, punctuation, abbreviations and country names are normalized."""
+    spelled = {
+        'Line1': ' 100  ravine ln. NE ', 'LINE2': 'ste 220', 'city': 'BAINBRIDGE ISLAND',
+        'region': 'wa', 'postalcode': '98110', 'country': 'United States',
+    }
+    assert canonical_address(spelled) == canonical_address(ADDRESS)
+    assert canonical_address(dict(ADDRESS, postalCode='98111')) != canonical_address(ADDRESS)
+    assert canonical_address(dict(ADDRESS, textCase='Mixed')) != canonical_address(ADDRESS)
+    assert canonical_address({'postalCode': 'V6B 1A1'}) == canonical_address({'postalCode': 'v6b1a1'})
+
+
+def test_region_and_country_names_are_codes():
+    """Test US and Canadian region names match their postal codes, other countries' regions are kept."""
+    assert canonical_address(dict(ADDRESS, region='Washington', country='U.S.A.')) == canonical_address(ADDRESS)
+    assert canonical_address({'region': 'District of Columbia'}) == canonical_address({'region': 'dc'})
+    assert canonical_address({'region': 'Québec', 'country': 'Canada'}) == canonical_address(
+        {'region': 'QC', 'country': 'CA'}
+    )
+    assert canonical_address({'region': 'Jalisco', 'country': 'Mexico'}) == canonical_address(
+        {'region': 'JALISCO', 'country': 'MX'}
+    )
+    assert canonical_address({'region': 'Georgia', 'country': 'GE'}) != canonical_address(
+        {'region': 'GA', 'country': 'GE'}
+    )
+
+
+def test_get_and_post_share_resolutions(make_client):
+    """Test resolve_address and resolve_address_post answer each other's addresses."""
+    cache = AddressCache()
+    client = cache.install(make_client(lambda request: (200, {'validatedAddresses': [{'line1': '100 RAVINE LN NE'}]})))
+    client.resolve_address(ADDRESS)
+    client.resolve_address_post(dict(ADDRESS, line1='100 Ravine Ln NE'))
+    response = client.resolve_address(dict(ADDRESS, city='bainbridge island'))
+    assert len(client.transport.requests) == 1
+    assert response.from_cache
+    assert response.json()['validatedAddresses'][0]['line1'] == '100 RAVINE LN NE'
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_other_addresses_and_errors_are_fetched(make_client):
+    """Test different addresses and failed resolutions reach the API."""
+    answers = iter([(500, {}), (200, {}), (200, {})])
+    client = AddressCache().install(make_client(lambda request: next(answers)))
+    client.resolve_address(ADDRESS)
+    client.resolve_address(ADDRESS)
+    client.resolve_address(dict(ADDRESS, line1='200 Winslow Way'))
+    client.resolve_address(ADDRESS)
+    assert len(client.transport.requests) == 3
+
+
+def test_bounded_and_invalidated(make_client):
+    """Test max_entries bounds the cache and invalidate accepts either method."""
+    cache = AddressCache(max_entries=1)
+    client = cache.install(make_client())
+    client.resolve_address(ADDRESS)
+    client.resolve_address(dict(ADDRESS, line1='200 Winslow Way'))
+    client.resolve_address(ADDRESS)
+    assert len(client.transport.requests) == 3
+    cache.invalidate('resolve_address_post')
+    client.resolve_address(ADDRESS)
+    assert len(client.transport.requests) == 4
+
+
+def test_persistent_backend(tmp_path, make_client):
+    """Test resolutions kept in a sqlite store survive a new cache."""
+    path = str(tmp_path / 'addresses.sqlite')
+    AddressCache(store=SqliteStore(path)).install(make_client()).resolve_address_post(ADDRESS)
+    client = AddressCache(store=SqliteStore(path)).install(make_client())
+    assert client.resolve_address(ADDRESS).from_cache
+    assert client.transport.requests == []
@@ -0,0 +1,69 @@
+"""Test the asyncio client."""
+import asyncio
+import json
+
+import pytest
+import requests
+from src.avalara import AsyncAvataxClient
+from src.avalara.transaction_builder import TransactionBuilder
+from src.avalara.transport import AsyncMockTransport
+
+
+@pytest.fixture
+def async_transport():
+    """Create an in-memory async transport answering every call with an empty object."""
+    return AsyncMockTransport()
+
+
+@pytest.fixture
+def async_client(make_async_client, async_transport):
+    """Create an async client sending through the in-memory transport."""
+    return make_async_client(transport=async_transport)
+
+
+def test_async_methods_return_awaitables(async_client):
+    """Test generated methods are awaited for their response."""
+    response = asyncio.run(async_client.ping())
+    assert isinstance(response, requests.Response)
+    assert response.status_code == 200
+
+
+def test_async_calls_run_concurrently(async_transport, async_client):
+    """Test many calls share one event loop without blocking each other."""
+    in_flight = []
+
+    async def handler(request):
+        in_flight.append(request)
+        await asyncio.sleep(0.05)
+        return 200, {'calls': len(in_flight)}
+
+    async_transport.handler = handler
+
+    async def run():
+        return await asyncio.gather(*(async_client.ping() for _ in range(50)))
+
+    responses = asyncio.run(run())
+    assert all(r.json()['calls'] == 50 for r in responses)
+
+
+def test_async_transaction_builder_create(async_transport, async_client):
+    """Test TransactionBuilder.create can be awaited on an async client."""
+    builder = TransactionBuilder(async_client, 'DEFAULT', 'SalesOrder', 'ABC')
+    response = asyncio.run(builder.with_transaction_code('T1').create())
+    assert response.status_code == 200
+    assert json.loads(async_transport.requests[-1].body)['code'] == 'T1'
+
+
+def test_default_async_transport_uses_httpx():
+    """Test the default transport is a shared httpx connection pool."""
+    httpx = pytest.importorskip('httpx')
+    client = AsyncAvataxClient('test app', 'ver 0.0', 'test machine', 'sandbox')
+    assert isinstance(client.transport.client, httpx.AsyncClient)
+    asyncio.run(client.close())
+
+
+def test_async_calls_are_logged_once_awaited(async_client, caplog):
+    """Test the dispatcher logs the response of an awaited call."""
+    with caplog.at_level('INFO'):
+        asyncio.run(async_client.ping())
+    assert caplog.records[-1].status_code == 200
@@ -0,0 +1,105 @@
+"""Test the concurrent fan-out API."""
+import asyncio
+import threading
+import time
+
+import pytest
+import requests
+from src.avalara.transport import MockTransport
+
+
+def code_of(request):
+    """Return the transaction code of a get_transaction_by_code url."""
+    return request.path_url.split('/')[-1]
+
+
+@pytest.fixture
+def lookup_client(make_client):
+    """Create a client whose transaction lookups take longer for lower codes."""
+    active = []
+    peak = []
+    lock = threading.Lock()
+
+    def handler(request):
+        code = code_of(request)
+        with lock:
+            active.append(code)
+            peak.append(len(active))
+        time.sleep(0.01 * (10 - int(code)))
+        with lock:
+            active.remove(code)
+        if code == '3':
+            raise requests.ConnectionError('reset')
+        return 200, {'code': code}
+
+    client = make_client(handler)
+    client.peak = peak
+    return client
+
+
+def test_map_yields_results_in_input_order(lookup_client):
+    """Test ordered results line up with their input items."""
+    args = [('DEFAULT', str(code)) for code in range(10)]
+    results = list(lookup_client.map('get_transaction_by_code', args, max_workers=4))
+    assert [r.index for r in results] == list(range(10))
+    assert [r.args for r in results] == args
+    assert max(lookup_client.peak) <= 4
+
+
+def test_map_collects_errors_per_item(lookup_client):
+    """Test a failing item is reported without aborting the others."""
+    results = list(lookup_client.map('get_transaction_by_code', [('DEFAULT', str(code)) for code in range(6)]))
+    failed = [r for r in results if not r.ok]
+    assert len(failed) == 1
+    assert failed[0].index == 3
+    assert isinstance(failed[0].error, requests.ConnectionError)
+    assert results[5].response.json() == {'code': '5'}
+
+
+def test_map_can_yield_as_completed(lookup_client):
+    """Test unordered results arrive fastest first."""
+    args = [('DEFAULT', str(code)) for code in range(5)]
+    results = list(lookup_client.map('get_transaction_by_code', args, max_workers=5, ordered=False))
+    assert [r.index for r in results] == [4, 3, 2, 1, 0]
+
+
+def test_map_accepts_keyword_and_single_arguments(make_client):
+    """Test dict items are keyword arguments and scalars a single argument."""
+    transport = MockTransport()
+    client = make_client(transport=transport)
+    list(client.map('get_account', [{'id_': 1, 'include': {'$include': 'Users'}}]))
+    list(client.map('get_account', [2]))
+    assert [request.path_url for request in transport.requests] == [
+        '/api/v2/accounts/1?%24include=Users', '/api/v2/accounts/2'
+    ]
+
+
+def test_map_keeps_the_deadline_of_the_caller(make_client):
+    """Test calls run on the pool threads see the deadline set around the map."""
+    deadlines = []
+    client = make_client(pre_send_hooks=[lambda call: deadlines.append(call.deadline_at)])
+    with client.deadline(30):
+        results = list(client.map('get_account', [1, 2, 3]))
+    assert all(result.ok for result in results)
+    assert len(deadlines) == 3 and None not in deadlines
+
+
+def test_async_map(make_async_client):
+    """Test the async client fans out with bounded concurrency."""
+
+    async def handler(request):
+        await asyncio.sleep(0.01)
+        return 200, {'code': code_of(request)}
+
+    client = make_async_client(handler)
+
+    args = [('DEFAULT', str(c)) for c in range(20)]
+    args.insert(5, ('DEFAULT',))
+
+    async def run():
+        return [r async for r in client.map('get_transaction_by_code', args)]
+
+    results = asyncio.run(run())
+    bad = results.pop(5)
+    assert isinstance(bad.error, TypeError) and bad.index == 5
+    assert [r.response.json()['code'] for r in results] == [str(c) for c in range(20)]
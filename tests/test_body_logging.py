@@ -0,0 +1,87 @@
+"""Test the sampling, capping and redaction of logged bodies."""
+import json
+import logging
+
+from src.avalara.body_logging import ADDRESS_FIELDS, REDACTED, BodyLogPolicy
+
+
+ADDRESS = {'line1': '100 Ravine Lane', 'city': 'Bainbridge Island', 'region': 'WA', 'postalCode': '98110'}
+
+
+def logged_calls(make_client, logger, caplog, policy, answers, model=None):
+    """Make one create_transaction call per (status, body) answer and return the log records."""
+    answers = iter(answers)
+    client = make_client(
+        lambda request: next(answers), logger=logger, is_log_req_resp_allowed=True, body_log_policy=policy
+    )
+    with caplog.at_level(logging.INFO, logger=logger.name):
+        while True:
+            try:
+                client.create_transaction(model or {'type': 'SalesOrder'})
+            except StopIteration:
+                break
+    # the StopIteration ending the loop is logged as a failed call
+    return [record for record in caplog.records if hasattr(record, 'status_code')]
+
+
+def test_one_in_n_calls_is_sampled(make_client, logger, caplog):
+    """Test sample_every keeps the bodies of 1 in N calls."""
+    records = logged_calls(make_client, logger, caplog, BodyLogPolicy(sample_every=3), [(200, {})] * 6)
+    assert [hasattr(r, 'response_body') for r in records] == [True, False, False, True, False, False]
+
+
+def test_errors_are_always_logged(make_client, logger, caplog):
+    """Test sample_every=0 logs the bodies of failed calls only."""
+    records = logged_calls(
+        make_client, logger, caplog, BodyLogPolicy(sample_every=0), [(200, {}), (400, {'error': 1})]
+    )
+    assert not hasattr(records[0], 'response_body')
+    assert json.loads(records[1].response_body) == {'error': 1}
+    assert json.loads(records[1].request_body) == {'type': 'SalesOrder'}
+
+
+def test_slow_calls_are_always_logged():
+    """Test slow_call_threshold selects calls by duration."""
+    policy = BodyLogPolicy(sample_every=0, slow_call_threshold=0.5)
+    assert not policy.should_log(200, 499)
+    assert policy.should_log(200, 500)
+
+
+def test_bodies_are_capped():
+    """Test max_bytes truncates each body and says so."""
+    policy = BodyLogPolicy(max_bytes=10)
+    assert policy.render(b'0123456789abcdef') == '0123456789... [truncated, 16 bytes]'
+    assert policy.render('short') == 'short'
+    assert policy.render('été'.encode('utf-8')) == 'été'
+    assert policy.render('é' * 10) == 'ééééé... [truncated, 20 bytes]'
+
+
+def test_addresses_are_redacted(make_client, logger, caplog):
+    """Test address fields are replaced in request and response bodies."""
+    model = {'type': 'SalesOrder', 'addresses': {'singleLocation': ADDRESS}}
+    response = {'addresses': [dict(ADDRESS, id=1)]}
+    records = logged_calls(
+        make_client, logger, caplog, BodyLogPolicy(redact_fields=ADDRESS_FIELDS), [(200, response)], model
+    )
+    request_body = json.loads(records[0].request_body)
+    assert request_body['addresses']['singleLocation'] == {
+        'line1': REDACTED, 'city': REDACTED, 'region': 'WA', 'postalCode': REDACTED
+    }
+    assert json.loads(records[0].response_body)['addresses'][0]['line1'] == REDACTED
+    assert '98110' not in records[0].response_body
+
+
+def test_without_policy_every_body_is_logged(make_client, logger, caplog):
+    """Test the previous all-or-nothing behavior is kept when no policy is set."""
+    records = logged_calls(make_client, logger, caplog, None, [(200, {'id': 1})] * 2)
+    assert all(json.loads(r.response_body) == {'id': 1} for r in records)
+
+
+def test_address_query_parameters_are_redacted(make_client, logger, caplog):
+    """Test the fields are also redacted from the logged url, matching parameter names case insensitively."""
+    client = make_client(logger=logger, body_log_policy=BodyLogPolicy(redact_fields=ADDRESS_FIELDS))
+    with caplog.at_level(logging.INFO, logger=logger.name):
+        client.resolve_address(dict(ADDRESS, POSTALCODE='98110'))
+    url = caplog.records[0].request_url
+    assert url.split('?')[1] == 'line1={0}&city={0}&region=WA&postalCode={0}&POSTALCODE={0}'.format(REDACTED)
+    assert 'Ravine' not in caplog.records[0].getMessage()
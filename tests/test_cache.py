@@ -0,0 +1,221 @@
+"""Test the reference data response cache."""
+import asyncio
+import os
+import sqlite3
+import subprocess
+import sys
+import time
+
+from src.avalara.cache import CachedResponse, MemoryStore, ResponseCache, SqliteStore
+
+
+def test_definitions_are_served_from_cache(make_client):
+    """Test a second identical definitions call does not reach the transport."""
+    cache = ResponseCache()
+    client = cache.install(make_client(lambda request: (200, {'value': [{'code': 'US'}]})))
+    first = client.list_countries(None)
+    second = client.list_countries(None)
+    assert len(client.transport.requests) == 1
+    assert second.json() == first.json() == {'value': [{'code': 'US'}]}
+    assert second.from_cache and not hasattr(first, 'from_cache')
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_keys_use_method_path_and_normalized_params(make_client):
+    """Test path arguments split keys, while parameter order, case and empty values do not."""
+    client = ResponseCache().install(make_client())
+    client.list_regions_by_country('US', {'$top': 10, '$filter': None})
+    client.list_regions_by_country('US', {'$TOP': '10'})
+    client.list_regions_by_country('CA', {'$top': 10})
+    client.list_regions_by_country('US', {'$top': 20})
+    assert [r.url.split('definitions/')[1] for r in client.transport.requests] == [
+        'countries/US/regions?%24top=10', 'countries/CA/regions?%24top=10', 'countries/US/regions?%24top=20'
+    ]
+
+
+def test_only_opted_in_successful_gets_are_cached(make_client):
+    """Test other groups, writes and errors are not cached."""
+    answers = iter([(500, {}), (200, {}), (200, {})])
+    client = ResponseCache().install(make_client(lambda request: next(answers, (200, {}))))
+    client.list_tax_codes(None)
+    client.list_tax_codes(None)
+    client.list_tax_codes(None)
+    client.get_company(1, None)
+    client.get_company(1, None)
+    client.create_transaction({})
+    client.create_transaction({})
+    assert len(client.transport.requests) == 6
+
+
+def test_per_method_ttl_and_invalidate(make_client):
+    """Test ttls override ttl, and invalidate forgets the responses of a method."""
+    cache = ResponseCache(ttl=3600, ttls={'list_currencies': 0.01})
+    client = cache.install(make_client())
+    client.list_currencies(None)
+    client.list_parameters(None)
+    time.sleep(0.02)
+    client.list_currencies(None)
+    client.list_parameters(None)
+    assert len(client.transport.requests) == 3
+    cache.invalidate('list_parameters')
+    client.list_parameters(None)
+    assert len(client.transport.requests) == 4
+
+
+def test_operations_choose_the_cached_methods(make_client):
+    """Test operations replaces the definitions default."""
+    client = ResponseCache(operations=['get_company']).install(make_client())
+    client.get_company(1, None)
+    client.get_company(1, None)
+    client.list_countries(None)
+    client.list_countries(None)
+    assert len(client.transport.requests) == 3
+
+
+def test_memory_store_evicts_least_recently_used():
+    """Test max_entries and max_bytes evict the least recently used responses."""
+    store = MemoryStore(max_entries=2, max_bytes=10)
+
+    def entry(size):
+        return CachedResponse(200, b'x' * size, {}, 0, float('inf'))
+
+    store.set('a', entry(4))
+    store.set('b', entry(4))
+    store.get('a')
+    store.set('c', entry(4))
+    assert store.get('b') is None and store.get('a') is not None
+    store.set('d', entry(8))
+    assert len(store) == 1 and store.bytes == 8
+    store.set('e', entry(11))
+    assert store.get('e') is None
+    assert store.evictions == 3
+
+
+def test_sqlite_store_is_shared_between_processes(tmp_path, make_client):
+    """Test a second store on the same file, as in a new worker process, starts warm."""
+    path = str(tmp_path / 'definitions.sqlite')
+    warm = ResponseCache(store=SqliteStore(path)).install(make_client(lambda request: (200, {'value': ['US']})))
+    warm.list_countries(None)
+    cold = ResponseCache(store=SqliteStore(path)).install(make_client())
+    response = cold.list_countries(None)
+    assert cold.transport.requests == []
+    assert response.json() == {'value': ['US']}
+    assert response.headers['x-correlation-id'] == 'mock'
+    assert response.cache_age >= 0 and not response.stale
+
+
+def test_sqlite_store_bounds(tmp_path):
+    """Test the sqlite store evicts the least recently used responses and forgets by prefix."""
+    store = SqliteStore(str(tmp_path / 'cache.sqlite'), max_entries=2, max_bytes=10, touch_interval=0)
+
+    def entry(size):
+        return CachedResponse(200, b'x' * size, {}, 0, float('inf'))
+
+    store.set('list_a x', entry(4))
+    store.set('list_b x', entry(4))
+    store.get('list_a x')
+    store.set('list_c x', entry(4))
+    assert store.get('list_b x') is None and store.get('list_a x').content == b'xxxx'
+    store.set('list_d x', entry(8))
+    assert len(store) == 1 and store.bytes == 8
+    store.delete_prefix('list_d ')
+    assert len(store) == 0
+    store.close()
+
+
+def test_locked_sqlite_store_does_not_fail_calls(tmp_path, make_client):
+    """Test a store locked by another process serves hits at once, without a touch, and soon skips writes."""
+    path = str(tmp_path / 'definitions.sqlite')
+    cache = ResponseCache(store=SqliteStore(path, touch_interval=0, write_timeout=0.05))
+    client = cache.install(make_client(lambda request: (200, {'value': ['US']})))
+    client.list_countries(None)
+    other = sqlite3.connect(path, isolation_level=None)
+    other.execute('BEGIN IMMEDIATE')
+    try:
+        start = time.perf_counter()
+        assert client.list_countries(None).from_cache
+        assert time.perf_counter() - start < 0.05
+        start = time.perf_counter()
+        assert client.list_currencies(None).status_code == 200
+        assert time.perf_counter() - start < 0.5
+    finally:
+        other.execute('ROLLBACK')
+        other.close()
+    assert cache.store_errors == 1
+    assert client.list_currencies(None).status_code == 200
+    assert len(client.transport.requests) == 3
+    assert client.list_currencies(None).from_cache
+
+
+class BrokenStore(MemoryStore):
+    """Store failing every operation."""
+
+    def get(self, key):
+        raise OSError('disk unavailable')
+
+    def set(self, key, entry):
+        raise OSError('disk unavailable')
+
+
+def test_store_errors_count_as_misses(make_client):
+    """Test a failing store neither fails calls nor serves them."""
+    cache = ResponseCache(store=BrokenStore())
+    client = cache.install(make_client())
+    assert client.list_countries(None).status_code == 200
+    assert client.list_countries(None).status_code == 200
+    assert len(client.transport.requests) == 2
+    assert (cache.misses, cache.store_errors) == (2, 4)
+
+
+def test_stale_response_is_served_while_refreshed(make_client):
+    """Test an expired response is served at once and replaced in the background."""
+    answers = iter([(200, {'version': 1}), (200, {'version': 2})])
+    cache = ResponseCache(ttl=0.01, stale_while_revalidate=60)
+    client = cache.install(make_client(lambda request: next(answers)))
+    client.list_entity_use_codes(None)
+    time.sleep(0.02)
+    stale = client.list_entity_use_codes(None)
+    assert stale.stale and stale.json() == {'version': 1}
+    cache.shutdown()
+    assert cache.refreshes == 1
+    assert client.list_entity_use_codes(None).json() == {'version': 2}
+    assert len(client.transport.requests) == 2
+
+
+def test_too_stale_response_is_fetched(make_client):
+    """Test a response expired for longer than stale_while_revalidate is not served."""
+    cache = ResponseCache(ttl=0.01, stale_while_revalidate=0.01)
+    client = cache.install(make_client())
+    client.list_currencies(None)
+    time.sleep(0.03)
+    assert not hasattr(client.list_currencies(None), 'from_cache')
+
+
+def test_async_client_refreshes_on_its_loop(make_async_client):
+    """Test the async client refreshes stale responses as a task of its event loop."""
+    answers = iter([(200, {'version': 1}), (200, {'version': 2})])
+    cache = ResponseCache(ttl=0.01, stale_while_revalidate=60)
+    client = cache.install(make_async_client(lambda request: next(answers)))
+
+    async def scenario():
+        await client.list_parameters(None)
+        await asyncio.sleep(0.02)
+        stale = await client.list_parameters(None)
+        for _ in range(100):
+            if cache.refreshes:
+                break
+            await asyncio.sleep(0.001)
+        return stale, await client.list_parameters(None)
+
+    stale, fresh = asyncio.run(scenario())
+    assert stale.stale and stale.json() == {'version': 1}
+    assert fresh.json() == {'version': 2} and not fresh.stale
+
+
+def test_import_does_not_load_asyncio():
+    """Test synchronous users of the cache do not pay for importing asyncio."""
+    output = subprocess.run(
+        [sys.executable, '-c', 'import sys, avalara.cache; print("asyncio" in sys.modules)'],
+        cwd=os.path.join(os.path.dirname(__file__), '..', 'src'), capture_output=True, text=True, check=True
+    ).stdout
+    assert output.strip() == 'False'
@@ -0,0 +1,132 @@
+"""Test the per endpoint group circuit breaker."""
+import asyncio
+
+import pytest
+import requests
+from src.avalara.circuit_breaker import CLOSED, HALF_OPEN, OPEN, Circuit, CircuitBreaker, CircuitOpenError
+from src.avalara.rate_limit import RateLimiter
+from src.avalara.timeouts import DeadlineExceeded
+from src.avalara.transport import MockTransport
+
+
+@pytest.fixture
+def outage():
+    """Create a transport whose transactions endpoints fail until `healthy` is set."""
+    state = {'healthy': False}
+
+    def handler(request):
+        if '/transactions/' in request.url and not state['healthy']:
+            return 503, {}
+        return 200, {}
+    transport = MockTransport(handler)
+    transport.state = state
+    return transport
+
+
+def test_circuit_opens_after_consecutive_failures(make_client, outage):
+    """Test the circuit fails fast once the failure threshold is reached."""
+    breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=60)
+    client = make_client(transport=outage, circuit_breaker=breaker)
+    for _ in range(3):
+        assert client.create_transaction({}).status_code == 503
+    with pytest.raises(CircuitOpenError) as error:
+        client.create_transaction({})
+    assert error.value.group == 'transactions'
+    assert len(outage.requests) == 3
+
+
+def test_open_circuit_does_not_affect_other_groups(make_client, outage):
+    """Test only the failing endpoint group is short-circuited."""
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=60)
+    client = make_client(transport=outage, circuit_breaker=breaker)
+    client.create_transaction({})
+    assert breaker.circuit('transactions').state == OPEN
+    assert client.resolve_address_post({}).status_code == 200
+
+
+def test_circuit_open_error_is_a_request_exception():
+    """Test callers handling requests exceptions also handle an open circuit."""
+    assert issubclass(CircuitOpenError, requests.RequestException)
+
+
+def test_half_open_probe_closes_circuit(make_client, outage):
+    """Test a successful probe after the recovery timeout closes the circuit."""
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0)
+    client = make_client(transport=outage, circuit_breaker=breaker)
+    client.create_transaction({})
+    outage.state['healthy'] = True
+    assert client.create_transaction({}).status_code == 200
+    assert breaker.circuit('transactions').state == CLOSED
+
+
+def test_half_open_allows_limited_probes():
+    """Test only one probe is let through while half-open."""
+    circuit = Circuit(failure_threshold=1, recovery_timeout=0)
+    circuit.record_failure()
+    circuit.before_call()
+    assert circuit.state == HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        circuit.before_call()
+    circuit.record_failure()
+    assert circuit.state == OPEN
+
+
+def test_slow_calls_count_as_failures():
+    """Test calls above the latency threshold open the circuit."""
+    circuit = Circuit(failure_threshold=2, slow_call_threshold=1.0)
+    circuit.record(200, 1.5)
+    circuit.record(200, 2.0)
+    assert circuit.state == OPEN
+
+
+def test_network_errors_count_as_failures(make_client):
+    """Test exceptions raised by the transport are recorded as failures."""
+
+    def handler(request):
+        raise requests.ConnectionError('reset')
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=60)
+    client = make_client(handler, circuit_breaker=breaker)
+    with pytest.raises(requests.ConnectionError):
+        client.ping()
+    assert breaker.circuit('default').state == OPEN
+
+
+def test_group_settings_override_defaults():
+    """Test per group circuit arguments."""
+    breaker = CircuitBreaker(failure_threshold=5, groups={'reports': {'failure_threshold': 1}})
+    assert breaker.circuit('reports').failure_threshold == 1
+    assert breaker.circuit('transactions').failure_threshold == 5
+
+
+def test_probe_is_released_when_the_rate_limit_outlasts_the_deadline(make_client, outage):
+    """Test a probe refused by the rate limiter does not keep the circuit half-open forever."""
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0)
+    client = make_client(
+        transport=outage, circuit_breaker=breaker, rate_limiter=RateLimiter(rate=1, burst=1)
+    )
+    client.create_transaction({})
+    with pytest.raises(DeadlineExceeded):
+        with client.deadline(0.1):
+            client.create_transaction({})
+    circuit = breaker.circuit('transactions')
+    assert circuit.state == HALF_OPEN
+    assert circuit.before_call()
+
+
+def test_cancelled_probe_is_released(make_async_client):
+    """Test an async probe cancelled while in flight gives its slot back."""
+    async def hang(request):
+        await asyncio.sleep(10)
+
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0)
+    breaker.circuit('transactions').record_failure()
+    client = make_async_client(hang, circuit_breaker=breaker)
+
+    async def scenario():
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(client.create_transaction({}), 0.01)
+
+    asyncio.run(scenario())
+    circuit = breaker.circuit('transactions')
+    assert circuit.state == HALF_OPEN
+    assert circuit.before_call()
@@ -1,4 +1,5 @@
 """Test the client model."""
+import requests
 from src.avalara.client import AvataxClient
 
 
@@ -47,3 +48,21 @@ def test_client_can_obtain_their_own_base_url():
         'test app', 'ver 0.0', 'test machine', 'https://myurl.com'
     )
     assert client.base_url == 'https://myurl.com'
+
+
+def test_client_reuses_one_session(unauth_client):
+    """Test the client owns a single pooled session for all calls."""
+    assert isinstance(unauth_client.session, requests.Session)
+    adapter = unauth_client.session.get_adapter('https://rest.avatax.com')
+    assert adapter is unauth_client.session.get_adapter('http://localhost')
+
+
+def test_client_pool_settings_are_configurable():
+    """Test the connection pool size and blocking can be set on the client."""
+    client = AvataxClient(
+        'test app', 'ver 0.0', 'test machine', 'sandbox',
+        pool_maxsize=25, pool_block=True
+    )
+    adapter = client.session.get_adapter(client.base_url)
+    assert adapter._pool_maxsize == 25
+    assert adapter._pool_block is True
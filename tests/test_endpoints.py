@@ -0,0 +1,148 @@
+"""Test the client methods generated from the endpoint table."""
+import importlib
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+from src.avalara.client_methods import API_VERSION, METHOD_MODULES, Mixin, load_modules
+from src.avalara.endpoint_groups import endpoint_group
+from src.avalara.endpoints import MODULES
+from src.avalara.rate_limit import RateLimiter
+from src.avalara.transport import MockTransport
+
+
+@pytest.fixture
+def transport():
+    """Record the calls of a client."""
+    return MockTransport()
+
+
+@pytest.fixture
+def client(make_client, transport):
+    """Client sending every call to the mock transport."""
+    return make_client(transport=transport)
+
+
+@pytest.mark.parametrize('name', sorted(MODULES))
+def test_module_index_matches_table(name):
+    """Test the method names indexed for a module are the ones of its endpoint table."""
+    module = importlib.import_module('src.avalara.endpoints.' + name)
+    assert [row[0] for row in module.ENDPOINTS] == MODULES[name].split()
+
+
+# endpoint group of the routes of each table, see avalara.endpoint_groups
+TABLE_ENDPOINT_GROUPS = {
+    'addresses': 'addresses', 'definitions': 'definitions', 'reports': 'reports',
+    'tax_content': 'taxcontent', 'transactions': 'transactions',
+}
+
+# methods whose route belongs to another endpoint group than the rest of their table
+ENDPOINT_GROUP_EXCEPTIONS = {
+    'deregister_shipment': 'transactions', 'register_shipment': 'transactions',
+    'register_shipment_if_compliant': 'transactions', 'verify_shipment': 'transactions',
+    'list_recommended_parameter_by_company_id_and_item_id': 'definitions',
+    'get_all_variance_report_by_company_code': 'reports', 'variance_report': 'reports',
+}
+
+
+@pytest.mark.parametrize('name', sorted(MODULES))
+def test_every_route_is_in_its_endpoint_group(name):
+    """Test the rate limit, circuit and timeout group of each route, e.g. add_lines is a transactions call."""
+    module = importlib.import_module('src.avalara.endpoints.' + name)
+    expected = TABLE_ENDPOINT_GROUPS.get(name, 'default')
+    assert dict((row[0], endpoint_group(row[2])) for row in module.ENDPOINTS) == dict(
+        (row[0], ENDPOINT_GROUP_EXCEPTIONS.get(row[0], expected)) for row in module.ENDPOINTS
+    )
+
+
+def test_every_endpoint_is_a_method(make_client):
+    """Test each row of the tables becomes a uniquely named Mixin method."""
+    load_modules()
+    names = [name for names in MODULES.values() for name in names.split()]
+    assert len(names) == len(set(names)) == len(METHOD_MODULES) == 482
+    assert all(callable(getattr(Mixin, name)) for name in names)
+    assert Mixin.get_account.__name__ == 'get_account'
+    assert 'create_transaction' in dir(make_client())
+
+
+def test_unknown_attribute_raises_attribute_error(client):
+    """Test lookups of names that are not client methods still fail."""
+    assert not hasattr(client, 'no_such_method')
+    with pytest.raises(AttributeError):
+        getattr(Mixin, 'no_such_method')
+
+
+def test_modules_load_on_first_use():
+    """Test importing avalara and creating a client loads no module, and a call only loads its own."""
+    code = (
+        'import sys\n'
+        'from avalara import AvataxClient\n'
+        'from avalara.transport import MockTransport\n'
+        'loaded = lambda: sorted(m for m in sys.modules if m.startswith("avalara.endpoints."))\n'
+        'client = AvataxClient("app", transport=MockTransport())\n'
+        'print(loaded(), "asyncio" in sys.modules)\n'
+        'client.ping()\n'
+        'print(loaded())\n'
+    )
+    output = subprocess.run(
+        [sys.executable, '-c', code], cwd=os.path.join(os.path.dirname(__file__), '..', 'src'), capture_output=True, text=True, check=True
+    ).stdout.splitlines()
+    assert output == ["[] False", "['avalara.endpoints.utilities']"]
+
+
+def test_methods_pass_the_endpoint_group_of_their_route(make_client, monkeypatch):
+    """Test a generated method does not match its path against the endpoint groups on every call."""
+    limiter = RateLimiter(rate=1000)
+    client = make_client(rate_limiter=limiter)
+    monkeypatch.setattr('src.avalara.client.endpoint_group', lambda path: pytest.fail(path))
+    client.add_lines({'companyCode': 'DEFAULT'})
+    assert list(limiter._buckets) == ['transactions']
+
+
+def test_path_arguments_and_query(client, transport):
+    """Test path arguments fill the route and include is sent as the query string."""
+    client.get_account(123, {'$include': 'Subscriptions'})
+    request = transport.requests[0]
+    assert request.method == 'GET'
+    assert request.url == 'https://sandbox-rest.avatax.com/api/v2/accounts/123?%24include=Subscriptions'
+    assert request.body is None
+
+
+def test_keyword_arguments(client, transport):
+    """Test arguments can be passed by keyword, in any order."""
+    client.create_transaction(include={'$include': 'Lines'}, model={'type': 'SalesOrder'})
+    request = transport.requests[0]
+    assert request.url.endswith('/api/v2/transactions/create?%24include=Lines')
+    assert json.loads(request.body) == {'type': 'SalesOrder'}
+
+
+def test_route_order_differs_from_signature(client, transport):
+    """Test arguments are placed by name, not by position, in the route."""
+    client.get_user(7, 42)
+    assert transport.requests[0].url.endswith('/api/v2/accounts/42/users/7')
+    client.delete_user_defined_field(5, 9)
+    assert transport.requests[1].url.endswith('/api/v2/companies/5/userdefinedfields/9')
+
+
+def test_version_header_and_api_version(client, transport):
+    """Test x_avalara_version is sent as a header and ASV methods report no API version."""
+    client.verify_shipment('DEFAULT', 'INV-1', x_avalara_version='3.0')
+    headers = transport.requests[0].headers
+    assert headers['x-avalara-version'] == '3.0'
+    assert 'Python SDK; ;' in headers['X-Avalara-Client']
+    client.ping()
+    assert API_VERSION in transport.requests[1].headers['X-Avalara-Client']
+
+
+@pytest.mark.parametrize('args, kwargs, message', [
+    ((), {}, 'missing required argument'),
+    ((1, 2, 3), {}, 'positional arguments'),
+    ((1,), {'id_': 1}, 'multiple values'),
+    ((1,), {'modle': {}}, 'unexpected keyword'),
+])
+def test_bad_arguments_raise_type_error(client, args, kwargs, message):
+    """Test calls with wrong arguments fail like a regular Python function would."""
+    with pytest.raises(TypeError, match=message):
+        client.get_account(*args, **kwargs)
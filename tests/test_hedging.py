@@ -0,0 +1,125 @@
+"""Test hedged requests for uncommitted quotes."""
+import asyncio
+import itertools
+import statistics
+import threading
+import time
+
+import pytest
+from src.avalara.call import Call
+from src.avalara.hedging import HedgePolicy
+from src.avalara.transport import AsyncMockTransport, MockTransport
+
+
+def slow_then_fast_handler(slow=0.5):
+    """Answer the first attempt after `slow` seconds and later attempts at once."""
+    counter = itertools.count(1)
+    lock = threading.Lock()
+
+    def handler(request):
+        with lock:
+            number = next(counter)
+        if number == 1:
+            time.sleep(slow)
+        return 200, {'attempt': number}
+    return handler
+
+
+def make_call(operation='create_transaction', **model):
+    """Build the Call of a create_transaction quote."""
+    return Call(operation, 'POST', '/api/v2/transactions/create', None, 'transactions', None, model, {})
+
+
+@pytest.fixture
+def policy():
+    """Hedge after 50ms."""
+    policy = HedgePolicy(delay=0.05)
+    yield policy
+    policy.shutdown()
+
+
+def test_slow_quote_is_hedged(make_client, policy):
+    """Test a second attempt is sent and its response used when the first is slow."""
+    transport = MockTransport(slow_then_fast_handler())
+    client = make_client(transport=transport, hedge_policy=policy)
+    start = time.perf_counter()
+    response = client.create_transaction({'type': 'SalesOrder', 'commit': False})
+    assert time.perf_counter() - start < 0.4
+    assert response.json() == {'attempt': 2}
+    assert len(transport.requests) == 2
+
+
+def test_fast_quote_is_not_hedged(make_client, policy):
+    """Test no duplicate is sent when the first attempt answers in time."""
+    transport = MockTransport()
+    client = make_client(transport=transport, hedge_policy=policy)
+    client.create_transaction({'type': 'SalesOrder'})
+    assert len(transport.requests) == 1
+
+
+def test_concurrent_quotes_do_not_queue(make_client):
+    """Test calls beyond the policy's threads are sent at once instead of queueing into spurious hedges."""
+    def handler(request):
+        time.sleep(0.1)
+        return 200, {}
+
+    policy = HedgePolicy(delay=0.15, max_workers=16)
+    client = make_client(handler, hedge_policy=policy)
+    durations = []
+
+    def quote():
+        start = time.perf_counter()
+        client.create_transaction({'type': 'SalesOrder'})
+        durations.append(time.perf_counter() - start)
+
+    threads = [threading.Thread(target=quote) for _ in range(64)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    policy.shutdown()
+    assert len(client.transport.requests) == 64
+    assert statistics.median(durations) < 0.15
+
+
+@pytest.mark.parametrize('model', [
+    {'type': 'SalesInvoice'},
+    {'type': 'SalesOrder', 'commit': True},
+])
+def test_recorded_documents_are_never_hedged(make_client, policy, model):
+    """Test only unrecorded, uncommitted documents are duplicated."""
+    transport = MockTransport(slow_then_fast_handler(0.2))
+    client = make_client(transport=transport, hedge_policy=policy)
+    assert client.create_transaction(model).json() == {'attempt': 1}
+    assert len(transport.requests) == 1
+
+
+def test_should_hedge_checks_operation_and_document(policy):
+    """Test the hedging rules."""
+    assert policy.should_hedge(make_call())
+    assert policy.should_hedge(make_call(type='ReturnOrder'))
+    assert not policy.should_hedge(make_call(type='ReturnInvoice'))
+    assert not policy.should_hedge(make_call('create_or_adjust_transaction', type='SalesOrder'))
+
+
+def test_hedge_delay_follows_latency_percentile():
+    """Test the fixed delay is replaced by the observed percentile."""
+    policy = HedgePolicy(delay=1.0, percentile=90, min_samples=10)
+    assert policy.hedge_delay() == 1.0
+    for latency in range(1, 11):
+        policy.record(latency / 100.0)
+    assert policy.hedge_delay() == 0.1
+
+
+def test_async_client_hedges(make_async_client):
+    """Test the async dispatcher hedges with tasks."""
+
+    async def handler(request):
+        if len(transport.requests) == 1:
+            await asyncio.sleep(0.5)
+        return 200, {'attempt': len(transport.requests)}
+
+    transport = AsyncMockTransport(handler)
+    client = make_async_client(transport=transport, hedge_policy=HedgePolicy(delay=0.05))
+    response = asyncio.run(client.create_transaction({'type': 'SalesOrder'}))
+    assert response.json() == {'attempt': 2}
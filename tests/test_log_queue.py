@@ -0,0 +1,94 @@
+"""Test the non-blocking log pipeline."""
+import logging
+import queue
+import threading
+import time
+
+import pytest
+from src.avalara.log_queue import BLOCK, DROP, SAMPLE, BoundedQueueHandler, QueueLogPipeline
+
+
+class ListHandler(logging.Handler):
+    """Keep the records it handles, optionally taking `delay` seconds per record."""
+
+    def __init__(self, delay=0):
+        super(ListHandler, self).__init__()
+        self.delay = delay
+        self.records = []
+        self.threads = set()
+
+    def emit(self, record):
+        time.sleep(self.delay)
+        self.threads.add(threading.current_thread().name)
+        self.records.append(record)
+
+
+@pytest.fixture
+def logger(logger):
+    """The shared test logger at INFO, not propagating to the test runner's handlers."""
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    return logger
+
+
+def record(level=logging.INFO):
+    """Build a log record."""
+    return logging.LogRecord('test', level, __file__, 1, 'message', None, None)
+
+
+def test_pipeline_moves_handlers_off_the_calling_thread(make_client, logger):
+    """Test a slow handler no longer delays calls, and gets every record once stopped."""
+    sink = ListHandler(delay=0.05)
+    logger.addHandler(sink)
+    client = make_client(logger=logger)
+    with QueueLogPipeline(logger) as pipeline:
+        assert logger.handlers == [pipeline.handler]
+        assert not logger.propagate
+        start = time.perf_counter()
+        for _ in range(5):
+            client.ping()
+        assert time.perf_counter() - start < 0.1
+    assert len(sink.records) == 5
+    assert sink.records[0].status_code == 200
+    assert threading.current_thread().name not in sink.threads
+    assert sink in logger.handlers
+    assert pipeline.handler not in logger.handlers
+    assert pipeline.dropped == 0
+
+
+def test_drop_policy():
+    """Test records that do not fit are dropped and counted."""
+    handler = BoundedQueueHandler(queue.Queue(2), DROP)
+    for _ in range(5):
+        handler.handle(record())
+    assert handler.queue.qsize() == 2
+    assert handler.dropped == 3
+
+
+def test_sample_policy_keeps_errors():
+    """Test 1 in sample_every records is kept once the queue is filling up, errors always."""
+    handler = BoundedQueueHandler(queue.Queue(100), SAMPLE, sample_every=4, sample_above=0.1)
+    for _ in range(10):
+        handler.handle(record())
+    assert handler.queue.qsize() == 10
+    for _ in range(8):
+        handler.handle(record())
+    handler.handle(record(logging.ERROR))
+    assert handler.queue.qsize() == 13
+    assert handler.dropped == 6
+
+
+def test_block_policy_waits_then_drops():
+    """Test the caller waits for room up to block_timeout."""
+    handler = BoundedQueueHandler(queue.Queue(1), BLOCK, block_timeout=0.05)
+    handler.handle(record())
+    start = time.perf_counter()
+    handler.handle(record())
+    assert time.perf_counter() - start >= 0.05
+    assert handler.dropped == 1
+
+
+def test_unknown_overflow_policy():
+    """Test overflow must be one of the known policies."""
+    with pytest.raises(ValueError):
+        BoundedQueueHandler(queue.Queue(1), 'ignore')
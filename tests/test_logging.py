@@ -0,0 +1,91 @@
+"""Test the logging of client calls."""
+import json
+import logging
+
+import pytest
+import requests
+from src.avalara.ava_logger import LOG_FIELDS, AvaLogJsonFormatter
+from src.avalara.client_methods import Mixin
+from src.avalara.retry import RetryPolicy
+
+
+def test_call_is_logged_once(make_client, logger, caplog):
+    """Test a call writes one INFO record with its fields as attributes."""
+    with caplog.at_level(logging.INFO, logger=logger.name):
+        make_client(logger=logger).ping()
+    assert len(caplog.records) == 1
+    record = caplog.records[0]
+    assert record.levelno == logging.INFO
+    assert record.operation == 'ping'
+    assert record.status_code == 200
+    assert record.correlation_id == 'mock'
+    assert record.method == 'GET'
+    assert record.request_url == 'https://sandbox-rest.avatax.com/api/v2/utilities/ping'
+    assert record.execution_time >= 0
+    assert not hasattr(record, 'response_body')
+
+
+def test_retried_call_is_logged_once(make_client, logger, caplog):
+    """Test the entry is written per call, not per attempt."""
+    answers = iter([(503, {}), (200, {})])
+    client = make_client(
+        lambda request: next(answers), logger=logger, retry_policy=RetryPolicy(backoff_factor=0)
+    )
+    with caplog.at_level(logging.INFO, logger=logger.name):
+        client.ping()
+    assert len(caplog.records) == 1
+
+
+def test_failed_call_is_logged_as_error(make_client, logger, caplog):
+    """Test an exception raised by the call is logged at ERROR level and re-raised."""
+    def handler(request):
+        raise requests.ConnectionError('refused')
+
+    with caplog.at_level(logging.INFO, logger=logger.name):
+        with pytest.raises(requests.ConnectionError):
+            make_client(handler, logger=logger).ping()
+    record = caplog.records[0]
+    assert record.levelno == logging.ERROR
+    assert record.error == 'refused'
+    assert record.operation == 'ping'
+    assert record.getMessage() == 'AvaTax call ping failed: refused'
+
+
+def test_methods_are_not_wrapped():
+    """Test logging happens in the dispatcher, not in a wrapper around every method."""
+    assert not hasattr(Mixin.ping, '__wrapped__')
+
+
+def test_disabled_logger_collects_nothing(make_client, logger, monkeypatch):
+    """Test no entry is built, and no body read, when INFO is disabled."""
+    def fail(*args):
+        raise AssertionError('log entry built for a disabled logger')
+
+    monkeypatch.setattr('src.avalara.ava_logger.get_ava_log_entry', fail)
+    logger.setLevel(logging.WARNING)
+    try:
+        assert make_client(logger=logger, is_log_req_resp_allowed=True).ping().status_code == 200
+    finally:
+        logger.setLevel(logging.NOTSET)
+
+
+def test_message_is_formatted_by_the_handler(make_client, logger, caplog):
+    """Test the message is left to the handler to render from its arguments."""
+    with caplog.at_level(logging.INFO, logger=logger.name):
+        make_client(logger=logger, is_log_req_resp_allowed=True).ping()
+    record = caplog.records[0]
+    assert record.msg == 'AvaTax call %s %s %s'
+    assert record.getMessage().endswith('/api/v2/utilities/ping 200')
+    assert record.response_body == '{}'
+
+
+def test_json_formatter(make_client, logger, caplog):
+    """Test AvaLogJsonFormatter writes the fields of a call record as JSON."""
+    with caplog.at_level(logging.INFO, logger=logger.name):
+        make_client(logger=logger).ping()
+    entry = json.loads(AvaLogJsonFormatter().format(caplog.records[0]))
+    assert entry['status_code'] == 200
+    assert entry['correlation_id'] == 'mock'
+    assert set(entry) <= set(LOG_FIELDS)
+    other = logging.LogRecord('other', logging.INFO, __file__, 1, 'hello %s', ('world',), None)
+    assert json.loads(AvaLogJsonFormatter().format(other)) == {'message': 'hello world'}
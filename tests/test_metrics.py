@@ -0,0 +1,65 @@
+"""Test the per client method metrics."""
+import pytest
+import requests
+from src.avalara.metrics import Histogram, MetricsRegistry
+
+
+def test_calls_errors_and_bytes_are_counted(make_client):
+    """Test calls, errors by status and exception, and body sizes per method."""
+    answers = iter([(200, {'id': 1}), (400, {'error': {}}), requests.ConnectionError('refused')])
+
+    def handler(request):
+        answer = next(answers)
+        if isinstance(answer, Exception):
+            raise answer
+        return answer
+
+    client = make_client(handler, metrics=MetricsRegistry())
+    client.create_transaction({'type': 'SalesOrder'})
+    client.create_transaction({'type': 'SalesOrder'})
+    with pytest.raises(requests.ConnectionError):
+        client.ping()
+    snapshot = client.metrics.snapshot()
+    transactions = snapshot['create_transaction']
+    assert transactions['calls'] == 2
+    assert transactions['errors'] == {'400': 1}
+    assert transactions['bytes_sent'] == 2 * len(b'{"type": "SalesOrder"}')
+    assert transactions['bytes_received'] == len(b'{"id": 1}') + len(b'{"error": {}}')
+    assert transactions['latency']['count'] == 2
+    assert snapshot['ping']['errors'] == {'ConnectionError': 1}
+
+
+def test_no_metrics_by_default(make_client):
+    """Test metrics are only kept when a registry is given."""
+    client = make_client()
+    client.ping()
+    assert client.metrics is None
+
+
+def test_histogram_quantiles():
+    """Test percentiles are interpolated inside their bucket."""
+    histogram = Histogram((0.1, 0.2, 0.4, float('inf')))
+    assert histogram.quantile(0.5) is None
+    for value in (0.05, 0.15, 0.15, 0.3):
+        histogram.observe(value)
+    assert histogram.quantile(0.5) == pytest.approx(0.15)
+    assert histogram.quantile(1.0) == pytest.approx(0.4)
+    assert histogram.cumulative() == [(0.1, 1), (0.2, 3), (0.4, 4), (float('inf'), 4)]
+    histogram.observe(100)
+    assert histogram.quantile(1.0) == 0.4
+
+
+def test_prometheus_export():
+    """Test the text exposition format."""
+    registry = MetricsRegistry(buckets=(0.5, float('inf')))
+    registry.record('ping', 0.25)
+    registry.record('ping', 1.0, error=requests.Timeout())
+    text = registry.to_prometheus()
+    assert '# TYPE avatax_call_duration_seconds histogram' in text
+    assert 'avatax_calls_total{operation="ping"} 2' in text
+    assert 'avatax_call_errors_total{operation="ping",error="Timeout"} 1' in text
+    assert 'avatax_call_duration_seconds_bucket{operation="ping",le="0.5"} 1' in text
+    assert 'avatax_call_duration_seconds_bucket{operation="ping",le="+Inf"} 2' in text
+    assert 'avatax_call_duration_seconds_count{operation="ping"} 2' in text
+    registry.reset()
+    assert registry.snapshot() == {}
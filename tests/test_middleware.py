@@ -0,0 +1,84 @@
+"""Test the pre-send and post-receive hooks."""
+import asyncio
+
+import pytest
+from src.avalara.middleware import respond
+from src.avalara.retry import RetryPolicy
+
+
+def test_hooks_see_the_call_in_order(make_client):
+    """Test pre-send hooks run in order with the method name, route template, params and body."""
+    seen = []
+    client = make_client(pre_send_hooks=[
+        lambda call: seen.append(('first', call.operation, call.route, call.params, call.json)),
+        lambda call: seen.append(('second', call.operation)),
+    ])
+    client.list_transactions_by_company('DEFAULT', {'$top': 1})
+    client.create_transaction({'type': 'SalesOrder'})
+    assert seen == [
+        ('first', 'list_transactions_by_company', '/api/v2/companies/{companyCode}/transactions', {'$top': 1},
+         None),
+        ('second', 'list_transactions_by_company'),
+        ('first', 'create_transaction', '/api/v2/transactions/create', None, {'type': 'SalesOrder'}),
+        ('second', 'create_transaction'),
+    ]
+
+
+def test_pre_send_hook_can_short_circuit(make_client):
+    """Test a pre-send hook answering the call skips the later hooks and the transport."""
+    later = []
+    client = make_client(pre_send_hooks=[
+        lambda call: respond(call, 200, {'cached': True}) if call.operation == 'ping' else None,
+        later.append,
+    ])
+    response = client.ping()
+    assert response.json() == {'cached': True}
+    assert response.url == 'https://sandbox-rest.avatax.com/api/v2/utilities/ping'
+    assert later == [] and client.transport.requests == []
+
+
+def test_pre_send_hook_can_add_headers(make_client):
+    """Test headers added by a hook reach the transport for this call only."""
+    client = make_client(pre_send_hooks=[lambda call: call.add_headers({'X-Fault': 'latency'})])
+    client.ping()
+    assert client.transport.requests[0].headers['X-Fault'] == 'latency'
+    assert all('X-Fault' not in headers for headers in client._headers.values())
+
+
+def test_post_receive_hooks_replace_the_response(make_client):
+    """Test post-receive hooks run once per call, after the retries, and can replace the response."""
+    answers = iter([(503, {}), (200, {'id': 1})])
+    statuses = []
+
+    def record_status(call, response):
+        statuses.append(response.status_code)
+        return None
+
+    client = make_client(
+        lambda request: next(answers),
+        retry_policy=RetryPolicy(backoff_factor=0),
+        post_receive_hooks=[record_status, lambda call, response: respond(call, 200, {'id': 2})],
+    )
+    assert client.get_company(1, None).json() == {'id': 2}
+    assert statuses == [200]
+
+
+def test_hooks_run_for_async_client(make_async_client):
+    """Test the async client runs the same hooks."""
+    seen = []
+    client = make_async_client(
+        pre_send_hooks=[lambda call: seen.append(call.operation)],
+        post_receive_hooks=[lambda call, response: respond(call, 204)],
+    )
+    response = asyncio.run(client.ping())
+    assert seen == ['ping'] and response.status_code == 204
+
+
+def test_failing_hook_fails_the_call(make_client):
+    """Test an exception raised by a hook is raised by the call."""
+    def reject(call):
+        raise ValueError('no writes in this test')
+
+    client = make_client(pre_send_hooks=[reject])
+    with pytest.raises(ValueError):
+        client.create_transaction({})
@@ -0,0 +1,69 @@
+"""Test the per-phase timings of the network transports."""
+import logging
+
+import pytest
+from src.avalara.metrics import MetricsRegistry
+from src.avalara.phase_timings import PhaseTimings
+from src.avalara.transport import HttpxTransport, RequestsTransport, Urllib3Transport
+
+
+@pytest.mark.parametrize('transport_class', [RequestsTransport, Urllib3Transport])
+def test_new_then_reused_connection(make_client, local_server, transport_class):
+    """Test DNS and connect are measured on a new connection only."""
+    client = make_client(environment=local_server, transport=transport_class(phase_timings=True))
+    first = client.ping().phase_timings
+    second = client.ping().phase_timings
+    client.close()
+    assert first['dns'] is not None and first['connect'] is not None
+    assert first['tls'] is None
+    assert not first['reused']
+    assert second['dns'] is None and second['connect'] is None
+    assert second['reused']
+    for timings in (first, second):
+        assert timings['ttfb'] >= 0 and timings['transfer'] >= 0
+
+
+def test_httpx_transport(make_client, local_server):
+    """Test the httpx transport reads the phases from the httpcore trace."""
+    pytest.importorskip('httpx')
+    client = make_client(environment=local_server, transport=HttpxTransport(phase_timings=True))
+    timings = client.ping().phase_timings
+    client.close()
+    assert timings['connect'] is not None and timings['dns'] is None
+    assert timings['ttfb'] >= 0 and timings['transfer'] >= 0
+
+
+def test_off_by_default(make_client, local_server):
+    """Test responses carry no timings unless asked for."""
+    client = make_client(environment=local_server, transport=RequestsTransport())
+    assert not hasattr(client.ping(), 'phase_timings')
+    client.close()
+
+
+def test_timings_are_logged_and_recorded(make_client, local_server, logger, caplog):
+    """Test the phases reach the log records and the metrics registry."""
+    client = make_client(
+        environment=local_server, logger=logger,
+        transport=RequestsTransport(phase_timings=True), metrics=MetricsRegistry()
+    )
+    with caplog.at_level(logging.INFO, logger=logger.name):
+        client.ping()
+    client.close()
+    assert caplog.records[-1].phase_timings['connect'] is not None
+    phases = client.metrics.snapshot()['ping']['phases']
+    assert phases['connect']['count'] == 1 and phases['ttfb']['count'] == 1
+    assert 'tls' not in phases
+    assert 'avatax_call_phase_seconds_count{operation="ping",phase="ttfb"} 1' in client.metrics.to_prometheus()
+
+
+def test_trace_events():
+    """Test the httpcore trace events map to phases."""
+    timings = PhaseTimings()
+    for event in ('connection.connect_tcp.started', 'connection.connect_tcp.complete',
+                  'connection.start_tls.started', 'connection.start_tls.complete',
+                  'http11.send_request_body.complete', 'http11.receive_response_headers.complete'):
+        timings.trace(event, {})
+    timings.finish()
+    result = timings.as_dict()
+    assert all(result[phase] is not None for phase in ('connect', 'tls', 'ttfb', 'transfer'))
+    assert result['dns'] is None and not result['reused']
@@ -0,0 +1,128 @@
+"""Test the adaptive rate limiter and endpoint groups."""
+import asyncio
+import threading
+import time
+
+import pytest
+from src.avalara.circuit_breaker import CircuitBreaker
+from src.avalara.endpoint_groups import endpoint_group
+from src.avalara.rate_limit import AdaptiveTokenBucket, RateLimiter
+from src.avalara.timeouts import DeadlineExceeded, TimeoutProfiles
+from src.avalara.transport import MockTransport
+
+
+@pytest.mark.parametrize('path, group', [
+    ('/api/v2/transactions/create', 'transactions'),
+    ('/api/v2/companies/DEFAULT/transactions/ABC/void', 'transactions'),
+    ('/api/v2/addresses/resolve', 'addresses'),
+    ('/api/v2/definitions/taxcodes', 'definitions'),
+    ('/api/v2/companies/transactions/lines/add', 'transactions'),
+    ('/api/v2/reports/12/attachment', 'reports'),
+    ('/api/v2/taxrates/byaddress', 'taxcontent'),
+    ('/api/v2/taxcontent/rates/US', 'taxcontent'),
+    ('/api/v2/utilities/ping', 'default'),
+])
+def test_endpoint_group(path, group):
+    """Test calls are sorted into their endpoint group by path."""
+    assert endpoint_group(path) == group
+
+
+@pytest.mark.parametrize('make', [
+    lambda groups: RateLimiter(groups=groups),
+    lambda groups: CircuitBreaker(groups=groups),
+    lambda groups: TimeoutProfiles(groups=groups),
+])
+def test_unknown_groups_are_rejected(make):
+    """Test per group settings fail loudly for a name no call belongs to, e.g. an endpoints module."""
+    make({'transactions': {}, 'default': {}})
+    with pytest.raises(ValueError, match="'items'"):
+        make({'transactions': {}, 'items': {}})
+
+
+def test_bucket_allows_burst_then_spaces_calls():
+    """Test the bucket hands out its burst, then asks callers to wait."""
+    bucket = AdaptiveTokenBucket(rate=10, burst=2)
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+    assert bucket.reserve() == pytest.approx(0.2, abs=0.01)
+
+
+def test_bucket_is_aimd():
+    """Test 429s halve the rate and successes raise it back additively."""
+    bucket = AdaptiveTokenBucket(rate=8, min_rate=1, increase_step=1)
+    bucket.on_throttled()
+    bucket.on_throttled()
+    assert bucket.rate == 2
+    bucket.on_success()
+    assert bucket.rate == 3
+    for _ in range(10):
+        bucket.on_success()
+    assert bucket.rate == 8
+    for _ in range(10):
+        bucket.on_throttled()
+    assert bucket.rate == 1
+
+
+def test_groups_have_their_own_rates():
+    """Test group settings override the default rate."""
+    limiter = RateLimiter(rate=5, groups={'transactions': 50, 'addresses': {'rate': 20, 'burst': 1}})
+    assert limiter.bucket('transactions').rate == 50
+    assert limiter.bucket('addresses').burst == 1
+    assert limiter.bucket('definitions').rate == 5
+
+
+def test_client_adapts_limiter_to_throttling(make_client):
+    """Test the dispatcher slows a group down when the server answers 429."""
+    transport = MockTransport(lambda request: (429, {}))
+    limiter = RateLimiter(rate=100, groups={'transactions': 100})
+    client = make_client(transport=transport, rate_limiter=limiter)
+    client.create_transaction({})
+    assert limiter.bucket('transactions').rate == 50
+    assert limiter.bucket('addresses').rate == 100
+
+
+def test_calls_rejected_by_the_deadline_give_their_token_back(make_client):
+    """Test calls refused for waiting too long on the limiter do not delay the next ones."""
+    limiter = RateLimiter(rate=10, burst=1)
+    client = make_client(rate_limiter=limiter)
+    client.ping()
+    for _ in range(20):
+        with pytest.raises(DeadlineExceeded):
+            with client.deadline(0.05):
+                client.ping()
+    start = time.perf_counter()
+    client.ping()
+    assert time.perf_counter() - start < 0.3
+    assert len(client.transport.requests) == 2
+
+
+def test_cancelled_wait_gives_the_token_back(make_async_client):
+    """Test an async call cancelled while waiting on the limiter returns its token."""
+    limiter = RateLimiter(rate=1, burst=1)
+    client = make_async_client(rate_limiter=limiter)
+
+    async def scenario():
+        await client.ping()
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(client.ping(), 0.01)
+
+    asyncio.run(scenario())
+    assert limiter.reserve('default') < 1.1
+
+
+def test_limiter_is_shared_across_threads():
+    """Test concurrent callers never take more than the burst at once."""
+    bucket = AdaptiveTokenBucket(rate=1, burst=5)
+    delays = []
+
+    def take():
+        delays.append(bucket.reserve())
+
+    threads = [threading.Thread(target=take) for _ in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sum(1 for delay in delays if delay == 0) == 5
+    assert max(delays) == pytest.approx(15, abs=0.1)
@@ -0,0 +1,124 @@
+"""Test the retry policy and its use by the client dispatcher."""
+import asyncio
+
+import pytest
+import requests
+from src.avalara.retry import RetryPolicy, parse_retry_after
+from src.avalara.transport import AsyncMockTransport
+
+
+def flaky_handler(*statuses):
+    """Answer with the given status codes in turn, then with 200."""
+    remaining = list(statuses)
+
+    def handler(request):
+        if remaining:
+            status = remaining.pop(0)
+            if isinstance(status, Exception):
+                raise status
+            return status, {}, {'Retry-After': '0'}
+        return 200, {}
+    return handler
+
+
+def test_get_is_retried_until_success(make_client):
+    """Test idempotent GETs are retried on 503 and 429."""
+    client = make_client(flaky_handler(503, 429), retry_policy=RetryPolicy(backoff_factor=0))
+    assert client.ping().status_code == 200
+    assert len(client.transport.requests) == 3
+
+
+def test_retries_stop_after_total(make_client):
+    """Test the last failed response is returned once retries run out."""
+    client = make_client(flaky_handler(503, 503, 503), retry_policy=RetryPolicy(backoff_factor=0, total=2))
+    assert client.ping().status_code == 503
+    assert len(client.transport.requests) == 3
+
+
+def test_connection_errors_are_retried(make_client):
+    """Test connection resets on idempotent calls are retried."""
+    client = make_client(
+        flaky_handler(requests.ConnectionError('reset')), retry_policy=RetryPolicy(backoff_factor=0)
+    )
+    assert client.list_countries().status_code == 200
+    assert len(client.transport.requests) == 2
+
+
+def test_resolve_address_post_is_retried(make_client):
+    """Test POST operations known to be idempotent are retried."""
+    client = make_client(flaky_handler(502), retry_policy=RetryPolicy(backoff_factor=0))
+    assert client.resolve_address_post({'line1': '1 Main'}).status_code == 200
+    assert len(client.transport.requests) == 2
+
+
+def test_create_transaction_is_not_retried_by_default(make_client):
+    """Test non-idempotent POSTs are sent once."""
+    client = make_client(flaky_handler(503), retry_policy=RetryPolicy(backoff_factor=0))
+    assert client.create_transaction({'code': 'ABC'}).status_code == 503
+    assert len(client.transport.requests) == 1
+
+
+def test_create_transaction_with_code_is_retried_when_enabled(make_client):
+    """Test POSTs with a transaction code are retried when opted in."""
+    client = make_client(
+        flaky_handler(503, 503), retry_policy=RetryPolicy(backoff_factor=0, retry_with_code=True)
+    )
+    assert client.create_transaction({'code': 'ABC'}).status_code == 200
+    assert client.create_transaction({'lines': []}).status_code == 200
+    assert len(client.transport.requests) == 4
+
+
+def test_client_errors_are_not_retried(make_client):
+    """Test non-transient statuses are returned straight away."""
+    client = make_client(flaky_handler(400), retry_policy=RetryPolicy(backoff_factor=0))
+    assert client.ping().status_code == 400
+    assert len(client.transport.requests) == 1
+
+
+def test_retry_budget_limits_retry_storms(make_client):
+    """Test retries stop once the shared budget is spent."""
+    client = make_client(
+        lambda request: (503, {}),
+        retry_policy=RetryPolicy(backoff_factor=0, total=5, budget_reserve=2, budget_ratio=0)
+    )
+    client.ping()
+    client.ping()
+    assert len(client.transport.requests) == 4
+
+
+def test_long_retry_after_stops_retrying(make_client):
+    """Test a Retry-After beyond max_backoff returns the response."""
+    client = make_client(
+        lambda request: (429, {}, {'Retry-After': '120'}),
+        retry_policy=RetryPolicy(backoff_factor=0, max_backoff=30)
+    )
+    assert client.ping().status_code == 429
+    assert len(client.transport.requests) == 1
+
+
+def test_backoff_uses_full_jitter():
+    """Test the delay is drawn between zero and the exponential cap."""
+    policy = RetryPolicy(backoff_factor=1, max_backoff=4)
+    response = requests.Response()
+    response.status_code = 503
+    delays = [policy.next_delay(2, response=response) for _ in range(5)]
+    assert all(0 <= delay <= 4 for delay in delays)
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('3', 3.0),
+    ('Wed, 21 Oct 2015 07:28:00 GMT', 0.0),
+    ('soon', None),
+    (None, None),
+])
+def test_parse_retry_after(value, expected):
+    """Test Retry-After accepts seconds and HTTP dates."""
+    assert parse_retry_after(value) == expected
+
+
+def test_async_client_retries(make_async_client):
+    """Test the async dispatcher applies the same policy."""
+    transport = AsyncMockTransport(flaky_handler(503))
+    client = make_async_client(transport=transport, retry_policy=RetryPolicy(backoff_factor=0))
+    assert asyncio.run(client.ping()).status_code == 200
+    assert len(transport.requests) == 2
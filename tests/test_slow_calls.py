@@ -0,0 +1,88 @@
+"""Test the capture of slow and failed calls."""
+import json
+import logging
+
+import pytest
+import requests
+from src.avalara.body_logging import ADDRESS_FIELDS, REDACTED, BodyLogPolicy
+from src.avalara.slow_calls import SlowCallRecorder
+
+
+def test_fast_successful_calls_are_not_captured(make_client):
+    """Test calls under the threshold that succeeded are skipped."""
+    client = make_client(slow_call_recorder=SlowCallRecorder(threshold=60))
+    client.create_transaction({'type': 'SalesOrder'})
+    assert len(client.slow_call_recorder) == 0
+
+
+def test_slow_call_is_captured_in_full(make_client):
+    """Test a slow call keeps its bodies, response headers and correlation id."""
+    client = make_client(
+        lambda request: (200, {'id': 1}, {'x-correlation-id': 'abc', 'ServerDuration': '00:00:01'}),
+        slow_call_recorder=SlowCallRecorder(threshold=0)
+    )
+    client.create_transaction({'type': 'SalesOrder'})
+    capture, = client.slow_call_recorder.captures()
+    assert capture['operation'] == 'create_transaction'
+    assert capture['route'] == '/api/v2/transactions/create'
+    assert capture['correlation_id'] == 'abc'
+    assert capture['response_headers']['ServerDuration'] == '00:00:01'
+    assert json.loads(capture['request_body']) == {'type': 'SalesOrder'}
+    assert json.loads(capture['response_body']) == {'id': 1}
+    assert capture['execution_time'] >= 0
+
+
+def test_failed_calls_are_captured(make_client):
+    """Test error statuses and exceptions are captured whatever their duration."""
+    answers = iter([(500, {'error': {}}), requests.ConnectionError('refused')])
+
+    def handler(request):
+        answer = next(answers)
+        if isinstance(answer, Exception):
+            raise answer
+        return answer
+
+    client = make_client(handler, slow_call_recorder=SlowCallRecorder(threshold=60))
+    client.create_transaction({'type': 'SalesOrder'})
+    with pytest.raises(requests.ConnectionError):
+        client.create_transaction({'type': 'SalesOrder'})
+    status, raised = client.slow_call_recorder.captures()
+    assert status['status_code'] == 500
+    assert raised['error'] == 'ConnectionError: refused'
+    assert json.loads(raised['request_body']) == {'type': 'SalesOrder'}
+
+
+def test_ring_buffer_keeps_the_newest(make_client):
+    """Test the oldest captures are dropped at capacity."""
+    client = make_client(slow_call_recorder=SlowCallRecorder(threshold=0, capacity=2))
+    for code in ('A', 'B', 'C'):
+        client.get_company(code, None)
+    captures = client.slow_call_recorder.captures()
+    assert [c['request_url'].rsplit('/', 1)[-1] for c in captures] == ['B', 'C']
+    assert client.slow_call_recorder.dropped == 1
+
+
+def test_flush_logs_and_empties(make_client, logger, caplog):
+    """Test flush returns the captures, logs them and clears the buffer."""
+    client = make_client(
+        slow_call_recorder=SlowCallRecorder(threshold=0, body_log_policy=BodyLogPolicy(max_bytes=4))
+    )
+    client.create_transaction({'type': 'SalesOrder'})
+    with caplog.at_level(logging.WARNING, logger=logger.name):
+        captures = client.slow_call_recorder.flush(logger)
+    assert len(captures) == 1 and len(client.slow_call_recorder) == 0
+    record, = caplog.records
+    assert record.operation == 'create_transaction'
+    assert record.request_body.startswith('{"ty... [truncated')
+
+
+def test_query_parameters_are_redacted(make_client):
+    """Test the policy's redact_fields also apply to the query string of the captured url."""
+    client = make_client(slow_call_recorder=SlowCallRecorder(
+        threshold=0, body_log_policy=BodyLogPolicy(redact_fields=ADDRESS_FIELDS)
+    ))
+    client.resolve_address({'line1': '100 Ravine Lane', 'region': 'WA', 'postalCode': '98110'})
+    capture, = client.slow_call_recorder.captures()
+    assert capture['request_url'].endswith(
+        '/addresses/resolve?line1={0}&region=WA&postalCode={0}'.format(REDACTED)
+    )
@@ -0,0 +1,116 @@
+"""Test timeout profiles and deadlines."""
+import time
+
+import pytest
+from src.avalara.retry import RetryPolicy
+from src.avalara.timeouts import DeadlineExceeded, TimeoutProfile, TimeoutProfiles, cap_timeout, deadline
+from src.avalara.transport import MockTransport
+
+
+class RecordingTransport(MockTransport):
+    """In-memory transport that also records the timeout of each attempt."""
+
+    def __init__(self, handler=None):
+        super(RecordingTransport, self).__init__(handler)
+        self.timeouts = []
+
+    def send(self, method, url, params=None, json=None, headers=None, auth=None, timeout=None):
+        self.timeouts.append(timeout)
+        return super(RecordingTransport, self).send(method, url, params, json, headers, auth, timeout)
+
+
+@pytest.fixture
+def profiles():
+    """Tight profile for real-time groups, a long one for reports."""
+    return TimeoutProfiles(
+        default=TimeoutProfile(connect=3, read=30),
+        groups={
+            'transactions': TimeoutProfile(connect=1, read=5),
+            'addresses': TimeoutProfile(connect=1, read=2),
+        },
+        operations={'download_report': TimeoutProfile(connect=3, read=600)},
+    )
+
+
+def test_legacy_timeout_limit_is_kept(make_client):
+    """Test the single timeout and its 1200 second fallback still apply without profiles."""
+    transport = RecordingTransport()
+    make_client(transport=transport).ping()
+    make_client(transport=transport, timeout_limit=(2, 10)).ping()
+    assert transport.timeouts == [1200, (2, 10)]
+
+
+def test_profiles_are_picked_by_operation_then_group(profiles, make_client):
+    """Test method profiles win over group profiles, which win over the default."""
+    transport = RecordingTransport()
+    client = make_client(transport=transport, timeout_profiles=profiles)
+    client.create_transaction({})
+    client.resolve_address_post({})
+    client.download_report(1)
+    client.ping()
+    assert transport.timeouts == [(1, 5), (1, 2), (3, 600), (3, 30)]
+
+
+def test_unset_profile_fields_fall_back_to_timeout_limit(make_client):
+    """Test a profile may set only some of the timeouts."""
+    transport = RecordingTransport()
+    client = make_client(
+        transport=transport, timeout_limit=20,
+        timeout_profiles=TimeoutProfiles(default=TimeoutProfile(connect=1))
+    )
+    client.ping()
+    assert transport.timeouts == [(1, 20)]
+
+
+def test_deadline_caps_attempt_timeouts(make_client):
+    """Test the remaining time bounds the timeout of each attempt."""
+    transport = RecordingTransport()
+    client = make_client(transport=transport, timeout_limit=(5, 30))
+    with client.deadline(0.5):
+        client.ping()
+    connect, read = transport.timeouts[0]
+    assert 0 < connect <= 0.5 and 0 < read <= 0.5
+
+
+def test_deadline_carries_through_retries(make_client):
+    """Test retries stop once the next backoff would overrun the deadline."""
+    transport = RecordingTransport(lambda request: (503, {}, {'Retry-After': '0.2'}))
+    client = make_client(transport=transport, retry_policy=RetryPolicy(total=10))
+    start = time.monotonic()
+    with client.deadline(0.5):
+        assert client.ping().status_code == 503
+    assert time.monotonic() - start < 0.5
+    assert len(transport.requests) == 3
+
+
+def test_expired_deadline_raises(make_client):
+    """Test a call is not sent once its deadline has passed."""
+    transport = RecordingTransport()
+    client = make_client(transport=transport)
+    with deadline(0):
+        with pytest.raises(DeadlineExceeded):
+            client.ping()
+    assert transport.requests == []
+
+
+def test_profile_deadline_and_nested_deadlines(make_client):
+    """Test the earliest of the profile and block deadlines wins."""
+    transport = RecordingTransport()
+    client = make_client(
+        transport=transport, timeout_limit=60,
+        timeout_profiles=TimeoutProfiles(default=TimeoutProfile(deadline=10))
+    )
+    with deadline(30), deadline(2):
+        client.ping()
+    assert max(transport.timeouts[0]) <= 2
+
+
+@pytest.mark.parametrize('timeout, remaining, expected', [
+    (10, 2, 2),
+    ((1, 10), 2, (1, 2)),
+    (None, 2, 2),
+    ((None, 10), 2, (2, 2)),
+])
+def test_cap_timeout(timeout, remaining, expected):
+    """Test timeouts are shortened to the remaining time."""
+    assert cap_timeout(timeout, remaining) == expected
@@ -0,0 +1,95 @@
+"""Test the tracing hooks."""
+import pytest
+import requests
+from src.avalara.tracing import Tracer
+
+
+class RecordingTracer(Tracer):
+    """Tracer keeping its spans as dicts, propagating a fixed traceparent."""
+
+    def __init__(self):
+        self.spans = []
+
+    def start_span(self, call):
+        span = {'name': call.operation, 'method': call.method, 'route': call.route, 'ended': False}
+        self.spans.append(span)
+        return span
+
+    def inject(self, span, headers):
+        headers['traceparent'] = '00-{:032x}-{:016x}-01'.format(1, len(self.spans))
+
+    def end_span(self, span, response=None, error=None):
+        span['ended'] = True
+        span['error'] = error
+        if response is not None:
+            span['status'] = response.status_code
+            span['correlation_id'] = response.headers.get('x-correlation-id')
+
+
+def test_span_per_call(make_client):
+    """Test each call gets a span named after its method, with the route template and the status."""
+    tracer = RecordingTracer()
+    client = make_client(lambda request: (200, {}, {'x-correlation-id': 'abc'}), tracer=tracer)
+    client.get_transaction_by_code('DEFAULT', 'INV-42', None)
+    assert tracer.spans == [{
+        'name': 'get_transaction_by_code', 'method': 'GET',
+        'route': '/api/v2/companies/{companyCode}/transactions/{transactionCode}',
+        'ended': True, 'error': None, 'status': 200, 'correlation_id': 'abc',
+    }]
+
+
+def test_trace_context_is_sent(make_client):
+    """Test the injected headers reach the transport without leaking into the client headers."""
+    client = make_client(tracer=RecordingTracer())
+    client.ping()
+    assert client.transport.requests[-1].headers['traceparent'].endswith('-0000000000000001-01')
+    assert 'traceparent' not in client._headers[''] and all(
+        'traceparent' not in headers for headers in client._headers.values()
+    )
+
+
+def test_failed_call_ends_span(make_client):
+    """Test a call raising still ends its span, with the error."""
+    tracer = RecordingTracer()
+
+    def refuse(request):
+        raise requests.ConnectionError('refused')
+
+    client = make_client(refuse, tracer=tracer)
+    with pytest.raises(requests.ConnectionError):
+        client.ping()
+    assert tracer.spans[0]['ended'] and isinstance(tracer.spans[0]['error'], requests.ConnectionError)
+
+
+def test_no_tracer_by_default(make_client):
+    """Test calls carry no trace headers unless a tracer is given."""
+    client = make_client()
+    client.ping()
+    assert client.tracer is None
+    assert 'traceparent' not in client.transport.requests[-1].headers
+
+
+def test_opentelemetry_tracer(make_client):
+    """Test the OpenTelemetry adapter reports client spans and injects traceparent."""
+    pytest.importorskip('opentelemetry.sdk')
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+    from src.avalara.tracing import OpenTelemetryTracer
+
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    client = make_client(
+        lambda request: (404, {}, {'x-correlation-id': 'abc'}),
+        tracer=OpenTelemetryTracer(provider.get_tracer('test'))
+    )
+    client.get_company(123, None)
+    span, = exporter.get_finished_spans()
+    assert span.name == 'get_company'
+    assert span.attributes['url.template'] == '/api/v2/companies/{id_}'
+    assert span.attributes['http.response.status_code'] == 404
+    assert span.attributes['avalara.correlation_id'] == 'abc'
+    assert client.transport.requests[-1].headers['traceparent'].split('-')[1] == format(
+        span.context.trace_id, '032x'
+    )
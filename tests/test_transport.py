@@ -0,0 +1,89 @@
+"""Test the request dispatcher and the pluggable transports."""
+import json
+
+import pytest
+import requests
+from src.avalara.transport import MockTransport, RequestsTransport, Urllib3Transport
+
+
+@pytest.fixture
+def mock_transport():
+    """Create an in-memory transport answering every call with an empty object."""
+    return MockTransport()
+
+
+@pytest.fixture
+def mock_client(make_client, mock_transport):
+    """Create a client sending through the in-memory transport."""
+    return make_client(transport=mock_transport)
+
+
+
+def test_default_transport_is_pooled_session(unauth_client):
+    """Test the client falls back to the requests session transport."""
+    assert isinstance(unauth_client.transport, RequestsTransport)
+    assert unauth_client.session is unauth_client.transport.session
+
+
+def test_get_is_dispatched_through_transport(mock_client, mock_transport):
+    """Test a generated GET method builds its url and query string."""
+    response = mock_client.get_account(123, {'$include': 'Users'})
+    assert isinstance(response, requests.Response)
+    assert response.status_code == 200
+    request = mock_transport.requests[-1]
+    assert request.method == 'GET'
+    assert request.url == 'https://sandbox-rest.avatax.com/api/v2/accounts/123?%24include=Users'
+
+
+def test_post_body_is_sent_as_json(mock_client, mock_transport):
+    """Test a generated POST method sends its model as a JSON body."""
+    mock_client.create_transaction({'code': 'ABC'})
+    request = mock_transport.requests[-1]
+    assert request.method == 'POST'
+    assert json.loads(request.body) == {'code': 'ABC'}
+
+
+def test_client_header_carries_api_version(mock_client, mock_transport):
+    """Test the X-Avalara-Client header reports the generated API version."""
+    mock_client.ping()
+    header = mock_transport.requests[-1].headers['X-Avalara-Client']
+    assert header == 'test app; ver 0.0; Python SDK; 26.7.3; test machine;'
+
+
+def test_version_header_is_sent_when_given(mock_client, mock_transport):
+    """Test ASV methods pass the x-avalara-version header through."""
+    mock_client.register_shipment('DEFAULT', 'ABC', x_avalara_version='2.0')
+    assert mock_transport.requests[-1].headers['x-avalara-version'] == '2.0'
+
+
+def test_version_header_does_not_leak_into_later_calls(mock_client, mock_transport):
+    """Test per-call headers leave the shared client headers untouched."""
+    mock_client.register_shipment('DEFAULT', 'ABC', x_avalara_version='2.0')
+    mock_client.ping()
+    assert 'x-avalara-version' not in mock_transport.requests[-1].headers
+    assert mock_client.client_header == {'X-Avalara-Client': mock_client.client_id}
+
+
+def test_bearer_token_is_sent_after_add_credentials(mock_client, mock_transport):
+    """Test the prebuilt headers are refreshed when credentials are added."""
+    mock_client.add_credentials('token')
+    mock_client.ping()
+    assert mock_transport.requests[-1].headers['Authorization'] == 'Bearer token'
+
+
+def test_mock_transport_handler_controls_response(mock_transport, mock_client):
+    """Test the in-memory transport returns what the handler produces."""
+    mock_transport.handler = lambda request: (404, {'error': 'missing'})
+    response = mock_client.ping()
+    assert response.status_code == 404
+    assert response.json() == {'error': 'missing'}
+
+
+@pytest.mark.parametrize('transport_class', [RequestsTransport, Urllib3Transport])
+def test_network_transports_return_responses(make_client, local_server, transport_class):
+    """Test the network transports talk to a real server."""
+    client = make_client(environment=local_server, transport=transport_class())
+    response = client.ping()
+    assert response.status_code == 200
+    assert response.json() == {'path': '/api/v2/utilities/ping'}
+    client.close()